@@ -2,7 +2,7 @@
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 from typing import List, Optional
 from datetime import datetime
 from contextlib import asynccontextmanager
@@ -26,6 +26,7 @@ from auth.repository_v2 import user_repository
 from payment_routes import router as payment_router
 from scout_routes import router as scout_router
 from scheduler import get_scheduler
+from sourcers.playwright_scraper import get_shared_scraper, close_shared_scraper
 
 # Global scheduler task
 scheduler_task = None
@@ -43,17 +44,29 @@ async def lifespan(app: FastAPI):
     scheduler_task = asyncio.create_task(scheduler.run())
     print(f"✅ Background scheduler started")
     
-    yield
-    
-    # Shutdown
-    if scheduler_task:
-        scheduler.stop()
-        scheduler_task.cancel()
+    try:
+        # Warm up the shared Playwright browser so the first scrape doesn't pay
+        # the launch (only when an enabled source actually uses Playwright)
         try:
-            await scheduler_task
-        except asyncio.CancelledError:
-            pass
-    print(f"✅ Scheduler stopped")
+            if scheduler.has_playwright_sources():
+                await get_shared_scraper(pool_size=scheduler.playwright_pool_size)
+                print(f"✅ Playwright browser warmed up")
+        except Exception as e:
+            print(f"⚠️ Playwright warm-up skipped: {e}")
+        
+        yield
+    
+    finally:
+        # Shutdown (also when startup was interrupted)
+        if scheduler_task:
+            await scheduler.stop()
+            scheduler_task.cancel()
+            try:
+                await scheduler_task
+            except asyncio.CancelledError:
+                pass
+        print(f"✅ Scheduler stopped")
+        await close_shared_scraper()
 
 app = FastAPI(
     title="Perceptron API",
@@ -449,6 +462,7 @@ async def scrape_blog(request: BlogScrapeRequest):
             )
             source_id = source.id
             config_repo.close()
+            get_scheduler().wake()
         
         return {
             "message": "Blog scraped successfully",
@@ -515,6 +529,7 @@ async def scrape_generic(request: GenericScrapeRequest):
             )
             source_id = source.id
             config_repo.close()
+            get_scheduler().wake()
         
         return {
             "message": "Website scraped successfully",
@@ -583,6 +598,8 @@ async def setup_blog_sources():
                     })
         
         repo.close()
+        if added:
+            get_scheduler().wake()
         
         return {
             "message": "Blog sources setup complete",
@@ -682,7 +699,7 @@ async def stop_scheduler():
     if not scheduler.is_running():
         return {"message": "Scheduler is not running", "status": "stopped"}
     
-    scheduler.stop()
+    await scheduler.stop()
     if scheduler_task:
         scheduler_task.cancel()
         try:
@@ -826,6 +843,7 @@ async def fetch_and_store_rss(request: FetchAndStoreRequest):
             )
             source_id = source.id
             config_repo.close()
+            get_scheduler().wake()
         
         return {
             "message": "Content fetched and stored successfully",
@@ -965,6 +983,84 @@ async def get_teams():
         raise HTTPException(status_code=500, detail=f"Failed to get teams: {str(e)}")
 
 
+def _validate_date(date_str: str):
+    """Raise a 400 unless date_str is YYYY-MM-DD."""
+    from datetime import datetime
+    try:
+        datetime.strptime(date_str, '%Y-%m-%d')
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+
+def _query_keywords(cur, date: str, team: Optional[str], limit: int, min_score: float) -> dict:
+    """Run the /api/keywords query for one date/team on an open keywords DB cursor."""
+    # Build query
+    sql = """
+        SELECT 
+            keyword,
+            team_key,
+            importance_score,
+            sentiment_score,
+            sentiment_magnitude,
+            frequency,
+            document_count,
+            source_diversity,
+            velocity,
+            positive_mentions,
+            negative_mentions,
+            neutral_mentions,
+            content_ids,
+            sample_snippets
+        FROM keyword_importance
+        WHERE date = ?
+          AND importance_score >= ?
+    """
+    params = [date, min_score]
+    
+    if team:
+        sql += " AND team_key = ?"
+        params.append(team)
+    
+    sql += " ORDER BY importance_score DESC LIMIT ?"
+    params.append(limit)
+    
+    cur.execute(sql, params)
+    
+    keywords = []
+    for row in cur.fetchall():
+        # Parse JSON fields
+        content_ids = json.loads(row['content_ids']) if row['content_ids'] else []
+        snippets_raw = json.loads(row['sample_snippets']) if row['sample_snippets'] else []
+        
+        keywords.append({
+            "keyword": row['keyword'],
+            "team_key": row['team_key'],
+            "importance_score": round(row['importance_score'], 2),
+            "sentiment": {
+                "score": round(row['sentiment_score'], 3),
+                "magnitude": round(row['sentiment_magnitude'], 3),
+                "positive": row['positive_mentions'],
+                "negative": row['negative_mentions'],
+                "neutral": row['neutral_mentions']
+            },
+            "metrics": {
+                "frequency": row['frequency'],
+                "document_count": row['document_count'],
+                "source_diversity": row['source_diversity'],
+                "velocity": round(row['velocity'], 2) if row['velocity'] else 0.0
+            },
+            "content_ids": content_ids,
+            "sample_snippets": snippets_raw[:3]  # Max 3 snippets
+        })
+    
+    return {
+        "date": date,
+        "team": team or "all",
+        "keywords": keywords,
+        "count": len(keywords)
+    }
+
+
 @app.get("/api/keywords")
 async def get_keywords(
     date: str,
@@ -982,84 +1078,60 @@ async def get_keywords(
     - min_score: minimum importance score (optional, default: 0)
     """
     try:
-        # Validate date format
-        from datetime import datetime
-        try:
-            datetime.strptime(date, '%Y-%m-%d')
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+        _validate_date(date)
         
-        # Query database
         conn = get_keywords_db()
-        cur = conn.cursor()
-        
-        # Build query
-        sql = """
-            SELECT 
-                keyword,
-                team_key,
-                importance_score,
-                sentiment_score,
-                sentiment_magnitude,
-                frequency,
-                document_count,
-                source_diversity,
-                velocity,
-                positive_mentions,
-                negative_mentions,
-                neutral_mentions,
-                content_ids,
-                sample_snippets
-            FROM keyword_importance
-            WHERE date = ?
-              AND importance_score >= ?
-        """
-        params = [date, min_score]
-        
-        if team:
-            sql += " AND team_key = ?"
-            params.append(team)
-        
-        sql += " ORDER BY importance_score DESC LIMIT ?"
-        params.append(limit)
-        
-        cur.execute(sql, params)
-        
-        keywords = []
-        for row in cur.fetchall():
-            # Parse JSON fields
-            content_ids = json.loads(row['content_ids']) if row['content_ids'] else []
-            snippets_raw = json.loads(row['sample_snippets']) if row['sample_snippets'] else []
-            
-            keywords.append({
-                "keyword": row['keyword'],
-                "team_key": row['team_key'],
-                "importance_score": round(row['importance_score'], 2),
-                "sentiment": {
-                    "score": round(row['sentiment_score'], 3),
-                    "magnitude": round(row['sentiment_magnitude'], 3),
-                    "positive": row['positive_mentions'],
-                    "negative": row['negative_mentions'],
-                    "neutral": row['neutral_mentions']
-                },
-                "metrics": {
-                    "frequency": row['frequency'],
-                    "document_count": row['document_count'],
-                    "source_diversity": row['source_diversity'],
-                    "velocity": round(row['velocity'], 2) if row['velocity'] else 0.0
-                },
-                "content_ids": content_ids,
-                "sample_snippets": snippets_raw[:3]  # Max 3 snippets
-            })
+        try:
+            return _query_keywords(conn.cursor(), date, team, limit, min_score)
+        finally:
+            conn.close()
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get keywords: {str(e)}")
+
+
+class KeywordQuery(BaseModel):
+    """One date/team pair in a batch keyword request."""
+    date: str
+    team: Optional[str] = None
+
+
+# Each query is a separate lookup, so one batch request is capped (a month of days)
+KEYWORD_BATCH_MAX_QUERIES = 31
+
+
+class KeywordBatchRequest(BaseModel):
+    """Request model for fetching keywords for several dates/teams at once."""
+    queries: List[KeywordQuery] = Field(max_length=KEYWORD_BATCH_MAX_QUERIES)
+    limit: int = 50
+    min_score: float = 0
+
+
+@app.post("/api/keywords/batch")
+async def get_keywords_batch(request: KeywordBatchRequest):
+    """
+    Get keywords for several date/team pairs in one request.
+    
+    Each result has the same shape as a GET /api/keywords response, in
+    the order the queries were given. All queries share one database
+    connection.
+    """
+    try:
+        for query in request.queries:
+            _validate_date(query.date)
         
-        conn.close()
+        conn = get_keywords_db()
+        try:
+            cur = conn.cursor()
+            results = [
+                _query_keywords(cur, query.date, query.team, request.limit, request.min_score)
+                for query in request.queries
+            ]
+        finally:
+            conn.close()
         
-        return {
-            "date": date,
-            "team": team or "all",
-            "keywords": keywords,
-            "count": len(keywords)
-        }
+        return {"results": results, "count": len(results)}
     except HTTPException:
         raise
     except Exception as e:
@@ -8,7 +8,9 @@ Complete NLP pipeline:
 4. Store structured data for frontend
 """
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from typing import Optional, List, Dict
 from collections import defaultdict
@@ -19,11 +21,26 @@ from .repository import KeywordRepository, KeywordConfigRepository
 from .importance import ImportanceCalculator
 from .sentiment import SentimentAnalyzer
 from .importance_repository import ImportanceRepository
+from .processor import MIN_CONTENT_LENGTH
 from storage.repository import ContentRepository
 
 
 logger = logging.getLogger(__name__)
 
+# Documents extracted at a time by process_batch; each chunk is stored while
+# the next one is extracted
+EXTRACT_CHUNK_SIZE = 64
+
+
+def _new_cache_entry() -> Dict:
+    """Empty keyword_cache entry."""
+    return {
+        'frequency': 0,
+        'documents': [],
+        'snippets': [],
+        'content_ids': [],
+    }
+
 
 class EnhancedKeywordProcessor:
     """
@@ -71,12 +88,15 @@ class EnhancedKeywordProcessor:
         self.team_key = team_key
         
         # Cache for batch processing
-        self.keyword_cache = defaultdict(lambda: {
-            'frequency': 0,
-            'documents': [],
-            'snippets': [],
-            'content_ids': [],
-        })
+        self.keyword_cache = defaultdict(_new_cache_entry)
+        
+        # process_batch stores one chunk on a writer thread while extracting
+        # the next; the extractor (spaCy) is used by one thread at a time
+        self._extractor_lock = threading.Lock()
+    
+    def reset_cache(self):
+        """Empty the keyword cache in place (e.g. between teams)."""
+        self.keyword_cache.clear()
     
     def process_content(
         self,
@@ -88,6 +108,7 @@ class EnhancedKeywordProcessor:
         published_date: Optional[date] = None,
         extraction_date: Optional[date] = None,
         team_key: Optional[str] = None,
+        keywords: Optional[List[Dict]] = None,
     ) -> Dict:
         """
         Process a single piece of content through full NLP pipeline.
@@ -101,6 +122,7 @@ class EnhancedKeywordProcessor:
             published_date: When content was published
             extraction_date: Date for keyword association
             team_key: Team context (overrides instance team_key)
+            keywords: Already extracted keywords (skips extraction, used by process_batch)
         
         Returns:
             Processing results with statistics
@@ -108,18 +130,30 @@ class EnhancedKeywordProcessor:
         start_time = time.time()
         team = team_key or self.team_key
         
+        if len(content or '') < MIN_CONTENT_LENGTH:
+            logger.info(f"Skipped content {content_id}: too short ({len(content or '')} chars)")
+            return {
+                'status': 'skipped',
+                'content_id': content_id,
+                'keywords_extracted': 0,
+                'keywords_stored': 0,
+                'processing_time_ms': 0.0,
+            }
+        
         if extraction_date is None:
             extraction_date = date.today()
         
         try:
             # Step 1: Extract keywords
-            logger.info(f"Extracting keywords from content {content_id}: {title[:50]}...")
-            
-            keywords = self.extractor.extract(
-                text=content,
-                title=title,
-                max_keywords=100,
-            )
+            if keywords is None:
+                logger.info(f"Extracting keywords from content {content_id}: {title[:50]}...")
+                
+                with self._extractor_lock:
+                    keywords = self.extractor.extract(
+                        text=content,
+                        title=title,
+                        max_keywords=100,
+                    )
             
             keywords_extracted = len(keywords)
             logger.info(f"Extracted {keywords_extracted} keywords")
@@ -138,6 +172,14 @@ class EnhancedKeywordProcessor:
             for kw_data in keywords:
                 kw = kw_data['keyword']
                 score = kw_data['relevance_score']
+                
+                # Extract snippets containing keyword
+                snippets = self.sentiment_analyzer.extract_keyword_context(
+                    content + ' ' + title,
+                    kw,
+                    window=100
+                )
+                
                 self.keyword_cache[kw]['frequency'] += 1
                 self.keyword_cache[kw]['documents'].append({
                     'content_id': content_id,
@@ -145,15 +187,10 @@ class EnhancedKeywordProcessor:
                     'content': content,
                     'source_name': source_name,
                     'published_date': published_date,
+                    'extraction_date': extraction_date,
+                    'snippets': snippets,
                 })
                 self.keyword_cache[kw]['content_ids'].append(content_id)
-                
-                # Extract snippets containing keyword
-                snippets = self.sentiment_analyzer.extract_keyword_context(
-                    content + ' ' + title,
-                    kw,
-                    window=100
-                )
                 self.keyword_cache[kw]['snippets'].extend(snippets)
             
             processing_time_ms = (time.time() - start_time) * 1000
@@ -189,6 +226,7 @@ class EnhancedKeywordProcessor:
         analysis_date: Optional[date] = None,
         team_key: Optional[str] = None,
         min_frequency: int = 1,  # Changed from 2 to capture single-occurrence important keywords
+        keyword_embeddings: Optional[Dict] = None,
     ) -> Dict:
         """
         Calculate importance and sentiment for cached keywords.
@@ -199,6 +237,7 @@ class EnhancedKeywordProcessor:
             analysis_date: Date to associate with analysis
             team_key: Team context
             min_frequency: Minimum frequency to process
+            keyword_embeddings: Precomputed embeddings by keyword (encoded here if not given)
         
         Returns:
             Statistics about importance calculation
@@ -217,9 +256,10 @@ class EnhancedKeywordProcessor:
             if data['frequency'] >= min_frequency
         ]
         
-        logger.info(f"Batch encoding {len(keywords_to_process)} keywords...")
-        keyword_embeddings = self.importance_calc.batch_encode_keywords(keywords_to_process)
-        logger.info(f"Batch encoding complete")
+        if keyword_embeddings is None:
+            logger.info(f"Batch encoding {len(keywords_to_process)} keywords...")
+            keyword_embeddings = self.importance_calc.batch_encode_keywords(keywords_to_process)
+            logger.info(f"Batch encoding complete")
         
         # Get data lake statistics once (shared across all keywords)
         try:
@@ -233,6 +273,7 @@ class EnhancedKeywordProcessor:
         
         keywords_processed = 0
         keywords_saved = 0
+        importance_records = []
         
         # Prepare all keyword data for batch processing
         keyword_batch_data = []
@@ -328,28 +369,23 @@ class EnhancedKeywordProcessor:
                                 'classification': snippet_data['classification'],
                             })
                         
-                        # Save to importance table
-                        self.importance_repo.save_importance(
-                            keyword=keyword,
-                            analysis_date=analysis_date,
-                            team_key=team,
-                            importance_score=importance_result['importance'],
-                            frequency=data['frequency'],
-                            document_count=len(data['documents']),
-                            source_diversity=len(set(doc['source_name'] for doc in data['documents'])),
-                            velocity=importance_result['velocity'],
-                            acceleration=importance_result['acceleration'],
-                            sentiment_score=sentiment_result['sentiment_score'],
-                            sentiment_magnitude=sentiment_result['sentiment_magnitude'],
-                            positive_mentions=sentiment_result['positive_mentions'],
-                            negative_mentions=sentiment_result['negative_mentions'],
-                            neutral_mentions=sentiment_result['neutral_mentions'],
-                            content_ids=data['content_ids'],
-                            sample_snippets=sample_snippets,
-                            extraction_method='enhanced_nlp',
-                        )
-                        
-                        keywords_saved += 1
+                        # Collected here, saved to the importance table in one batch
+                        importance_records.append({
+                            'keyword': keyword,
+                            'importance_score': importance_result['importance'],
+                            'frequency': data['frequency'],
+                            'document_count': len(data['documents']),
+                            'source_diversity': len(set(doc['source_name'] for doc in data['documents'])),
+                            'velocity': importance_result['velocity'],
+                            'acceleration': importance_result['acceleration'],
+                            'sentiment_score': sentiment_result['sentiment_score'],
+                            'sentiment_magnitude': sentiment_result['sentiment_magnitude'],
+                            'positive_mentions': sentiment_result['positive_mentions'],
+                            'negative_mentions': sentiment_result['negative_mentions'],
+                            'neutral_mentions': sentiment_result['neutral_mentions'],
+                            'content_ids': data['content_ids'],
+                            'sample_snippets': sample_snippets,
+                        })
                         
                         # Log progress every 100 keywords
                         if idx % 100 == 0:
@@ -359,8 +395,19 @@ class EnhancedKeywordProcessor:
                 
                 keywords_processed = len(keyword_batch_data)
             
-            # Clear cache after processing
-            self.keyword_cache.clear()
+            # One transaction for every record of this date; if it fails, fall
+            # back to saving each record on its own so one bad write doesn't
+            # discard the whole date
+            try:
+                keywords_saved = self.importance_repo.save_importance_batch(
+                    importance_records,
+                    analysis_date=analysis_date,
+                    team_key=team,
+                    extraction_method='enhanced_nlp',
+                )
+            except Exception as e:
+                logger.warning(f"Batch importance save failed, saving records one by one: {e}")
+                keywords_saved = self._save_importance_records(importance_records, analysis_date, team)
             
             processing_time_ms = (time.time() - start_time) * 1000
             
@@ -383,8 +430,80 @@ class EnhancedKeywordProcessor:
             return {
                 'status': 'failed',
                 'error': str(e),
+                'keywords_processed': keywords_processed,
+                'keywords_saved': keywords_saved,
                 'processing_time_ms': (time.time() - start_time) * 1000,
             }
+        
+        finally:
+            # Clear cache after processing
+            self.keyword_cache.clear()
+    
+    def _save_importance_records(self, records: List[Dict], analysis_date: date, team_key: Optional[str]) -> int:
+        """Save importance records one at a time, skipping any that fail."""
+        saved = 0
+        for record in records:
+            try:
+                self.importance_repo.save_importance(
+                    analysis_date=analysis_date,
+                    team_key=team_key,
+                    extraction_method='enhanced_nlp',
+                    **record
+                )
+                saved += 1
+            except Exception as e:
+                logger.error(f"Failed to save importance for '{record['keyword']}': {e}")
+        return saved
+    
+    def calculate_importance_by_date(
+        self,
+        team_key: Optional[str] = None,
+        min_frequency: int = 1,
+    ) -> Dict:
+        """
+        Calculate importance and sentiment per extraction date for cached keywords.
+        
+        The cache is split by each document's extraction date in one pass,
+        and all keywords are embedded once and shared across dates, so
+        documents are attributed to their own day rather than all to the
+        first date processed.
+        
+        Args:
+            team_key: Team context
+            min_frequency: Minimum per-date frequency to process
+        
+        Returns:
+            Per-date importance results keyed by date
+        """
+        caches = defaultdict(lambda: defaultdict(_new_cache_entry))
+        
+        for keyword, data in self.keyword_cache.items():
+            for doc in data['documents']:
+                entry = caches[doc.get('extraction_date') or date.today()][keyword]
+                entry['frequency'] += 1
+                entry['documents'].append(doc)
+                entry['snippets'].extend(doc.get('snippets', []))
+                entry['content_ids'].append(doc['content_id'])
+        
+        keyword_embeddings = self.importance_calc.batch_encode_keywords(list(self.keyword_cache))
+        
+        # Run each date on its own cache, then put the (emptied) main cache back
+        main_cache = self.keyword_cache
+        main_cache.clear()
+        results = {}
+        try:
+            for analysis_date in sorted(caches):
+                self.keyword_cache = caches.pop(analysis_date)
+                results[analysis_date] = self.calculate_importance_and_sentiment(
+                    analysis_date=analysis_date,
+                    team_key=team_key,
+                    min_frequency=min_frequency,
+                    keyword_embeddings=keyword_embeddings,
+                )
+        finally:
+            self.keyword_cache = main_cache
+        
+        return results
     
     def process_batch(
         self,
@@ -409,14 +528,75 @@ class EnhancedKeywordProcessor:
             'total': len(content_items),
             'successful': 0,
             'failed': 0,
+            'skipped': 0,
+            'failed_ids': [],
             'keywords_extracted': 0,
             'keywords_stored': 0,
             'processing_time_ms': 0,
         }
         
-        # Process each item
-        for item in content_items:
-            result = self.process_content(
+        # Keywords are extracted a chunk at a time (spaCy parses each chunk
+        # with nlp.pipe). A single writer thread stores one chunk while the
+        # next is extracted, so database write latency overlaps NLP compute
+        # and SQLite writes stay serialized.
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            pending = None
+            for start in range(0, len(content_items), EXTRACT_CHUNK_SIZE):
+                chunk = content_items[start:start + EXTRACT_CHUNK_SIZE]
+                extracted = self._extract_chunk(chunk)
+                
+                if pending is not None:
+                    self._add_item_results(results, pending.result())
+                pending = writer.submit(self._store_chunk, chunk, extracted, team_key)
+            
+            if pending is not None:
+                self._add_item_results(results, pending.result())
+        
+        # Calculate importance for all extracted keywords
+        if calculate_importance and results['successful'] > 0:
+            logger.info("Calculating importance for batch...")
+            importance_result = self.calculate_importance_and_sentiment(
+                team_key=team_key
+            )
+            results['importance_calculation'] = importance_result
+            results['processing_time_ms'] += importance_result.get('processing_time_ms', 0)
+        
+        return results
+    
+    def _extract_chunk(self, content_items: List[Dict]) -> List[Optional[List[Dict]]]:
+        """Extract keywords for a chunk (None entries are extracted again when stored)."""
+        # Too-short items are skipped by process_content, so don't extract them
+        indices = [
+            i for i, item in enumerate(content_items)
+            if len(item.get('content') or '') >= MIN_CONTENT_LENGTH
+        ]
+        results = [None] * len(content_items)
+        if not indices:
+            return results
+        
+        try:
+            with self._extractor_lock:
+                extracted = self.extractor.extract_batch(
+                    [(content_items[i].get('title', ''), content_items[i].get('content', '')) for i in indices],
+                    max_keywords=100,
+                )
+        except Exception as e:
+            logger.warning(f"Batch extraction failed, falling back to per-item: {e}")
+            return results
+        
+        for i, keywords in zip(indices, extracted):
+            results[i] = keywords
+        return results
+    
+    def _store_chunk(
+        self,
+        content_items: List[Dict],
+        extracted: List[Optional[List[Dict]]],
+        team_key: Optional[str],
+    ) -> List[Dict]:
+        """Store a chunk's keywords and return the per-item results (runs on the writer thread)."""
+        return [
+            self.process_content(
                 content_id=item['id'],
                 title=item.get('title', ''),
                 content=item.get('content', ''),
@@ -425,27 +605,26 @@ class EnhancedKeywordProcessor:
                 published_date=item.get('published_date'),
                 extraction_date=item.get('extraction_date'),
                 team_key=team_key,
+                keywords=keywords,
             )
-            
+            for item, keywords in zip(content_items, extracted)
+        ]
+    
+    @staticmethod
+    def _add_item_results(results: Dict, item_results: List[Dict]):
+        """Add per-item process_content results to the batch totals."""
+        for result in item_results:
             if result['status'] == 'success':
                 results['successful'] += 1
                 results['keywords_extracted'] += result['keywords_extracted']
                 results['keywords_stored'] += result['keywords_stored']
+            elif result['status'] == 'skipped':
+                results['skipped'] += 1
             else:
                 results['failed'] += 1
+                results['failed_ids'].append(result['content_id'])
             
             results['processing_time_ms'] += result['processing_time_ms']
-        
-        # Calculate importance for all extracted keywords
-        if calculate_importance and results['successful'] > 0:
-            logger.info("Calculating importance for batch...")
-            importance_result = self.calculate_importance_and_sentiment(
-                team_key=team_key
-            )
-            results['importance_calculation'] = importance_result
-            results['processing_time_ms'] += importance_result.get('processing_time_ms', 0)
-        
-        return results
     
     def generate_timeseries(
         self,
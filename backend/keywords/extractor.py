@@ -14,6 +14,12 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Text cleanup patterns, compiled once rather than looked up on every call
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_URL_RE = re.compile(r'http\S+|www\.\S+')
+_EMAIL_RE = re.compile(r'\S+@\S+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\-]')
+
 
 class KeywordExtractor:
     """
@@ -58,11 +64,13 @@ class KeywordExtractor:
             try:
                 import spacy
                 # Try medium model first, fall back to small
+                # Entities and noun chunks need ner, tagger, attribute_ruler and
+                # parser; the lemmatizer is never used
                 try:
-                    self._nlp = spacy.load("en_core_web_md")
+                    self._nlp = spacy.load("en_core_web_md", disable=["lemmatizer"])
                     logger.info("Loaded spaCy en_core_web_md model")
                 except OSError:
-                    self._nlp = spacy.load("en_core_web_sm")
+                    self._nlp = spacy.load("en_core_web_sm", disable=["lemmatizer"])
                     logger.info("Loaded spaCy en_core_web_sm model")
             except Exception as e:
                 logger.error(f"Failed to load spaCy model: {e}")
@@ -120,16 +128,16 @@ class KeywordExtractor:
             Cleaned text
         """
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_RE.sub('', text)
         
         # Remove URLs
-        text = re.sub(r'http\S+|www\.\S+', '', text)
+        text = _URL_RE.sub('', text)
         
         # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
+        text = _EMAIL_RE.sub('', text)
         
         # Remove special characters but keep spaces and hyphens
-        text = re.sub(r'[^\w\s\-]', ' ', text)
+        text = _SPECIAL_CHARS_RE.sub(' ', text)
         
         # Normalize whitespace
         text = ' '.join(text.split())
@@ -227,68 +235,69 @@ class KeywordExtractor:
             List of (keyword, type, score) tuples
         """
         try:
-            doc = self.nlp(text)
+            return self._spacy_keywords_from_doc(self.nlp(text), top_n)
+        except Exception as e:
+            logger.error(f"spaCy extraction failed: {e}")
+            return []
+    
+    def _spacy_keywords_from_doc(self, doc, top_n: int = 50) -> List[Tuple[str, str, float]]:
+        """Entity and noun phrase scoring for an already parsed spaCy Doc."""
+        results = []
+        
+        # Extract named entities
+        entity_counts = Counter()
+        entity_types = {}
+        
+        for ent in doc.ents:
+            # Skip very short entities
+            if len(ent.text) < 3:
+                continue
             
-            results = []
+            # Normalize
+            normalized = ent.text.lower().strip()
             
-            # Extract named entities
-            entity_counts = Counter()
-            entity_types = {}
+            # Skip stop words
+            if normalized in self.stop_words:
+                continue
             
-            for ent in doc.ents:
-                # Skip very short entities
-                if len(ent.text) < 3:
-                    continue
-                
-                # Normalize
-                normalized = ent.text.lower().strip()
-                
-                # Skip stop words
-                if normalized in self.stop_words:
-                    continue
-                
-                entity_counts[normalized] += 1
-                entity_types[normalized] = ent.label_
+            entity_counts[normalized] += 1
+            entity_types[normalized] = ent.label_
+        
+        # Convert entity counts to scores (normalize by max count)
+        max_count = max(entity_counts.values()) if entity_counts else 1
+        for entity, count in entity_counts.items():
+            score = count / max_count
+            entity_type = entity_types[entity]
+            results.append((entity, f"entity_{entity_type}", score))
+        
+        # Extract noun phrases
+        noun_phrase_counts = Counter()
+        
+        for chunk in doc.noun_chunks:
+            # Clean the chunk
+            phrase = chunk.text.lower().strip()
             
-            # Convert entity counts to scores (normalize by max count)
-            max_count = max(entity_counts.values()) if entity_counts else 1
-            for entity, count in entity_counts.items():
-                score = count / max_count
-                entity_type = entity_types[entity]
-                results.append((entity, f"entity_{entity_type}", score))
+            # Skip if too short or too long
+            word_count = len(phrase.split())
+            if word_count < 2 or word_count > self.max_phrase_length:
+                continue
             
-            # Extract noun phrases
-            noun_phrase_counts = Counter()
+            # Skip if starts/ends with stop word
+            words = phrase.split()
+            if words[0] in self.stop_words or words[-1] in self.stop_words:
+                continue
             
-            for chunk in doc.noun_chunks:
-                # Clean the chunk
-                phrase = chunk.text.lower().strip()
-                
-                # Skip if too short or too long
-                word_count = len(phrase.split())
-                if word_count < 2 or word_count > self.max_phrase_length:
-                    continue
-                
-                # Skip if starts/ends with stop word
-                words = phrase.split()
-                if words[0] in self.stop_words or words[-1] in self.stop_words:
-                    continue
-                
-                noun_phrase_counts[phrase] += 1
-            
-            # Convert noun phrase counts to scores
-            max_count = max(noun_phrase_counts.values()) if noun_phrase_counts else 1
-            for phrase, count in noun_phrase_counts.items():
-                score = count / max_count
-                results.append((phrase, "phrase", score))
-            
-            # Sort by score and return top N
-            results.sort(key=lambda x: x[2], reverse=True)
-            return results[:top_n]
+            noun_phrase_counts[phrase] += 1
         
-        except Exception as e:
-            logger.error(f"spaCy extraction failed: {e}")
-            return []
+        # Convert noun phrase counts to scores
+        max_count = max(noun_phrase_counts.values()) if noun_phrase_counts else 1
+        for phrase, count in noun_phrase_counts.items():
+            score = count / max_count
+            results.append((phrase, "phrase", score))
+        
+        # Sort by score and return top N
+        results.sort(key=lambda x: x[2], reverse=True)
+        return results[:top_n]
     
     def extract_yake_keywords(
         self,
@@ -458,13 +467,89 @@ class KeywordExtractor:
         """
         start_time = time.time()
         
-        # Preprocess
-        clean_text = self.preprocess_text(text)
-        clean_title = self.preprocess_text(title) if title else ""
+        full_text = self._prepare_text(text, title)
+        
+        logger.info("Extracting with spaCy...")
+        spacy_keywords = self.extract_spacy_keywords(full_text)
+        
+        merged_keywords = self._extract_prepared(
+            full_text,
+            spacy_keywords,
+            context_docs=context_docs,
+            max_keywords=max_keywords,
+            tfidf_weight=tfidf_weight,
+            spacy_weight=spacy_weight,
+            yake_weight=yake_weight,
+        )
+        
+        elapsed = time.time() - start_time
+        logger.info(f"Extracted {len(merged_keywords)} keywords in {elapsed:.2f}s")
+        
+        return merged_keywords
+    
+    def extract_batch(
+        self,
+        documents: List[Tuple[str, str]],
+        max_keywords: int = 50,
+        tfidf_weight: float = None,
+        spacy_weight: float = None,
+        yake_weight: float = None,
+        batch_size: int = 32,
+    ) -> List[List[Dict[str, any]]]:
+        """
+        Extract keywords for several documents, parsing them with nlp.pipe.
         
-        # Combine title and text (title gets more weight)
-        full_text = f"{clean_title} {clean_title} {clean_text}"
+        Gives the same per-document results as calling extract() on each
+        (title, text) pair, but spaCy processes the texts in batches.
+        
+        Args:
+            documents: List of (title, text) tuples
+            max_keywords: Maximum keywords to return per document
+            tfidf_weight: Weight for TF-IDF scores (uses instance default if None)
+            spacy_weight: Weight for spaCy scores (uses instance default if None)
+            yake_weight: Weight for YAKE scores (uses instance default if None)
+            batch_size: Documents per spaCy batch
         
+        Returns:
+            One keyword list per input document, in order
+        """
+        start_time = time.time()
+        
+        full_texts = [self._prepare_text(text, title) for title, text in documents]
+        
+        results = []
+        for full_text, doc in zip(full_texts, self.nlp.pipe(full_texts, batch_size=batch_size)):
+            results.append(self._extract_prepared(
+                full_text,
+                self._spacy_keywords_from_doc(doc),
+                max_keywords=max_keywords,
+                tfidf_weight=tfidf_weight,
+                spacy_weight=spacy_weight,
+                yake_weight=yake_weight,
+            ))
+        
+        elapsed = time.time() - start_time
+        logger.info(f"Extracted keywords for {len(documents)} documents in {elapsed:.2f}s")
+        
+        return results
+    
+    def _prepare_text(self, text: str, title: str = "") -> str:
+        """Preprocess and combine title and text (title gets more weight)."""
+        clean_text = self.preprocess_text(text)
+        clean_title = self.preprocess_text(title) if title else ""
+        return f"{clean_title} {clean_title} {clean_text}"
+    
+    def _extract_prepared(
+        self,
+        full_text: str,
+        spacy_keywords: List[Tuple[str, str, float]],
+        context_docs: List[str] = None,
+        max_keywords: int = 50,
+        tfidf_weight: float = None,
+        spacy_weight: float = None,
+        yake_weight: float = None,
+    ) -> List[Dict[str, any]]:
+        """Run TF-IDF and YAKE on prepared text and merge with spaCy results."""
         # Prepare documents for TF-IDF
         if context_docs:
             tfidf_docs = [full_text] + [self.preprocess_text(d) for d in context_docs]
@@ -475,9 +560,6 @@ class KeywordExtractor:
         logger.info("Extracting with TF-IDF...")
         tfidf_keywords = self.extract_tfidf_keywords(tfidf_docs)
         
-        logger.info("Extracting with spaCy...")
-        spacy_keywords = self.extract_spacy_keywords(full_text)
-        
         logger.info("Extracting with YAKE...")
         yake_keywords = self.extract_yake_keywords(full_text)
         
@@ -493,9 +575,4 @@ class KeywordExtractor:
         )
         
         # Limit results
-        merged_keywords = merged_keywords[:max_keywords]
-        
-        elapsed = time.time() - start_time
-        logger.info(f"Extracted {len(merged_keywords)} keywords in {elapsed:.2f}s")
-        
-        return merged_keywords
+        return merged_keywords[:max_keywords]
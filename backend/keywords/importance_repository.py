@@ -4,10 +4,11 @@ Repository for keyword importance and time-series data.
 
 from typing import List, Optional, Dict
 from datetime import date, datetime, timedelta
-from sqlalchemy import create_engine, func, and_, desc
+from sqlalchemy import create_engine, func, and_, desc, insert
 from sqlalchemy.orm import sessionmaker, Session
 from pathlib import Path
 
+from storage.models import INSERT_PAGE_SIZE
 from keywords.importance_models import (
     KeywordImportanceModel,
     KeywordTimeSeriesModel,
@@ -15,6 +16,27 @@ from keywords.importance_models import (
 )
 
 
+# Keeps IN (...) lookups below SQLite's bound-parameter limit
+KEYWORD_QUERY_CHUNK_SIZE = 500
+
+# Importance fields save_importance_batch() writes on both insert and update
+IMPORTANCE_FIELDS = (
+    'importance_score',
+    'frequency',
+    'document_count',
+    'source_diversity',
+    'velocity',
+    'acceleration',
+    'sentiment_score',
+    'sentiment_magnitude',
+    'positive_mentions',
+    'negative_mentions',
+    'neutral_mentions',
+    'content_ids',
+    'sample_snippets',
+)
+
+
 def get_database_url(db_name: str = "keywords.db") -> str:
     """Get database URL for keywords database."""
     db_path = Path(__file__).parent.parent / "data" / db_name
@@ -27,7 +49,7 @@ class ImportanceRepository:
     def __init__(self, db_url: Optional[str] = None):
         """Initialize repository."""
         self.db_url = db_url or get_database_url()
-        self.engine = create_engine(self.db_url, echo=False)
+        self.engine = create_engine(self.db_url, echo=False, insertmanyvalues_page_size=INSERT_PAGE_SIZE)
         self.SessionLocal = sessionmaker(bind=self.engine)
         
         # Create tables if they don't exist
@@ -129,6 +151,82 @@ class ImportanceRepository:
         finally:
             session.close()
     
+    def save_importance_batch(
+        self,
+        records: List[Dict],
+        analysis_date: date,
+        team_key: Optional[str],
+        extraction_method: Optional[str] = None,
+    ) -> int:
+        """
+        Save many keyword importance records for one date and team.
+        
+        Same upsert semantics as save_importance(), but existing rows are
+        looked up with a few IN (...) queries, updated with one bulk UPDATE
+        and new rows are written with a single executemany INSERT, all in
+        one transaction.
+        
+        Args:
+            records: Dicts with 'keyword' plus the IMPORTANCE_FIELDS values
+            analysis_date: Date of the analysis
+            team_key: Team key
+            extraction_method: Extraction method recorded on new rows
+        
+        Returns:
+            Number of records saved
+        """
+        if not records:
+            return 0
+        
+        session = self._get_session()
+        try:
+            # Existing rows for this date/team, keyword -> id
+            keywords = list({record['keyword'] for record in records})
+            existing_ids = {}
+            for i in range(0, len(keywords), KEYWORD_QUERY_CHUNK_SIZE):
+                chunk = keywords[i:i + KEYWORD_QUERY_CHUNK_SIZE]
+                existing_ids.update(session.query(
+                    KeywordImportanceModel.keyword,
+                    KeywordImportanceModel.id
+                ).filter(
+                    and_(
+                        KeywordImportanceModel.keyword.in_(chunk),
+                        KeywordImportanceModel.date == analysis_date,
+                        KeywordImportanceModel.team_key == team_key
+                    )
+                ).all())
+            
+            now = datetime.utcnow()
+            updates = []
+            inserts = []
+            for record in records:
+                values = {field: record[field] for field in IMPORTANCE_FIELDS}
+                record_id = existing_ids.get(record['keyword'])
+                if record_id is not None:
+                    updates.append({'id': record_id, 'updated_at': now, **values})
+                else:
+                    inserts.append({
+                        'keyword': record['keyword'],
+                        'keyword_normalized': record['keyword'].lower(),
+                        'date': analysis_date,
+                        'team_key': team_key,
+                        'extraction_method': extraction_method,
+                        'created_at': now,
+                        'updated_at': now,
+                        **values,
+                    })
+            
+            if updates:
+                session.bulk_update_mappings(KeywordImportanceModel, updates)
+            if inserts:
+                session.execute(insert(KeywordImportanceModel), inserts)
+            
+            session.commit()
+            return len(records)
+        
+        finally:
+            session.close()
+    
     def get_top_keywords(
         self,
         team_key: Optional[str],
@@ -20,6 +20,8 @@ from sqlalchemy import (
 )
 from sqlalchemy.ext.declarative import declarative_base
 
+from storage.models import INSERT_PAGE_SIZE
+
 # Reuse the Base from storage.models if needed, or create separate
 KeywordBase = declarative_base()
 
@@ -207,7 +209,7 @@ def get_keyword_session(db_url: str = None):
     if db_url is None:
         db_url = get_keyword_database_url()
     
-    engine = create_engine(db_url, echo=False)
+    engine = create_engine(db_url, echo=False, insertmanyvalues_page_size=INSERT_PAGE_SIZE)
     Session = sessionmaker(bind=engine)
     return Session()
 
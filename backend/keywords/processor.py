@@ -4,9 +4,11 @@ Real-time keyword extraction processor.
 Processes content as it arrives in the data lake and extracts keywords immediately.
 """
 
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
 
 from .extractor import KeywordExtractor
@@ -15,6 +17,26 @@ from .repository import KeywordRepository, KeywordConfigRepository
 
 logger = logging.getLogger(__name__)
 
+# Content shorter than this (e.g. title-only feed entries) is skipped rather
+# than run through TF-IDF/spaCy/YAKE, which only yield noise on it
+MIN_CONTENT_LENGTH = 50
+
+# One extractor per worker process, so spaCy/YAKE load once per worker, not per document
+_worker_extractor: Optional[KeywordExtractor] = None
+
+
+def _extract_in_worker(job: tuple) -> Optional[List[Dict]]:
+    """Extract keywords in a process_batch worker (returns None on failure)."""
+    global _worker_extractor
+    title, content, params = job
+    try:
+        if _worker_extractor is None:
+            _worker_extractor = KeywordExtractor()
+        return _worker_extractor.extract(text=content, title=title, **params)
+    except Exception as e:
+        logger.warning(f"Worker extraction failed for '{title[:50]}': {e}")
+        return None
+
 
 class RealtimeKeywordProcessor:
     """
@@ -41,6 +63,10 @@ class RealtimeKeywordProcessor:
         self.extractor = extractor or KeywordExtractor()
         self.keyword_repo = keyword_repo or KeywordRepository()
         self.config_repo = config_repo or KeywordConfigRepository()
+        # Extraction workers are started once and reused across batches, so
+        # spaCy/YAKE load once per worker for the processor's lifetime
+        self._extract_pool: Optional[ProcessPoolExecutor] = None
+        self._extract_pool_workers = 0
 
     def process_content(
         self,
@@ -50,6 +76,7 @@ class RealtimeKeywordProcessor:
         source_type: str,
         source_name: str,
         extraction_date: Optional[date] = None,
+        keywords: Optional[List[Dict]] = None,
     ) -> dict:
         """
         Process a single piece of content and extract keywords.
@@ -61,12 +88,23 @@ class RealtimeKeywordProcessor:
             source_type: Source type ('rss', etc.)
             source_name: Source name ('TechCrunch', etc.)
             extraction_date: Date for keyword association (defaults to today)
+            keywords: Already extracted keywords (skips extraction, used by process_batch)
         
         Returns:
             Processing result with statistics
         """
         start_time = time.time()
         
+        if len(content or '') < MIN_CONTENT_LENGTH:
+            logger.info(f"Skipped content {content_id}: too short ({len(content or '')} chars)")
+            return {
+                'status': 'skipped',
+                'content_id': content_id,
+                'keywords_extracted': 0,
+                'keywords_stored': 0,
+                'processing_time_ms': 0.0,
+            }
+        
         try:
             # Get active config
             config = self.config_repo.get_active_config()
@@ -87,16 +125,17 @@ class RealtimeKeywordProcessor:
                 max_keywords = config.max_keywords_per_source
             
             # Extract keywords
-            logger.info(f"Extracting keywords from content {content_id}: {title[:50]}...")
-            
-            keywords = self.extractor.extract(
-                text=content,
-                title=title,
-                max_keywords=max_keywords,
-                tfidf_weight=tfidf_weight,
-                spacy_weight=spacy_weight,
-                yake_weight=yake_weight,
-            )
+            if keywords is None:
+                logger.info(f"Extracting keywords from content {content_id}: {title[:50]}...")
+                
+                keywords = self.extractor.extract(
+                    text=content,
+                    title=title,
+                    max_keywords=max_keywords,
+                    tfidf_weight=tfidf_weight,
+                    spacy_weight=spacy_weight,
+                    yake_weight=yake_weight,
+                )
             
             keywords_extracted = len(keywords)
             
@@ -170,27 +209,83 @@ class RealtimeKeywordProcessor:
                 'processing_time_ms': processing_time_ms,
             }
 
-    def process_batch(self, content_items: list) -> dict:
+    def _extraction_params(self) -> dict:
+        """Extraction parameters from the active config (defaults if none)."""
+        config = self.config_repo.get_active_config()
+        if not config:
+            return {
+                'max_keywords': 50,
+                'tfidf_weight': 0.3,
+                'spacy_weight': 0.4,
+                'yake_weight': 0.3,
+            }
+        return {
+            'max_keywords': config.max_keywords_per_source,
+            'tfidf_weight': config.tfidf_weight,
+            'spacy_weight': config.spacy_weight,
+            'yake_weight': config.yake_weight,
+        }
+
+    def _get_extract_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        """Return the extraction pool, starting (or growing) it on demand."""
+        if self._extract_pool is not None and self._extract_pool_workers < max_workers:
+            self._extract_pool.shutdown()
+            self._extract_pool = None
+        if self._extract_pool is None:
+            self._extract_pool = ProcessPoolExecutor(max_workers=max_workers)
+            self._extract_pool_workers = max_workers
+        return self._extract_pool
+
+    def _extract_parallel(
+        self, pool: ProcessPoolExecutor, content_items: list, params: dict
+    ) -> List[Optional[List[Dict]]]:
+        """
+        Extract keywords for all items in a process pool.
+        
+        Documents are independent, so the CPU-bound extraction scales with
+        cores. Database writes stay in this process (SQLite has one writer).
+        """
+        jobs = [(item['title'], item['content'], params) for item in content_items]
+        return list(pool.map(_extract_in_worker, jobs, chunksize=4))
+
+    def _extract_pipelined(self, content_items: list, params: dict) -> List[Optional[List[Dict]]]:
+        """Extract keywords in-process, letting spaCy parse the batch with nlp.pipe."""
+        try:
+            return self.extractor.extract_batch(
+                [(item['title'], item['content']) for item in content_items],
+                **params
+            )
+        except Exception as e:
+            logger.warning(f"Batch extraction failed, falling back to per-item: {e}")
+            return [None] * len(content_items)
+
+    def process_batch(self, content_items: list, max_workers: int = 1) -> dict:
         """
         Process a batch of content items.
         
         Args:
             content_items: List of dicts with content data
                 Expected keys: id, title, content, source_type, source_name
+            max_workers: Worker processes for keyword extraction (1 = in-process,
+                None = one per CPU core)
         
         Returns:
             Batch processing results
         """
+        extracted = self._extract_batch(content_items, max_workers, self._extraction_params())
+        
         results = {
             'total': len(content_items),
             'successful': 0,
             'failed': 0,
+            'skipped': 0,
             'keywords_extracted': 0,
             'keywords_stored': 0,
             'processing_time_ms': 0,
         }
         
-        for item in content_items:
+        for item, keywords in zip(content_items, extracted):
+            # Items whose worker extraction failed are retried in-process (keywords=None)
             result = self.process_content(
                 content_id=item['id'],
                 title=item['title'],
@@ -198,12 +293,15 @@ class RealtimeKeywordProcessor:
                 source_type=item['source_type'],
                 source_name=item['source_name'],
                 extraction_date=item.get('extraction_date'),
+                keywords=keywords,
             )
             
             if result['status'] == 'success':
                 results['successful'] += 1
                 results['keywords_extracted'] += result['keywords_extracted']
                 results['keywords_stored'] += result['keywords_stored']
+            elif result['status'] == 'skipped':
+                results['skipped'] += 1
             else:
                 results['failed'] += 1
             
@@ -211,7 +309,36 @@ class RealtimeKeywordProcessor:
         
         return results
 
+    def _extract_batch(self, content_items: list, max_workers: int, params: dict) -> List[Optional[List[Dict]]]:
+        """Extract keywords for a batch (None entries are extracted again when stored)."""
+        # Too-short items are skipped by process_content, so don't extract them
+        indices = [
+            i for i, item in enumerate(content_items)
+            if len(item['content'] or '') >= MIN_CONTENT_LENGTH
+        ]
+        items = [content_items[i] for i in indices]
+        
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(items))
+        
+        if max_workers > 1:
+            pool = self._get_extract_pool(max_workers)
+            extracted = self._extract_parallel(pool, items, params)
+        elif len(items) > 1:
+            extracted = self._extract_pipelined(items, params)
+        else:
+            extracted = [None] * len(items)
+        
+        results = [None] * len(content_items)
+        for i, keywords in zip(indices, extracted):
+            results[i] = keywords
+        return results
+
     def close(self):
         """Clean up resources."""
+        if self._extract_pool is not None:
+            self._extract_pool.shutdown()
+            self._extract_pool = None
         self.keyword_repo.close()
         self.config_repo.close()
@@ -5,7 +5,7 @@ Repository layer for keyword storage and retrieval.
 from typing import List, Dict, Optional
 from datetime import datetime, date, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, case, desc, func, insert
 
 from .models import (
     ExtractedKeywordModel,
@@ -50,28 +50,36 @@ class KeywordRepository:
         Returns:
             Number of keywords saved
         """
-        saved_count = 0
-        
-        for kw_data in keywords:
-            # Check threshold
-            if kw_data['relevance_score'] < relevance_threshold:
-                continue
-            
-            # Check if keyword already exists for this date/source
-            existing = self.session.query(ExtractedKeywordModel).filter(
+        relevant = [kw for kw in keywords if kw['relevance_score'] >= relevance_threshold]
+        if not relevant:
+            return 0
+        
+        # Load every keyword already stored for this date/source in one query
+        existing_by_keyword = {
+            kw.keyword: kw
+            for kw in self.session.query(ExtractedKeywordModel).filter(
                 and_(
-                    ExtractedKeywordModel.keyword == kw_data['keyword'],
+                    ExtractedKeywordModel.keyword.in_({kw['keyword'] for kw in relevant}),
                     ExtractedKeywordModel.extraction_date == extraction_date,
                     ExtractedKeywordModel.source_type == source_type,
                     ExtractedKeywordModel.source_name == source_name,
                 )
-            ).first()
+            )
+        }
+        
+        # New keywords are collected as plain rows and inserted in bulk
+        new_rows = {}
+        now = datetime.utcnow()
+        
+        for kw_data in relevant:
+            existing = existing_by_keyword.get(kw_data['keyword'])
+            pending = new_rows.get(kw_data['keyword'])
             
             if existing:
                 # Update existing keyword
                 existing.frequency += 1
                 existing.document_count += 1
-                existing.last_seen = datetime.utcnow()
+                existing.last_seen = now
                 
                 # Update scores (take max)
                 existing.relevance_score = max(existing.relevance_score, kw_data['relevance_score'])
@@ -79,35 +87,45 @@ class KeywordRepository:
                 existing.spacy_score = max(existing.spacy_score or 0, kw_data.get('spacy_score', 0))
                 existing.yake_score = max(existing.yake_score or 0, kw_data.get('yake_score', 0))
                 
-                # Add content ID to list
-                if existing.content_ids is None:
-                    existing.content_ids = []
-                if content_id not in existing.content_ids:
-                    existing.content_ids.append(content_id)
+                # Add content ID to list (reassign so the JSON column change is detected)
+                content_ids = existing.content_ids or []
+                if content_id not in content_ids:
+                    existing.content_ids = content_ids + [content_id]
+            elif pending:
+                # Same keyword twice in one extraction
+                pending['frequency'] += 1
+                pending['document_count'] += 1
+                pending['relevance_score'] = max(pending['relevance_score'], kw_data['relevance_score'])
+                pending['tfidf_score'] = max(pending['tfidf_score'] or 0, kw_data.get('tfidf_score', 0))
+                pending['spacy_score'] = max(pending['spacy_score'] or 0, kw_data.get('spacy_score', 0))
+                pending['yake_score'] = max(pending['yake_score'] or 0, kw_data.get('yake_score', 0))
             else:
                 # Create new keyword
-                keyword = ExtractedKeywordModel(
-                    keyword=kw_data['keyword'],
-                    keyword_type=kw_data['type'],
-                    entity_type=kw_data.get('entity_type'),
-                    relevance_score=kw_data['relevance_score'],
-                    tfidf_score=kw_data.get('tfidf_score'),
-                    spacy_score=kw_data.get('spacy_score'),
-                    yake_score=kw_data.get('yake_score'),
-                    frequency=1,
-                    document_count=1,
-                    extraction_date=extraction_date,
-                    source_type=source_type,
-                    source_name=source_name,
-                    content_ids=[content_id],
-                    extraction_method='tfidf+spacy+yake',
-                )
-                self.session.add(keyword)
-            
-            saved_count += 1
+                new_rows[kw_data['keyword']] = {
+                    'keyword': kw_data['keyword'],
+                    'keyword_type': kw_data['type'],
+                    'entity_type': kw_data.get('entity_type'),
+                    'relevance_score': kw_data['relevance_score'],
+                    'tfidf_score': kw_data.get('tfidf_score'),
+                    'spacy_score': kw_data.get('spacy_score'),
+                    'yake_score': kw_data.get('yake_score'),
+                    'frequency': 1,
+                    'document_count': 1,
+                    'extraction_date': extraction_date,
+                    'first_seen': now,
+                    'last_seen': now,
+                    'source_type': source_type,
+                    'source_name': source_name,
+                    'content_ids': [content_id],
+                    'extraction_method': 'tfidf+spacy+yake',
+                }
+        
+        if new_rows:
+            # Core executemany INSERT (no ORM objects are built)
+            self.session.execute(insert(ExtractedKeywordModel), list(new_rows.values()))
         
         self.session.commit()
-        return saved_count
+        return len(relevant)
 
     def get_daily_keywords(
         self,
@@ -244,28 +262,19 @@ class KeywordRepository:
         Returns:
             Dictionary with statistics
         """
-        total_keywords = self.session.query(ExtractedKeywordModel).count()
-        
-        # Unique keywords
-        unique_keywords = self.session.query(
-            func.count(func.distinct(ExtractedKeywordModel.keyword))
-        ).scalar()
-        
-        # By source
-        by_source = {}
-        results = self.session.query(
-            ExtractedKeywordModel.source_name,
-            func.count(ExtractedKeywordModel.id)
-        ).group_by(ExtractedKeywordModel.source_name).all()
-        
-        for source_name, count in results:
-            by_source[source_name] = count
-        
-        # Recent activity
+        # Totals, unique keywords and today's count in a single query
         today = date.today()
-        today_count = self.session.query(ExtractedKeywordModel).filter(
-            ExtractedKeywordModel.extraction_date == today
-        ).count()
+        total_keywords, unique_keywords, today_count = self.session.query(
+            func.count(ExtractedKeywordModel.id),
+            func.count(func.distinct(ExtractedKeywordModel.keyword)),
+            func.coalesce(func.sum(case(
+                (ExtractedKeywordModel.extraction_date == today, 1),
+                else_=0
+            )), 0),
+        ).one()
+        
+        # By source (largest first)
+        by_source = dict(self.get_top_sources(limit=None))
         
         return {
             'total_keywords': total_keywords,
@@ -274,6 +283,30 @@ class KeywordRepository:
             'today': today_count,
         }
 
+    def get_top_sources(self, limit: Optional[int] = 20) -> List[tuple]:
+        """
+        Get sources ordered by number of stored keywords.
+        
+        Ordering and limiting happen in SQL, so callers don't need to
+        fetch and sort every source.
+        
+        Args:
+            limit: Maximum number of sources (None for all)
+        
+        Returns:
+            List of (source_name, keyword_count) tuples, largest first
+        """
+        keyword_count = func.count(ExtractedKeywordModel.id)
+        query = self.session.query(
+            ExtractedKeywordModel.source_name,
+            keyword_count
+        ).group_by(ExtractedKeywordModel.source_name).order_by(desc(keyword_count))
+        
+        if limit is not None:
+            query = query.limit(limit)
+        
+        return [(source_name, count) for source_name, count in query]
+
     def close(self):
         """Close database session."""
         self.session.close()
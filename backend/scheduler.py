@@ -9,18 +9,29 @@ import sys
 if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
+import heapq
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import List
 import logging
 
+import aiohttp
+
 from sourcers import RSSSourcer
-from sourcers.web_scraper import BlogScraper, GenericWebScraper
-from sourcers.playwright_scraper import PlaywrightScraper
+from sourcers.web_scraper import BlogScraper, GenericWebScraper, DEFAULT_HEADERS
+from sourcers.playwright_scraper import (
+    get_shared_scraper,
+    peek_shared_scraper,
+    close_shared_scraper
+)
 from storage import (
     ContentRepository,
     SourceConfigRepository,
-    SourceConfigModel
+    SourceConfigModel,
+    compute_content_hash,
+    create_database,
+    get_database_url
 )
 
 # Configure logging
@@ -30,29 +41,135 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Lower bound on sleeps so an overdue source can't make the loop spin
+MIN_SLEEP_SECONDS = 5
+
 
 class SourceScheduler:
     """Scheduler that automatically fetches content from configured sources"""
     
-    def __init__(self, check_interval_seconds: int = 60):
+    def __init__(
+        self,
+        check_interval_seconds: int = 60,
+        max_concurrency: int = 8,
+        max_connections: int = 100,
+        max_connections_per_host: int = 20,
+        playwright_pool_size: int = 4,
+        max_seen_hashes: int = 100_000,
+    ):
         """
         Initialize scheduler
         
         Args:
-            check_interval_seconds: How often to check for sources that need fetching
+            check_interval_seconds: Longest wait between checks of the source list
+                (the scheduler otherwise sleeps until the next source is due)
+            max_concurrency: Maximum number of sources fetched at the same time
+            max_connections: Size of the shared HTTP connection pool
+            max_connections_per_host: Pooled connections allowed per host
+            playwright_pool_size: Browser contexts kept warm if this scheduler launches Playwright
+            max_seen_hashes: Content hashes remembered in memory to skip known duplicates
         """
         self.check_interval = check_interval_seconds
+        self.max_concurrency = max_concurrency
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
         self.running = False
         self.config_repo = SourceConfigRepository()
         self.content_repo = ContentRepository()
-        self.playwright_scraper = None  # Lazy initialization
-        self.stats = {
-            "cycles_completed": 0,
-            "total_sources_fetched": 0,
-            "total_items_saved": 0,
-            "errors": 0,
-            "last_cycle_time": None
-        }
+        self.http_session = None  # Lazy initialization (needs a running loop)
+        self.playwright_pool_size = playwright_pool_size
+        # Content hashes already stored this session (oldest evicted first)
+        self.max_seen_hashes = max_seen_hashes
+        self._seen_hashes = OrderedDict()
+        # URL -> (hash(content), content_hash) so unchanged feed items aren't re-hashed
+        self._url_hashes = OrderedDict()
+        # Min-heap of (next_fetch_at, source_id) used to sleep until the next due source
+        self._due_heap = []
+        self._wake_event = asyncio.Event()
+        # Per RSS source: (etag, last_modified, ttl_minutes) from the last response
+        self._feed_validators = {}
+        
+        # Cycle statistics (updated together at the end of each cycle, with no
+        # await in between, so get_stats() never sees a half-updated cycle)
+        self.cycles_completed = 0
+        self.total_sources_fetched = 0
+        self.total_items_saved = 0
+        self.errors = 0
+        self.last_cycle_time = None
+    
+    def get_http_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session shared by all sourcers, creating it on first use"""
+        if self.http_session is None or self.http_session.closed:
+            self.http_session = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.max_connections_per_host,
+                    ttl_dns_cache=300,
+                )
+            )
+        return self.http_session
+    
+    def save_new_contents(self, contents: list, source: SourceConfigModel) -> dict:
+        """
+        Save fetched contents, skipping items already seen this session
+        
+        Feeds return mostly the same items on every poll, so known hashes are
+        filtered in memory before any database lookups are made. Items whose
+        URL and text are unchanged since the last poll reuse their cached
+        hash instead of being normalized and hashed again.
+        
+        Returns:
+            Dict with statistics: {'saved': int, 'duplicates': int, 'total': int}
+        """
+        new_contents = []
+        new_hashes = []
+        for content in contents:
+            content_hash = self._content_hash(content)
+            if content_hash in self._seen_hashes:
+                continue
+            new_contents.append(content)
+            new_hashes.append(content_hash)
+        
+        skipped = len(contents) - len(new_contents)
+        if new_contents:
+            stats = self.content_repo.save_batch(
+                new_contents,
+                source_type=source.source_type,
+                source_name=source.source_name,
+                source_url=source.source_url,
+                content_hashes=new_hashes
+            )
+        else:
+            stats = {'saved': 0, 'duplicates': 0, 'total': 0}
+        
+        # Both saved and DB-duplicate items are now known to be stored
+        for content_hash in new_hashes:
+            self._seen_hashes[content_hash] = None
+        while len(self._seen_hashes) > self.max_seen_hashes:
+            self._seen_hashes.popitem(last=False)
+        while len(self._url_hashes) > self.max_seen_hashes:
+            self._url_hashes.popitem(last=False)
+        
+        stats['duplicates'] += skipped
+        stats['total'] = len(contents)
+        return stats
+    
+    def _content_hash(self, content) -> str:
+        """compute_content_hash() for an item, reusing the cached value when its URL and text are unchanged"""
+        if not content.url:
+            return compute_content_hash(content.content, content.url)
+        
+        text_key = hash(content.content)
+        cached = self._url_hashes.get(content.url)
+        if cached is not None and cached[0] == text_key:
+            self._url_hashes.move_to_end(content.url)
+            return cached[1]
+        
+        content_hash = compute_content_hash(content.content, content.url)
+        self._url_hashes[content.url] = (text_key, content_hash)
+        return content_hash
     
     def should_fetch(self, source: SourceConfigModel) -> bool:
         """Check if a source should be fetched now"""
@@ -62,7 +179,34 @@ class SourceScheduler:
         if source.next_fetch_at is None:
             return True  # Never fetched before
         
-        return datetime.utcnow() >= source.next_fetch_at
+        # next_fetch_at is written with local time by update_fetch_status
+        return datetime.now() >= source.next_fetch_at
+    
+    def _rebuild_due_heap(self, sources: List[SourceConfigModel]):
+        """Rebuild the next-fire queue from the current source list"""
+        now = datetime.now()
+        self._due_heap = [(s.next_fetch_at or now, s.id) for s in sources]
+        heapq.heapify(self._due_heap)
+    
+    def has_playwright_sources(self) -> bool:
+        """Whether any enabled source is scraped with Playwright"""
+        return any(
+            source.source_type == "blog_scrape"
+            and source.config
+            and source.config.get('use_playwright', False)
+            for source in self.config_repo.list_sources(enabled_only=True)
+        )
+    
+    def seconds_until_next_due(self) -> float:
+        """Seconds to sleep before the next source is due (capped by check_interval)"""
+        if not self._due_heap:
+            return self.check_interval
+        delay = (self._due_heap[0][0] - datetime.now()).total_seconds()
+        return min(max(delay, MIN_SLEEP_SECONDS), self.check_interval)
+    
+    def wake(self):
+        """Interrupt the current sleep, e.g. after a source was added or enabled"""
+        self._wake_event.set()
     
     async def fetch_rss_source(self, source: SourceConfigModel) -> dict:
         """Fetch content from an RSS source"""
@@ -70,33 +214,47 @@ class SourceScheduler:
             logger.info(f"Fetching RSS: {source.source_name}")
             
             max_entries = source.config.get('max_entries', 50)
+            etag, last_modified, ttl_minutes = self._feed_validators.get(source.id, (None, None, None))
             sourcer = RSSSourcer(
                 feed_url=source.source_url,
                 name=source.source_name,
-                max_entries=max_entries
+                max_entries=max_entries,
+                session=self.get_http_session(),
+                etag=etag,
+                last_modified=last_modified
             )
             
             contents = await sourcer.fetch()
             
-            if contents:
-                stats = self.content_repo.save_batch(
-                    contents,
-                    source_type=source.source_type,
-                    source_name=source.source_name,
-                    source_url=source.source_url
+            # Remember validators and the feed's own <ttl> for the next poll
+            if not sourcer.not_modified:
+                ttl_minutes = sourcer.ttl_minutes
+            self._feed_validators[source.id] = (sourcer.etag, sourcer.last_modified, ttl_minutes)
+            
+            if sourcer.not_modified:
+                logger.info(f"✅ RSS {source.source_name}: not modified")
+                self.config_repo.update_fetch_status(
+                    source.id, items_fetched=0, min_interval_minutes=ttl_minutes
                 )
+                return {"saved": 0, "duplicates": 0}
+            
+            if contents:
+                stats = self.save_new_contents(contents, source)
                 
                 # Update source stats
                 self.config_repo.update_fetch_status(
                     source.id,
-                    items_count=stats['saved']
+                    items_fetched=stats['saved'],
+                    min_interval_minutes=ttl_minutes
                 )
                 
                 logger.info(f"✅ RSS {source.source_name}: {stats['saved']} new items, {stats['duplicates']} duplicates")
                 return stats
             else:
                 logger.warning(f"⚠️ RSS {source.source_name}: No content fetched")
-                self.config_repo.update_fetch_status(source.id, items_fetched=0)
+                self.config_repo.update_fetch_status(
+                    source.id, items_fetched=0, min_interval_minutes=ttl_minutes
+                )
                 return {"saved": 0, "duplicates": 0}
                 
         except Exception as e:
@@ -125,17 +283,12 @@ class SourceScheduler:
                 'name': source.source_name,
                 'max_pages': max_pages,
                 'selectors': selectors
-            })
+            }, session=self.get_http_session())
             
             contents = await scraper.scrape()
             
             if contents:
-                stats = self.content_repo.save_batch(
-                    contents,
-                    source_type=source.source_type,
-                    source_name=source.source_name,
-                    source_url=source.source_url
-                )
+                stats = self.save_new_contents(contents, source)
                 
                 self.config_repo.update_fetch_status(
                     source.id,
@@ -157,27 +310,23 @@ class SourceScheduler:
     async def fetch_with_playwright(self, source: SourceConfigModel) -> dict:
         """Fetch content using Playwright for bot-protected or JavaScript-heavy sites"""
         try:
-            # Initialize Playwright scraper if not already done
-            if self.playwright_scraper is None:
-                self.playwright_scraper = PlaywrightScraper(timeout=60000)
-                await self.playwright_scraper.start()
+            # Process-wide browser, usually already warmed up at app startup
+            scraper = await get_shared_scraper(
+                timeout=60000,
+                pool_size=self.playwright_pool_size
+            )
             
             selectors = source.config.get('selectors', {})
             max_items = source.config.get('max_items', 10)
             
-            articles = await self.playwright_scraper.scrape_blog(
+            articles = await scraper.scrape_blog(
                 url=source.source_url,
                 selectors=selectors,
                 max_items=max_items
             )
             
             if articles:
-                stats = self.content_repo.save_batch(
-                    articles,
-                    source_type=source.source_type,
-                    source_name=source.source_name,
-                    source_url=source.source_url
-                )
+                stats = self.save_new_contents(articles, source)
                 
                 self.config_repo.update_fetch_status(
                     source.id,
@@ -209,17 +358,12 @@ class SourceScheduler:
                 'name': source.source_name,
                 'max_pages': max_pages,
                 'selectors': selectors
-            })
+            }, session=self.get_http_session())
             
             contents = await scraper.scrape()
             
             if contents:
-                stats = self.content_repo.save_batch(
-                    contents,
-                    source_type=source.source_type,
-                    source_name=source.source_name,
-                    source_url=source.source_url
-                )
+                stats = self.save_new_contents(contents, source)
                 
                 self.config_repo.update_fetch_status(
                     source.id,
@@ -261,6 +405,7 @@ class SourceScheduler:
         sources = self.config_repo.list_sources(enabled_only=True)
         
         if not sources:
+            self._due_heap = []
             logger.info("No enabled sources configured")
             return
         
@@ -268,15 +413,29 @@ class SourceScheduler:
         sources_to_fetch = [s for s in sources if self.should_fetch(s)]
         
         if not sources_to_fetch:
+            self._rebuild_due_heap(sources)
             logger.info(f"No sources due for fetching (checked {len(sources)} sources)")
             return
         
         logger.info(f"Fetching {len(sources_to_fetch)} sources...")
         
-        # Fetch from each source
+        # Fetch all due sources concurrently (bounded by max_concurrency)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch_bounded(source: SourceConfigModel) -> dict:
+            async with semaphore:
+                return await self.fetch_source(source)
+        
+        fetch_results = await asyncio.gather(
+            *(fetch_bounded(source) for source in sources_to_fetch),
+            return_exceptions=True
+        )
+        
         results = []
-        for source in sources_to_fetch:
-            result = await self.fetch_source(source)
+        for source, result in zip(sources_to_fetch, fetch_results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ {source.source_name}: {result}")
+                result = {"error": str(result)}
             results.append({
                 "source": source.source_name,
                 "type": source.source_type,
@@ -289,18 +448,21 @@ class SourceScheduler:
         total_saved = sum(r["result"].get("saved", 0) for r in results)
         
         # Update stats
-        self.stats["cycles_completed"] += 1
-        self.stats["total_sources_fetched"] += len(sources_to_fetch)
-        self.stats["total_items_saved"] += total_saved
-        self.stats["errors"] += failed
-        self.stats["last_cycle_time"] = datetime.utcnow().isoformat()
+        self.cycles_completed += 1
+        self.total_sources_fetched += len(sources_to_fetch)
+        self.total_items_saved += total_saved
+        self.errors += failed
+        self.last_cycle_time = datetime.utcnow().isoformat()
         
         logger.info(f"Cycle complete: {successful} successful, {failed} failed, {total_saved} new items saved")
+        
+        # Fetched sources now carry their new next_fetch_at
+        self._rebuild_due_heap(sources)
     
     async def run(self):
         """Run the scheduler continuously"""
         self.running = True
-        logger.info(f"Scheduler started (checking every {self.check_interval} seconds)")
+        logger.info(f"Scheduler started (checking at least every {self.check_interval} seconds)")
         
         while self.running:
             try:
@@ -308,17 +470,42 @@ class SourceScheduler:
             except Exception as e:
                 logger.error(f"Error in scheduler cycle: {e}")
             
-            # Wait before next cycle
-            await asyncio.sleep(self.check_interval)
+            # Release browser contexts that sat idle since earlier cycles
+            # (also when this cycle had nothing to fetch)
+            scraper = peek_shared_scraper()
+            if scraper:
+                try:
+                    await scraper.reap_idle_contexts()
+                except Exception as e:
+                    logger.error(f"Error reaping Playwright contexts: {e}")
+            
+            # Sleep until the next source is due (or until woken up)
+            self._wake_event.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wake_event.wait(),
+                    timeout=self.seconds_until_next_due()
+                )
+            except asyncio.TimeoutError:
+                pass
     
-    def stop(self):
-        """Stop the scheduler"""
+    async def stop(self, timeout: float = 5.0):
+        """
+        Stop the scheduler
+        
+        The shared Playwright browser outlives the scheduler and is closed
+        with close_shared_scraper() on application shutdown.
+        """
         logger.info("Stopping scheduler...")
         self.running = False
+        self._wake_event.set()
         
-        # Close Playwright if it was initialized
-        if self.playwright_scraper:
-            asyncio.create_task(self.playwright_scraper.close())
+        # Close the shared HTTP connection pool
+        if self.http_session and not self.http_session.closed:
+            try:
+                await asyncio.wait_for(self.http_session.close(), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"HTTP session did not close within {timeout}s")
         
         self.config_repo.close()
         self.content_repo.close()
@@ -329,7 +516,13 @@ class SourceScheduler:
     
     def get_stats(self) -> dict:
         """Get scheduler statistics"""
-        return self.stats.copy()
+        return {
+            "cycles_completed": self.cycles_completed,
+            "total_sources_fetched": self.total_sources_fetched,
+            "total_items_saved": self.total_items_saved,
+            "errors": self.errors,
+            "last_cycle_time": self.last_cycle_time
+        }
 
 
 # Singleton instance
@@ -340,16 +533,31 @@ def get_scheduler() -> SourceScheduler:
     """Get or create scheduler instance"""
     global _scheduler_instance
     if _scheduler_instance is None:
-        _scheduler_instance = SourceScheduler(check_interval_seconds=60)
+        _scheduler_instance = SourceScheduler(check_interval_seconds=300)
     return _scheduler_instance
 
 
 async def start_scheduler():
     """Start the background scheduler"""
+    create_database(get_database_url())  # Creates/upgrades tables when run standalone
     scheduler = get_scheduler()
-    await scheduler.run()
+    try:
+        await scheduler.run()
+    finally:
+        await scheduler.stop()
+        await close_shared_scraper()
 
 
 if __name__ == "__main__":
+    # Use uvloop when available (installed with uvicorn[standard]); the app
+    # itself already gets it through uvicorn's automatic loop selection
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            logger.info("Using uvloop event loop")
+        except ImportError:
+            pass
+    
     # Run scheduler standalone
     asyncio.run(start_scheduler())
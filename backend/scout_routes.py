@@ -5,23 +5,115 @@ Handles content analysis from browser extension
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict
 from datetime import datetime
 from teams.repository import TeamRepository
+import asyncio
 import json
 import re
-from collections import Counter
+import threading
+import hashlib
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from heapq import nlargest
+from operator import itemgetter
 import spacy
 
-# Load spaCy model once at startup
+# Load spaCy model once at startup (only NER is used, so skip the other components)
 try:
-    nlp = spacy.load("en_core_web_md")
+    nlp = spacy.load(
+        "en_core_web_md",
+        disable=["tagger", "parser", "lemmatizer", "attribute_ruler"]
+    )
 except OSError:
     nlp = None
     print("spaCy model 'en_core_web_md' not found. Please run: python -m spacy download en_core_web_md")
 
-router = APIRouter(prefix="/api/scout", tags=["scouting"])
+# NER on a page saturates well before this; also keeps us under nlp.max_length
+MAX_NER_CHARS = 100_000
+
+# Precompiled once instead of on every /analyze request
+_WORD_RE = re.compile(r'\b[a-z]{4,}\b')
+
+# Common stop words to filter out of keyword counts
+STOP_WORDS = frozenset({
+    'that', 'this', 'with', 'from', 'have', 'been', 'their', 'which',
+    'will', 'would', 'there', 'about', 'them', 'into', 'than', 'more',
+    'could', 'some', 'other', 'then', 'only', 'also', 'these', 'when'
+})
+
+
+class _DigestLRU:
+    """Small LRU cache keyed by a digest of the analyzed text (the text itself is not kept)."""
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()  # Analysis runs in worker threads
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+def _text_digest(text: str) -> bytes:
+    """Fixed-size cache key for a (possibly large) page text."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+# Pages are often re-analyzed (reloads, revisits), so keep recent results
+_keyword_cache = _DigestLRU(maxsize=2048)
+_company_cache = _DigestLRU(maxsize=2048)
+
+# Regex and spaCy work is CPU-bound, so keep it off the event loop
+_ANALYSIS_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="scout-analysis")
+
+# Team list used by /analyze, refreshed at most once per TEAM_CACHE_TTL seconds
+TEAM_CACHE_TTL = 60
+_team_cache = {"teams": None, "loaded_at": 0.0}
+
+
+def get_teams_cached() -> List[Dict]:
+    """Get active teams as plain dicts, reloading from the database when the cache expires"""
+    now = time.monotonic()
+    if _team_cache["teams"] is None or now - _team_cache["loaded_at"] > TEAM_CACHE_TTL:
+        team_repo = TeamRepository()
+        try:
+            teams = [
+                {
+                    "team_key": team.team_key,
+                    "team_name": team.team_name,
+                    "description": team.description or "",
+                    "is_active": team.is_active,
+                }
+                for team in team_repo.get_all_teams()
+            ]
+        finally:
+            team_repo.close()
+        _team_cache["teams"] = teams
+        _team_cache["loaded_at"] = now
+    return _team_cache["teams"]
+
+
+# orjson serializes the per-page analysis responses much faster than stdlib json
+router = APIRouter(
+    prefix="/api/scout",
+    tags=["scouting"],
+    default_response_class=ORJSONResponse
+)
 
 # --- Scouting enabled state ---
 scouting_enabled_state = {"enabled": False}
@@ -41,30 +133,32 @@ async def set_scouting_enabled(payload: dict):
     return {"enabled": enabled}
 
 # Simple keyword extraction without heavy dependencies
-def simple_keyword_extraction(text: str, top_n: int = 10) -> List[Dict]:
-    """Extract keywords using simple frequency analysis"""
-    # Convert to lowercase and split into words
-    words = re.findall(r'\b[a-z]{4,}\b', text.lower())
-    
-    # Common stop words to filter out
-    stop_words = {'that', 'this', 'with', 'from', 'have', 'been', 'their', 'which', 
-                  'will', 'would', 'there', 'about', 'them', 'into', 'than', 'more',
-                  'could', 'some', 'other', 'then', 'only', 'also', 'these', 'when'}
+def simple_keyword_extraction(text: str, top_n: int = 10, lowercased: bool = False) -> List[Dict]:
+    """Extract keywords using simple frequency analysis (pass lowercased=True to skip .lower())"""
+    if not lowercased:
+        text = text.lower()
+    cache_key = (_text_digest(text), top_n)
+    cached = _keyword_cache.get(cache_key)
+    if cached is not None:
+        return [dict(kw) for kw in cached]
     
-    # Filter words
-    filtered_words = [w for w in words if w not in stop_words]
-    
-    # Count frequencies
-    word_counts = Counter(filtered_words)
+    # Count non-stop-words in a single pass over the lowercased text
+    word_counts = defaultdict(int)
+    for match in _WORD_RE.finditer(text):
+        word = match.group()
+        if word not in STOP_WORDS:
+            word_counts[word] += 1
     
     # Get top keywords with normalized scores
-    max_count = max(word_counts.values()) if word_counts else 1
+    top = nlargest(top_n, word_counts.items(), key=itemgetter(1))
+    max_count = top[0][1] if top else 1
     top_keywords = [
         {"keyword": word, "score": count / max_count}
-        for word, count in word_counts.most_common(top_n)
+        for word, count in top
     ]
     
-    return top_keywords
+    _keyword_cache.put(cache_key, tuple(top_keywords))
+    return [dict(kw) for kw in top_keywords]
 
 class ScoutedContent(BaseModel):
     url: str
@@ -85,13 +179,36 @@ class AnalysisResult(BaseModel):
     sentiment: Optional[Dict[str, float]] = None
     company_names: List[str] = []
     analyzed_at: str
+
+
+def _orgs_from_doc(doc) -> List[str]:
+    return list(set(ent.text.strip() for ent in doc.ents if ent.label_ == "ORG"))
+
+
 def extract_company_names(text: str) -> List[str]:
     """Extract company/organization names using spaCy NER."""
     if not nlp:
         return []
-    doc = nlp(text)
-    orgs = set(ent.text.strip() for ent in doc.ents if ent.label_ == "ORG")
-    return list(orgs)
+    text = text[:MAX_NER_CHARS]
+    cache_key = _text_digest(text)
+    cached = _company_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+    orgs = _orgs_from_doc(nlp(text))
+    _company_cache.put(cache_key, tuple(orgs))
+    return orgs
+
+
+def _analyze_text(full_text: str):
+    """
+    Run all text analysis for /analyze (executed in _ANALYSIS_POOL)
+    The text is lowercased once and shared by keyword counting and team indicator matching.
+    """
+    full_text_lower = full_text.lower()
+    extracted_keywords = simple_keyword_extraction(full_text_lower, top_n=20, lowercased=True)
+    indicator_hits = match_team_indicators(full_text_lower)
+    company_names = extract_company_names(full_text)
+    return extracted_keywords, company_names, indicator_hits
 
 
 @router.post("/analyze", response_model=AnalysisResult)
@@ -105,11 +222,12 @@ async def analyze_content(content: ScoutedContent):
         # Combine all text for analysis
         full_text = f"{content.title} {content.description} {' '.join(content.headings)} {content.content}"
 
-        # Extract keywords using simple frequency analysis
-        extracted_keywords = simple_keyword_extraction(full_text, top_n=20)
-
-        # Extract company names (ORG entities)
-        company_names = extract_company_names(full_text)
+        # Extract keywords (frequency analysis), company names (ORG entities)
+        # and team indicator matches
+        loop = asyncio.get_running_loop()
+        extracted_keywords, company_names, indicator_hits = await loop.run_in_executor(
+            _ANALYSIS_POOL, _analyze_text, full_text
+        )
 
         if not extracted_keywords:
             return AnalysisResult(
@@ -123,12 +241,7 @@ async def analyze_content(content: ScoutedContent):
             )
 
         # Get all teams
-        team_repo = TeamRepository()
-        teams = []
-        try:
-            teams = team_repo.get_all_teams()
-        finally:
-            team_repo.close()
+        teams = get_teams_cached()
 
         # Calculate relevance for each team
         team_scores = {}
@@ -137,10 +250,11 @@ async def analyze_content(content: ScoutedContent):
                 continue
 
             team_key = team["team_key"]
-            team_sources = team.get("sources", [])
 
             # Calculate score based on keyword match
-            score = calculate_team_relevance(extracted_keywords, team, full_text)
+            score = calculate_team_relevance(
+                extracted_keywords, team, full_text, indicator_hits
+            )
             team_scores[team_key] = score
 
         # Find best matching team
@@ -171,44 +285,68 @@ async def analyze_content(content: ScoutedContent):
         print(f"Error analyzing content: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
-def calculate_team_relevance(keywords: List[Dict], team: Dict, full_text: str) -> float:
-    """
-    Calculate how relevant content is to a specific team
-    Based on keyword matches and team configuration
-    """
-    team_key = team["team_key"]
-    team_name = team["team_name"].lower()
-    team_desc = team.get("description", "").lower()
-    
-    # Keywords that indicate team relevance
-    team_indicators = {
+# Keywords that indicate team relevance (built once at import, never per request)
+TEAM_INDICATORS = {
+    team_key: frozenset(indicators)
+    for team_key, indicators in {
         "regulator": ["regulation", "compliance", "policy", "government", "law", "legal", "sec", "federal", "mandate"],
         "investor": ["investment", "funding", "venture", "capital", "revenue", "valuation", "ipo", "acquisition", "m&a"],
         "competitor": ["competitor", "market share", "product", "launch", "feature", "pricing", "strategy"],
         "researcher": ["research", "study", "technology", "innovation", "ai", "machine learning", "algorithm", "patent"]
-    }
+    }.items()
+}
+
+# Reverse index so each distinct indicator is looked up in the text only once
+_INDICATOR_TEAMS = {}
+for _team_key, _indicators in TEAM_INDICATORS.items():
+    for _indicator in _indicators:
+        _INDICATOR_TEAMS.setdefault(_indicator, []).append(_team_key)
+
+
+def match_team_indicators(full_text_lower: str) -> Dict[str, int]:
+    """
+    Count indicator matches in the full text for all teams at once
+    Returns a mapping of team_key -> number of its indicators found in the text
+    """
+    hits = defaultdict(int)
+    for indicator, team_keys in _INDICATOR_TEAMS.items():
+        if indicator in full_text_lower:
+            for team_key in team_keys:
+                hits[team_key] += 1
+    return hits
+
+
+def calculate_team_relevance(
+    keywords: List[Dict],
+    team: Dict,
+    full_text: str,
+    indicator_hits: Optional[Dict[str, int]] = None
+) -> float:
+    """
+    Calculate how relevant content is to a specific team
+    Based on keyword matches and team configuration
     
-    indicators = team_indicators.get(team_key, [])
+    indicator_hits can be precomputed with match_team_indicators() when
+    scoring several teams against the same text.
+    """
+    team_key = team["team_key"]
+    indicators = TEAM_INDICATORS.get(team_key, frozenset())
     
     # Calculate score
     score = 0.0
-    keyword_texts = [kw["keyword"].lower() for kw in keywords]
+    keyword_lookup = {}
+    for kw in keywords:
+        keyword_lookup.setdefault(kw["keyword"].lower(), kw["score"])
     
     # Check for indicator matches in keywords
-    for indicator in indicators:
-        for kw_text in keyword_texts:
-            if indicator in kw_text:
-                # Find the keyword's score
-                for kw in keywords:
-                    if kw["keyword"].lower() == kw_text:
-                        score += kw["score"] * 0.5
-                        break
+    for kw_text, kw_score in keyword_lookup.items():
+        matches = sum(1 for indicator in indicators if indicator in kw_text)
+        score += kw_score * 0.5 * matches
     
     # Check for indicator matches in full text
-    full_text_lower = full_text.lower()
-    for indicator in indicators:
-        if indicator in full_text_lower:
-            score += 0.1
+    if indicator_hits is None:
+        indicator_hits = match_team_indicators(full_text.lower())
+    score += 0.1 * indicator_hits.get(team_key, 0)
     
     # Normalize score to 0-1 range
     score = min(score, 1.0)
@@ -5,9 +5,13 @@ Generates both daily keyword files and time-series data.
 """
 
 import requests
-from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
-import json
+import heapq
+import orjson
 from typing import Dict, List, Any
 
 
@@ -16,6 +20,31 @@ API_BASE_URL = "http://localhost:8000"
 OUTPUT_DIR = Path("generated_keywords")
 DAYS_TO_FETCH = 7
 KEYWORDS_PER_DAY = 100
+FETCH_WORKERS = 16
+TIMESERIES_TOP_N = 50  # Keywords in each team's aggregate time-series file
+TIMESERIES_WRITERS = 4
+
+# Shared session so concurrent requests reuse pooled keep-alive connections,
+# retrying transient gateway errors with backoff (the batch POST is a read)
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+)
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS, max_retries=_RETRY))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS, max_retries=_RETRY))
+
+
+def _dump(obj: Any, path: Path):
+    """Write obj to path as indented JSON."""
+    path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
+def _load(path: Path) -> Any:
+    """Read a JSON file."""
+    return orjson.loads(path.read_bytes())
 
 
 def ensure_output_dir():
@@ -28,22 +57,36 @@ def ensure_output_dir():
 
 def get_teams() -> List[Dict[str, Any]]:
     """Fetch all teams from API."""
-    response = requests.get(f"{API_BASE_URL}/api/teams")
+    response = _SESSION.get(f"{API_BASE_URL}/api/teams")
     response.raise_for_status()
     return response.json()["teams"]
 
 
-def fetch_keywords_for_day(team_key: str, date_str: str, limit: int = 100) -> Dict[str, Any]:
-    """Fetch keywords for a specific team and date."""
-    params = {
-        "date": date_str,
-        "team": team_key,
+def daily_file_path(team_key: str, date_str: str) -> Path:
+    """Path of the daily keyword file for a team and date."""
+    return OUTPUT_DIR / "daily" / f"{team_key}_{date_str}.json"
+
+
+def daily_file_is_final(path: Path, date_str: str) -> bool:
+    """Whether a daily file exists and was written after its date ended."""
+    try:
+        written_at = path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    day_end = datetime.combine(date.fromisoformat(date_str) + timedelta(days=1), time.min)
+    return written_at >= day_end.timestamp()
+
+
+def fetch_keywords_for_days(team_key: str, date_strs: List[str], limit: int = 100) -> Dict[str, Dict[str, Any]]:
+    """Fetch keywords for a team for several dates in one request (keyed by date)."""
+    payload = {
+        "queries": [{"date": date_str, "team": team_key} for date_str in date_strs],
         "limit": limit,
         "min_score": 0
     }
-    response = requests.get(f"{API_BASE_URL}/api/keywords", params=params)
+    response = _SESSION.post(f"{API_BASE_URL}/api/keywords/batch", json=payload)
     response.raise_for_status()
-    return response.json()
+    return {result["date"]: result for result in response.json()["results"]}
 
 
 def generate_daily_files():
@@ -59,6 +102,32 @@ def generate_daily_files():
     total_files = 0
     total_keywords = 0
     
+    date_strs = [
+        (start_date + timedelta(days=day_offset)).isoformat()
+        for day_offset in range(DAYS_TO_FETCH)
+    ]
+    
+    # Past days don't change, so a file written after its date ended is
+    # reused. Today, missing days and files written while their date was
+    # still in progress (and so may be partial) are fetched.
+    to_fetch = {
+        team["team_key"]: [
+            date_str for date_str in date_strs
+            if not daily_file_is_final(daily_file_path(team["team_key"], date_str), date_str)
+        ]
+        for team in teams
+    }
+    
+    # One batch request per team (all missing days at once), issued up front;
+    # results are consumed below in order, so output and file writes stay on
+    # this thread
+    executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    futures = {
+        team_key: executor.submit(fetch_keywords_for_days, team_key, missing, KEYWORDS_PER_DAY)
+        for team_key, missing in to_fetch.items()
+        if missing
+    }
+    
     for team in teams:
         team_key = team["team_key"]
         team_name = team["team_name"]
@@ -68,94 +137,149 @@ def generate_daily_files():
         
         team_total = 0
         
-        for day_offset in range(DAYS_TO_FETCH):
-            current_date = start_date + timedelta(days=day_offset)
-            date_str = current_date.strftime('%Y-%m-%d')
+        try:
+            team_results = futures[team_key].result() if team_key in futures else {}
+        except Exception as e:
+            print(f"  ✗ Error - {e}\n")
+            continue
+        
+        for date_str in date_strs:
+            filepath = daily_file_path(team_key, date_str)
+            filename = filepath.name
             
             try:
-                data = fetch_keywords_for_day(team_key, date_str, KEYWORDS_PER_DAY)
-                
-                # Save to file
-                filename = f"{team_key}_{date_str}.json"
-                filepath = OUTPUT_DIR / "daily" / filename
-                
-                with open(filepath, 'w') as f:
-                    json.dump(data, f, indent=2)
+                if date_str in team_results:
+                    data = team_results[date_str]
+                    _dump(data, filepath)
+                    status = "✓"
+                else:
+                    # Already exported on an earlier run
+                    data = _load(filepath)
+                    status = "↺"
                 
                 keyword_count = data["count"]
                 team_total += keyword_count
                 total_keywords += keyword_count
                 total_files += 1
                 
-                print(f"  ✓ {date_str}: {keyword_count:3d} keywords → {filename}")
+                print(f"  {status} {date_str}: {keyword_count:3d} keywords → {filename}")
                 
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 404:
-                    print(f"  ⊘ {date_str}: No data available")
-                else:
-                    print(f"  ✗ {date_str}: Error - {e}")
             except Exception as e:
                 print(f"  ✗ {date_str}: Error - {e}")
         
         print(f"  Total: {team_total} keywords\n")
     
+    executor.shutdown()
+    
     print("="*80)
     print(f"✓ Generated {total_files} daily files with {total_keywords} total keywords")
     print("="*80)
 
 
-def build_timeseries_from_daily_files(team_key: str) -> Dict[str, Any]:
-    """Build time-series data from daily keyword files."""
-    daily_dir = OUTPUT_DIR / "daily"
-    team_files = sorted(daily_dir.glob(f"{team_key}_*.json"))
+class KeywordStat:
+    """Running time-series statistics for one keyword (slotted: no per-instance dict)."""
+    
+    __slots__ = (
+        "keyword", "team_key", "points", "appearances", "sum_importance",
+        "max_importance", "total_frequency", "total_documents",
+    )
+    
+    def __init__(self, keyword: str, team_key: str):
+        self.keyword = keyword
+        self.team_key = team_key
+        self.points = []
+        self.appearances = 0
+        self.sum_importance = 0.0
+        self.max_importance = float("-inf")
+        self.total_frequency = 0
+        self.total_documents = 0
     
-    if not team_files:
-        return {}
+    def add(self, date_str: str, importance: float, sentiment: float, frequency: int, document_count: int):
+        """Record one day's data point and update the running statistics."""
+        self.points.append((date_str, importance, sentiment, frequency, document_count))
+        self.appearances += 1
+        self.sum_importance += importance
+        if importance > self.max_importance:
+            self.max_importance = importance
+        self.total_frequency += frequency
+        self.total_documents += document_count
     
-    # Track each keyword across days
-    keyword_timeseries = {}
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON output for this keyword, with data points in date order."""
+        return {
+            "keyword": self.keyword,
+            "team_key": self.team_key,
+            "data_points": [
+                {
+                    "date": date_str,
+                    "importance_score": importance,
+                    "sentiment_score": sentiment,
+                    "frequency": frequency,
+                    "document_count": document_count
+                }
+                for date_str, importance, sentiment, frequency, document_count in sorted(self.points)
+            ],
+            "appearances": self.appearances,
+            "avg_importance": self.sum_importance / self.appearances,
+            "max_importance": self.max_importance,
+            "total_frequency": self.total_frequency,
+            "total_documents": self.total_documents,
+        }
+
+
+def add_daily_file_to_timeseries(keyword_timeseries: Dict[str, KeywordStat], data: Dict[str, Any], team_key: str):
+    """Add one daily keyword file's data points to a team's time-series."""
+    date_str = data["date"]
     
-    for filepath in team_files:
-        with open(filepath) as f:
-            data = json.load(f)
+    for kw in data["keywords"]:
+        keyword_text = kw["keyword"]
         
-        date_str = data["date"]
+        stat = keyword_timeseries.get(keyword_text)
+        if stat is None:
+            stat = keyword_timeseries[keyword_text] = KeywordStat(keyword_text, team_key)
         
-        for kw in data["keywords"]:
-            keyword_text = kw["keyword"]
-            
-            if keyword_text not in keyword_timeseries:
-                keyword_timeseries[keyword_text] = {
-                    "keyword": keyword_text,
-                    "team_key": team_key,
-                    "data_points": []
-                }
-            
-            # Add data point for this date
-            keyword_timeseries[keyword_text]["data_points"].append({
-                "date": date_str,
-                "importance_score": kw["importance_score"],
-                "sentiment_score": kw["sentiment"]["score"],
-                "frequency": kw["metrics"]["frequency"],
-                "document_count": kw["metrics"]["document_count"]
-            })
+        metrics = kw["metrics"]
+        stat.add(
+            date_str,
+            kw["importance_score"],
+            kw["sentiment"]["score"],
+            metrics["frequency"],
+            metrics["document_count"],
+        )
+
+
+def scan_daily_files() -> tuple:
+    """
+    Read every daily keyword file exactly once.
     
-    # Calculate statistics for each keyword
-    for kw_data in keyword_timeseries.values():
-        points = kw_data["data_points"]
-        kw_data["appearances"] = len(points)
-        kw_data["avg_importance"] = sum(p["importance_score"] for p in points) / len(points)
-        kw_data["max_importance"] = max(p["importance_score"] for p in points)
-        kw_data["total_frequency"] = sum(p["frequency"] for p in points)
-        kw_data["total_documents"] = sum(p["document_count"] for p in points)
+    Feeds both the time-series and the summary stage, so neither has to
+    re-read the files. Each file is folded into the time-series and the
+    summary as soon as it is parsed, so only the fields those need are
+    kept (snippets, content IDs etc. are dropped with the parsed file).
+    
+    Returns:
+        (keyword time-series per team, summary statistics per team)
+    """
+    timeseries_by_team = {}
+    team_stats = {}
+    
+    for filepath in sorted((OUTPUT_DIR / "daily").glob("*.json")):
+        data = _load(filepath)
+        team_key = data["team"]
+        
+        add_daily_file_to_timeseries(timeseries_by_team.setdefault(team_key, {}), data, team_key)
         
-        # Sort data points by date
-        kw_data["data_points"].sort(key=lambda x: x["date"])
+        if team_key not in team_stats:
+            team_stats[team_key] = {"files": 0, "total_keywords": 0, "dates": set()}
+        
+        team_stats[team_key]["files"] += 1
+        team_stats[team_key]["total_keywords"] += data["count"]
+        team_stats[team_key]["dates"].add(data["date"])
     
-    return keyword_timeseries
+    return timeseries_by_team, team_stats
 
 
-def generate_timeseries_files():
+def generate_timeseries_files(timeseries_by_team: Dict[str, Dict[str, KeywordStat]]):
     """Generate time-series JSON files for top keywords per team."""
     print("\n" + "="*80)
     print("GENERATING TIME-SERIES FILES")
@@ -164,62 +288,70 @@ def generate_timeseries_files():
     teams = get_teams()
     total_files = 0
     
-    for team in teams:
-        team_key = team["team_key"]
-        team_name = team["team_name"]
-        
-        print(f"📈 {team_name} ({team_key})")
-        print("-" * 80)
-        
-        # Build time-series from daily files
-        timeseries_data = build_timeseries_from_daily_files(team_key)
-        
-        if not timeseries_data:
-            print(f"  ⊘ No data available\n")
-            continue
-        
-        # Sort keywords by consistency (appearances) and importance
-        sorted_keywords = sorted(
-            timeseries_data.values(),
-            key=lambda x: (x["appearances"], x["max_importance"]),
-            reverse=True
-        )
+    # Files are serialized and written by a small pool while the next team
+    # is prepared; results are checked at the end so errors still surface
+    with ThreadPoolExecutor(max_workers=TIMESERIES_WRITERS) as writer:
+        writes = []
         
-        # Save aggregate file with all keywords
-        aggregate_file = OUTPUT_DIR / "timeseries" / f"{team_key}_timeseries_all.json"
-        with open(aggregate_file, 'w') as f:
-            json.dump({
+        for team in teams:
+            team_key = team["team_key"]
+            team_name = team["team_name"]
+            
+            print(f"📈 {team_name} ({team_key})")
+            print("-" * 80)
+            
+            # Time-series built from the daily files by scan_daily_files()
+            timeseries_data = timeseries_by_team.get(team_key, {})
+            
+            if not timeseries_data:
+                print(f"  ⊘ No data available\n")
+                continue
+            
+            # Top keywords by consistency (appearances) and importance; only the
+            # top 50 are written, so select them instead of sorting everything
+            sorted_keywords = heapq.nlargest(
+                TIMESERIES_TOP_N,
+                timeseries_data.values(),
+                key=lambda x: (x.appearances, x.max_importance)
+            )
+            
+            # Save aggregate file with all keywords
+            aggregate_file = OUTPUT_DIR / "timeseries" / f"{team_key}_timeseries_all.json"
+            keyword_dicts = [stat.to_dict() for stat in sorted_keywords]
+            writes.append(writer.submit(_dump, {
                 "team_key": team_key,
                 "team_name": team_name,
-                "total_keywords": len(sorted_keywords),
-                "keywords": sorted_keywords[:50]  # Top 50
-            }, f, indent=2)
-        
-        print(f"  ✓ All keywords: {len(sorted_keywords)} total → {aggregate_file.name}")
-        total_files += 1
-        
-        # Save individual files for top 10 keywords
-        for i, kw_data in enumerate(sorted_keywords[:10], 1):
-            keyword_safe = kw_data["keyword"].replace(" ", "_").replace("/", "-")
-            filename = f"{team_key}_{keyword_safe}_timeseries.json"
-            filepath = OUTPUT_DIR / "timeseries" / filename
+                "total_keywords": len(timeseries_data),
+                "keywords": keyword_dicts
+            }, aggregate_file))
             
-            with open(filepath, 'w') as f:
-                json.dump(kw_data, f, indent=2)
-            
-            print(f"  {i:2d}. '{kw_data['keyword']}': {kw_data['appearances']} days, "
-                  f"avg score {kw_data['avg_importance']:.2f} → {filename}")
+            print(f"  ✓ All keywords: {len(timeseries_data)} total → {aggregate_file.name}")
             total_files += 1
+            
+            # Save individual files for top 10 keywords
+            for i, kw_data in enumerate(keyword_dicts[:10], 1):
+                keyword_safe = kw_data["keyword"].replace(" ", "_").replace("/", "-")
+                filename = f"{team_key}_{keyword_safe}_timeseries.json"
+                filepath = OUTPUT_DIR / "timeseries" / filename
+                
+                writes.append(writer.submit(_dump, kw_data, filepath))
+                
+                print(f"  {i:2d}. '{kw_data['keyword']}': {kw_data['appearances']} days, "
+                      f"avg score {kw_data['avg_importance']:.2f} → {filename}")
+                total_files += 1
+            
+            print()
         
-        print()
+        for write in writes:
+            write.result()
     
     print("="*80)
     print(f"✓ Generated {total_files} time-series files")
     print("="*80)
 
 
-def generate_summary():
-    """Generate summary statistics file."""
+def generate_summary(team_stats: Dict[str, Dict[str, Any]]):
+    """Generate summary statistics file from scan_daily_files() statistics."""
     print("\n" + "="*80)
     print("GENERATING SUMMARY")
     print("="*80 + "\n")
@@ -227,23 +359,9 @@ def generate_summary():
     daily_dir = OUTPUT_DIR / "daily"
     timeseries_dir = OUTPUT_DIR / "timeseries"
     
-    daily_files = list(daily_dir.glob("*.json"))
+    daily_file_count = sum(stats["files"] for stats in team_stats.values())
     timeseries_files = list(timeseries_dir.glob("*.json"))
     
-    # Count keywords by team
-    team_stats = {}
-    for filepath in daily_files:
-        with open(filepath) as f:
-            data = json.load(f)
-        
-        team_key = data["team"]
-        if team_key not in team_stats:
-            team_stats[team_key] = {"files": 0, "total_keywords": 0, "dates": set()}
-        
-        team_stats[team_key]["files"] += 1
-        team_stats[team_key]["total_keywords"] += data["count"]
-        team_stats[team_key]["dates"].add(data["date"])
-    
     # Convert sets to lists for JSON serialization
     for stats in team_stats.values():
         stats["dates"] = sorted(list(stats["dates"]))
@@ -252,7 +370,7 @@ def generate_summary():
     summary = {
         "generated_at": date.today().isoformat(),
         "days_covered": DAYS_TO_FETCH,
-        "total_daily_files": len(daily_files),
+        "total_daily_files": daily_file_count,
         "total_timeseries_files": len(timeseries_files),
         "team_statistics": team_stats,
         "directories": {
@@ -262,11 +380,10 @@ def generate_summary():
     }
     
     summary_file = OUTPUT_DIR / "summary.json"
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    _dump(summary, summary_file)
     
     print(f"Summary Statistics:")
-    print(f"  Daily files:      {len(daily_files)}")
+    print(f"  Daily files:      {daily_file_count}")
     print(f"  Time-series files: {len(timeseries_files)}")
     print(f"  Teams processed:   {len(team_stats)}")
     print(f"  Days covered:      {DAYS_TO_FETCH}")
@@ -298,8 +415,9 @@ def main():
     try:
         ensure_output_dir()
         generate_daily_files()
-        generate_timeseries_files()
-        generate_summary()
+        timeseries_by_team, team_stats = scan_daily_files()
+        generate_timeseries_files(timeseries_by_team)
+        generate_summary(team_stats)
         
         print("\n" + "="*80)
         print("✅ EXPORT COMPLETE")
@@ -6,6 +6,7 @@ This populates the data lake with content from all teams' sources.
 """
 
 import asyncio
+import aiohttp
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -24,13 +25,17 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def fetch_all_sources(max_entries_per_source: int = 50, days_back: int = 7):
+async def fetch_all_sources(max_entries_per_source: int = 50, days_back: int = 7, max_concurrency: int = 8):
     """
     Fetch content from all configured sources.
     
+    Each unique source is fetched once, concurrently, and results are saved
+    afterwards in source order.
+    
     Args:
         max_entries_per_source: Maximum entries to fetch per source
         days_back: Only keep content from last N days
+        max_concurrency: Maximum number of sources fetched at the same time
     """
     logger.info("=" * 80)
     logger.info("FETCHING FROM ALL CONFIGURED SOURCES")
@@ -67,24 +72,43 @@ async def fetch_all_sources(max_entries_per_source: int = 50, days_back: int = 7
     logger.info(f"Found {len(sources_to_fetch)} unique sources to fetch from")
     logger.info("")
     
-    # Fetch from each source
+    # Fetch every source concurrently over one pooled HTTP session
     total_new = 0
     total_duplicates = 0
     cutoff_date = datetime.now() - timedelta(days=days_back)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=30),
+        connector=aiohttp.TCPConnector(limit=max_concurrency * 2),
+    ) as session:
+        
+        async def fetch_one(source_name, source_url):
+            async with semaphore:
+                sourcer = RSSSourcer(
+                    feed_url=source_url,
+                    name=source_name,
+                    max_entries=max_entries_per_source,
+                    session=session
+                )
+                return await sourcer.fetch()
+        
+        fetch_results = await asyncio.gather(
+            *(fetch_one(source_name, source_url) for source_name, source_url in sources_to_fetch),
+            return_exceptions=True
+        )
     
-    for idx, ((source_name, source_url), source_info) in enumerate(sources_to_fetch.items(), 1):
-        logger.info(f"[{idx}/{len(sources_to_fetch)}] Fetching: {source_name}")
+    # Save results one source at a time (single writer, readable log order)
+    for idx, (((source_name, source_url), source_info), contents) in enumerate(
+        zip(sources_to_fetch.items(), fetch_results), 1
+    ):
+        logger.info(f"[{idx}/{len(sources_to_fetch)}] Fetched: {source_name}")
         logger.info(f"  URL: {source_url}")
         logger.info(f"  Used by: {', '.join(source_info['teams'])}")
         
         try:
-            sourcer = RSSSourcer(
-                feed_url=source_url,
-                name=source_name,
-                max_entries=max_entries_per_source
-            )
-            
-            contents = await sourcer.fetch()
+            if isinstance(contents, Exception):
+                raise contents
             
             # Filter for recent content only
             recent_contents = [
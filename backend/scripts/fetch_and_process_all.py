@@ -5,12 +5,12 @@ Runs in foreground with verbose logging.
 """
 
 import sys
-import json
 import logging
 import asyncio
+import functools
+import orjson
 from pathlib import Path
 from datetime import datetime, timedelta
-from collections import defaultdict
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -27,12 +27,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sources fetched at the same time (protects origin servers)
+MAX_CONCURRENT_FETCHES = 8
 
+
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.json"""
+    """Load configuration from config.json (parsed once per run)"""
     config_path = Path(__file__).parent.parent / "config.json"
-    with open(config_path) as f:
-        return json.load(f)
+    return orjson.loads(config_path.read_bytes())
+
+
+@functools.lru_cache(maxsize=1)
+def load_active_teams():
+    """Active teams from config.json, keyed by team_key"""
+    return {team["team_key"]: team for team in load_config()["teams"] if team.get("is_active", True)}
 
 
 async def fetch_from_source(source_config: dict, team_key: str, team_name: str):
@@ -59,28 +68,18 @@ async def fetch_from_source(source_config: dict, team_key: str, team_name: str):
         
         logger.info(f"✓ Fetched {len(items)} items from {source_name}")
         
-        # Save to database
+        # Save to database (one hash lookup and one commit for the whole batch)
         session = get_session()
         repo = ContentRepository(session)
-        saved_count = 0
-        duplicate_count = 0
-        
-        for item in items:
-            _, is_new = repo.save_content(
-                content=item,
-                source_type=source_type,
-                source_name=source_name,
-                source_url=source_url
-            )
-            if is_new:
-                saved_count += 1
-            else:
-                duplicate_count += 1
-        
-        session.commit()
+        stats = repo.save_batch(
+            items,
+            source_type=source_type,
+            source_name=source_name,
+            source_url=source_url
+        )
         session.close()
         
-        logger.info(f"✓ Saved {saved_count} new documents, {duplicate_count} duplicates from {source_name}")
+        logger.info(f"✓ Saved {stats['saved']} new documents, {stats['duplicates']} duplicates from {source_name}")
         return items
         
     except Exception as e:
@@ -90,15 +89,15 @@ async def fetch_from_source(source_config: dict, team_key: str, team_name: str):
 
 async def fetch_all_sources():
     """Fetch from all sources in config."""
-    config = load_config()
-    
     total_fetched = 0
     total_saved = 0
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
     
-    for team in config["teams"]:
-        if not team.get("is_active", True):
-            continue
-        
+    async def fetch_guarded(source, team_key, team_name):
+        async with semaphore:
+            return await fetch_from_source(source, team_key, team_name)
+    
+    for team in load_active_teams().values():
         team_key = team["team_key"]
         team_name = team["team_name"]
         
@@ -106,8 +105,16 @@ async def fetch_all_sources():
         logger.info(f"PROCESSING TEAM: {team_name}")
         logger.info(f"{'='*80}")
         
-        for source in team["sources"]:
-            items = await fetch_from_source(source, team_key, team_name)
+        # Feeds are network-bound, so fetch the team's sources concurrently
+        # (each fetch_from_source uses its own database session)
+        results = await asyncio.gather(
+            *(fetch_guarded(source, team_key, team_name) for source in team["sources"]),
+            return_exceptions=True
+        )
+        for items in results:
+            if isinstance(items, Exception):
+                logger.error(f"✗ Source fetch failed: {items}")
+                continue
             total_fetched += len(items)
     
     logger.info(f"\n{'='*80}")
@@ -123,8 +130,7 @@ def process_keywords():
     logger.info(f"{'='*80}\n")
     
     # Load config for team information
-    config = load_config()
-    teams = {team["team_key"]: team for team in config["teams"] if team.get("is_active", True)}
+    teams = load_active_teams()
     
     # Get documents from last 7 days
     session = get_session()
@@ -147,15 +153,8 @@ def process_keywords():
         # Get team sources
         team_source_names = [s["source_name"].lower() for s in team_info["sources"]]
         
-        # Get all documents
-        all_docs = repo.get_content_by_date_range(start_date, end_date)
-        
-        # Filter by team sources
-        team_docs = []
-        for doc in all_docs:
-            doc_source_name = (doc.source_name or '').lower()
-            if any(team_src in doc_source_name for team_src in team_source_names):
-                team_docs.append(doc)
+        # Get this team's documents (source matching happens in SQL)
+        team_docs = repo.get_content_by_sources(team_source_names, start_date, end_date)
         
         logger.info(f"Found {len(team_docs)} documents for {team_info['team_name']}")
         
@@ -163,41 +162,30 @@ def process_keywords():
             logger.warning(f"No documents to process for {team_info['team_name']}")
             continue
         
-        # Group by date
-        docs_by_date = {}
-        for doc in team_docs:
-            date_key = doc.published_date.date() if doc.published_date else datetime.now().date()
-            if date_key not in docs_by_date:
-                docs_by_date[date_key] = []
-            docs_by_date[date_key].append(doc)
-        
-        # Process all documents for this team
-        successful = 0
-        failed = 0
-        total_keywords = 0
-        
-        for doc in team_docs:
-            try:
-                extraction_date = doc.published_date.date() if doc.published_date else datetime.now().date()
-                
-                result = processor.process_content(
-                    content_id=doc.id,
-                    title=doc.title or "",
-                    content=doc.content or "",
-                    source_type=doc.source_type,
-                    source_name=doc.source_name,
-                    published_date=doc.published_date,
-                    extraction_date=extraction_date,
-                    team_key=team_key,
-                )
-                
-                if result.get('keywords_extracted', 0) > 0:
-                    successful += 1
-                    total_keywords += result['keywords_extracted']
-                    
-            except Exception as e:
-                logger.error(f"Error processing document {doc.id}: {str(e)}")
-                failed += 1
+        # Process all documents for this team in one batch (keywords are
+        # extracted with spaCy's nlp.pipe; importance is calculated below).
+        # This is the only pass over team_docs; per-date grouping happens
+        # inside calculate_importance_by_date().
+        today = datetime.now().date()
+        content_items = [
+            {
+                'id': doc.id,
+                'title': doc.title or "",
+                'content': doc.content or "",
+                'source_type': doc.source_type,
+                'source_name': doc.source_name,
+                'published_date': doc.published_date,
+                'extraction_date': doc.published_date.date() if doc.published_date else today,
+            }
+            for doc in team_docs
+        ]
+        batch_result = processor.process_batch(
+            content_items,
+            team_key=team_key,
+            calculate_importance=False,
+        )
+        successful = batch_result['successful']
+        total_keywords = batch_result['keywords_extracted']
         
         logger.info(f"✓ Processed {successful}/{len(team_docs)} documents, extracted {total_keywords} keywords")
         
@@ -205,18 +193,13 @@ def process_keywords():
         if processor.keyword_cache:
             logger.info(f"Calculating importance for {len(processor.keyword_cache)} unique keywords...")
             
-            # Group by date for importance calculation
-            for process_date in sorted(docs_by_date.keys()):
-                logger.info(f"Calculating importance for {process_date}...")
-                result = processor.calculate_importance_and_sentiment(
-                    analysis_date=process_date,
-                    team_key=team_key,
-                    min_frequency=1
-                )
-                logger.info(f"✓ Saved {result['keywords_saved']} importance records for {process_date}")
+            # Importance per published date, from one pass over the cache
+            results = processor.calculate_importance_by_date(team_key=team_key, min_frequency=1)
+            for process_date, result in results.items():
+                logger.info(f"✓ Saved {result.get('keywords_saved', 0)} importance records for {process_date}")
             
             # Clear cache for next team
-            processor.keyword_cache = defaultdict(lambda: {'frequency': 0, 'documents': [], 'content_ids': []})
+            processor.reset_cache()
     
     session.close()
     
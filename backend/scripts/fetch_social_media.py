@@ -6,9 +6,12 @@ and stores it in the database for keyword extraction and analysis.
 """
 
 import asyncio
+import math
 import os
 import sys
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import List, Dict, Any
 from pathlib import Path
 
@@ -17,12 +20,94 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
     from sourcers import RedditSourcer, TwitterSourcer
-    from storage import ArticleRepository
+    from storage import ContentRepository
     SOURCERS_AVAILABLE = True
 except ImportError as e:
     print(f"⚠️  Import error: {e}")
     SOURCERS_AVAILABLE = False
 
+# Concurrent fetches per platform (each platform is a separate host)
+REDDIT_CONCURRENCY = 8
+TWITTER_CONCURRENCY = 8
+
+# Request budgets per platform: (requests, period in seconds)
+REDDIT_RATE_LIMIT = (60, 60)   # Reddit API allows 60 requests/minute
+TWITTER_RATE_LIMIT = (30, 60)  # Be gentle with public Nitter instances
+
+# Requests a rate limiter lets through back to back before pacing starts
+RATE_LIMIT_BURST = 2
+
+# Items per API request, used to charge each fetch for the requests it makes
+REDDIT_PAGE_SIZE = 100  # Reddit listings return at most 100 posts per call
+TWITTER_PAGE_SIZE = 20  # Nitter search/timeline pages hold about 20 tweets
+
+# Only posts this recent can show up in hot/new/top-of-week listings again,
+# so older stored URLs aren't loaded for deduplication
+SEEN_URL_DAYS = 14
+
+# Retries for rate-limited (HTTP 429) fetches
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 5
+
+
+class RateLimiter:
+    """
+    Async token bucket.
+    
+    Refills at ``max_rate / time_period`` tokens per second and holds at
+    most ``burst`` tokens, so after a short burst requests are paced
+    evenly across the period instead of sleeping a fixed amount between
+    them. A fetch that makes several API requests takes one token per
+    request; the bucket may go into debt, which later callers wait off.
+    """
+    
+    def __init__(self, max_rate: int, time_period: float = 60, burst: int = RATE_LIMIT_BURST):
+        self.capacity = float(min(burst, max_rate))
+        self.rate = max_rate / time_period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self, tokens: int = 1):
+        """Wait until a token is available, then take ``tokens`` of them."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= tokens
+                    return
+                
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """
+    Whether a sourcer error was caused by an HTTP 429 response.
+    
+    Sourcers re-raise client errors wrapped in a generic Exception, so the
+    status code is looked up along the exception chain: ``status_code`` or
+    ``status`` on the error itself (aiohttp) or on its ``response``
+    (requests, prawcore).
+    """
+    while error is not None:
+        response = getattr(error, "response", None)
+        for holder in (error, response):
+            status = getattr(holder, "status_code", None) or getattr(holder, "status", None)
+            if status == 429:
+                return True
+        error = error.__cause__ or error.__context__
+    return False
+
 
 class SocialMediaConfig:
     """Configuration for social media data collection."""
@@ -135,6 +220,14 @@ class SocialMediaConfig:
             "enabled": True,
         },
     ]
+    
+    # Enabled sources, filtered once; configs are read-only views
+    REDDIT_SOURCES_ENABLED = tuple(
+        MappingProxyType(c) for c in REDDIT_SOURCES if c.get("enabled", True)
+    )
+    TWITTER_SOURCES_ENABLED = tuple(
+        MappingProxyType(c) for c in TWITTER_SOURCES if c.get("enabled", True)
+    )
 
 
 class SocialMediaFetcher:
@@ -148,6 +241,18 @@ class SocialMediaFetcher:
             "sources_processed": 0,
             "start_time": datetime.now(),
         }
+        self.reddit_semaphore = asyncio.Semaphore(REDDIT_CONCURRENCY)
+        self.twitter_semaphore = asyncio.Semaphore(TWITTER_CONCURRENCY)
+        self.reddit_limiter = RateLimiter(*REDDIT_RATE_LIMIT)
+        self.repo = ContentRepository()
+        
+        # URLs recently stored or saved this run; overlapping subreddits
+        # often share links, which would otherwise be saved again
+        self.seen_urls = self.repo.get_urls(
+            source_types=("reddit", "twitter"),
+            published_since=datetime.now() - timedelta(days=SEEN_URL_DAYS),
+        )
+        self.twitter_limiter = RateLimiter(*TWITTER_RATE_LIMIT)
         self.check_credentials()
     
     def check_credentials(self):
@@ -161,6 +266,28 @@ class SocialMediaFetcher:
             print("Set REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET environment variables")
             print("Get credentials at: https://www.reddit.com/prefs/apps\n")
     
+    @staticmethod
+    async def _run_fetch(sourcer, limiter: RateLimiter, requests: int = 1) -> List[Any]:
+        """
+        Run a sourcer's fetch_sync() in a worker thread under a rate limit.
+        
+        PRAW and ntscraper make blocking HTTP calls, so awaiting fetch()
+        directly would stall the event loop and serialize every source.
+        Each attempt takes ``requests`` tokens (the API calls it makes).
+        Rate-limited attempts are retried with exponential backoff.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            await limiter.acquire(requests)
+            try:
+                return await asyncio.to_thread(sourcer.fetch_sync)
+            except Exception as e:
+                if attempt == MAX_RETRIES or not is_rate_limited(e):
+                    raise
+            
+            delay = RETRY_BACKOFF_SECONDS * (2 ** attempt)
+            print(f"  ⏳ Rate limited, retrying in {delay}s...")
+            await asyncio.sleep(delay)
+    
     async def fetch_reddit(self, config: Dict[str, Any]) -> List[Any]:
         """Fetch posts from Reddit."""
         if not self.reddit_available:
@@ -175,16 +302,18 @@ class SocialMediaFetcher:
                 time_filter=config.get("time_filter", "day"),
             )
             
-            print(f"  📥 Fetching from r/{config['subreddit']}...", end=" ")
-            contents = await sourcer.fetch()
-            print(f"✓ {len(contents)} posts")
+            print(f"  📥 Fetching from r/{config['subreddit']}...")
+            contents = await self._run_fetch(
+                sourcer, self.reddit_limiter, math.ceil(config["limit"] / REDDIT_PAGE_SIZE)
+            )
+            print(f"  ✓ r/{config['subreddit']}: {len(contents)} posts")
             
             return contents
             
         except Exception as e:
             error_msg = f"Reddit r/{config['subreddit']}: {str(e)}"
             self.stats["errors"].append(error_msg)
-            print(f"✗ Error: {e}")
+            print(f"  ✗ r/{config['subreddit']}: {e}")
             return []
     
     async def fetch_twitter(self, config: Dict[str, Any]) -> List[Any]:
@@ -204,52 +333,64 @@ class SocialMediaFetcher:
                 f"@{config.get('username')}" or 
                 f"#{config.get('hashtag')}"
             )
-            print(f"  🐦 Fetching tweets: {query_display[:50]}...", end=" ")
+            print(f"  🐦 Fetching tweets: {query_display[:50]}...")
             
-            contents = await sourcer.fetch()
-            print(f"✓ {len(contents)} tweets")
+            contents = await self._run_fetch(
+                sourcer, self.twitter_limiter, math.ceil(config["max_tweets"] / TWITTER_PAGE_SIZE)
+            )
+            print(f"  ✓ {config['name']}: {len(contents)} tweets")
             
             return contents
             
         except Exception as e:
             error_msg = f"Twitter {config['name']}: {str(e)}"
             self.stats["errors"].append(error_msg)
-            print(f"✗ Error: {e}")
+            print(f"  ✗ {config['name']}: {e}")
             return []
     
-    async def store_content(self, contents: List[Any], source_type: str, source_name: str):
-        """Store content in the database."""
+    async def store_content(self, contents: List[Any], source_type: str, source_name: str, source_url: str):
+        """Store content in the database (one transaction per source)."""
         if not contents:
             return
         
+        fetched = len(contents)
+        new_contents = []
+        batch_urls = set()
+        for content in contents:
+            if content.url:
+                if content.url in self.seen_urls or content.url in batch_urls:
+                    continue
+                batch_urls.add(content.url)
+            new_contents.append(content)
+        contents = new_contents
+        
+        if not contents:
+            print(f"  💾 Stored 0/{fetched} items (all already seen)")
+            return
+        
         try:
-            repo = ArticleRepository()
-            stored = 0
-            
             for content in contents:
-                try:
-                    # Store article with metadata
-                    # Note: Adjust this based on your actual ArticleRepository implementation
-                    await repo.store_article(
-                        title=content.title,
-                        content=content.content,
-                        url=content.url,
-                        source=f"{source_type}:{source_name}",
-                        author=content.author,
-                        published_date=content.published_date,
-                        metadata={
-                            **content.metadata,
-                            "platform": source_type,
-                            "source_name": source_name,
-                        }
-                    )
-                    stored += 1
-                except Exception as e:
-                    # Skip individual items that fail
-                    continue
+                content.metadata = {
+                    **content.metadata,
+                    "platform": source_type,
+                    "source_name": source_name,
+                }
+            
+            # Deduplicates by content hash and commits all new rows at once
+            result = self.repo.save_batch(
+                contents,
+                source_type=source_type,
+                source_name=source_name,
+                source_url=source_url,
+            )
             
+            # Only marked as seen once saved, so a failed save is retried
+            # when another source returns the same posts
+            self.seen_urls.update(batch_urls)
+            
+            stored = result['saved']
             self.stats["total_stored"] += stored
-            print(f"  💾 Stored {stored}/{len(contents)} items")
+            print(f"  💾 Stored {stored}/{fetched} items ({fetched - stored} duplicates)")
             
         except Exception as e:
             error_msg = f"Storage for {source_name}: {str(e)}"
@@ -266,21 +407,29 @@ class SocialMediaFetcher:
             print("⊘ Skipped (credentials not configured)")
             return
         
-        for config in SocialMediaConfig.REDDIT_SOURCES:
-            if not config.get("enabled", True):
-                print(f"  ⊘ Skipped: r/{config['subreddit']} (disabled)")
-                continue
-            
+        enabled = SocialMediaConfig.REDDIT_SOURCES_ENABLED
+        skipped = len(SocialMediaConfig.REDDIT_SOURCES) - len(enabled)
+        if skipped:
+            print(f"  ⊘ Skipped {skipped} disabled subreddit(s)")
+        
+        # Fetch all subreddits concurrently (bounded by reddit_semaphore)
+        await asyncio.gather(*(self._fetch_and_store_reddit(config) for config in enabled))
+    
+    async def _fetch_and_store_reddit(self, config: Dict[str, Any]):
+        """Fetch and store a single Reddit source."""
+        async with self.reddit_semaphore:
             self.stats["sources_processed"] += 1
             contents = await self.fetch_reddit(config)
             self.stats["total_fetched"] += len(contents)
             
             # Store in database
             if contents:
-                await self.store_content(contents, "reddit", f"r/{config['subreddit']}")
-            
-            # Small delay to respect rate limits
-            await asyncio.sleep(2)
+                await self.store_content(
+                    contents,
+                    "reddit",
+                    f"r/{config['subreddit']}",
+                    f"https://www.reddit.com/r/{config['subreddit']}",
+                )
     
     async def fetch_all_twitter(self):
         """Fetch from all configured Twitter sources."""
@@ -288,11 +437,17 @@ class SocialMediaFetcher:
         print("🐦 FETCHING TWITTER DATA")
         print("=" * 70)
         
-        for config in SocialMediaConfig.TWITTER_SOURCES:
-            if not config.get("enabled", True):
-                print(f"  ⊘ Skipped: {config['name']} (disabled)")
-                continue
-            
+        enabled = SocialMediaConfig.TWITTER_SOURCES_ENABLED
+        skipped = len(SocialMediaConfig.TWITTER_SOURCES) - len(enabled)
+        if skipped:
+            print(f"  ⊘ Skipped {skipped} disabled search(es)")
+        
+        # Fetch all searches concurrently (bounded by twitter_semaphore)
+        await asyncio.gather(*(self._fetch_and_store_twitter(config) for config in enabled))
+    
+    async def _fetch_and_store_twitter(self, config: Dict[str, Any]):
+        """Fetch and store a single Twitter source."""
+        async with self.twitter_semaphore:
             self.stats["sources_processed"] += 1
             contents = await self.fetch_twitter(config)
             self.stats["total_fetched"] += len(contents)
@@ -304,10 +459,11 @@ class SocialMediaFetcher:
                     config.get("username") or 
                     config.get("hashtag")
                 )
-                await self.store_content(contents, "twitter", config["name"])
-            
-            # Delay to respect rate limits and Nitter instances
-            await asyncio.sleep(5)
+                await self.store_content(contents, "twitter", config["name"], f"twitter:{config['mode']}:{query}")
+    
+    def close(self):
+        """Close the database session."""
+        self.repo.close()
     
     def print_summary(self):
         """Print collection summary."""
@@ -348,12 +504,14 @@ async def main():
     
     fetcher = SocialMediaFetcher()
     
-    # Fetch from all sources
-    await fetcher.fetch_all_reddit()
-    await fetcher.fetch_all_twitter()
+    # Fetch from all sources; the platforms are separate hosts with their
+    # own semaphores and rate limiters, so they run side by side. Stats
+    # are only touched from the event loop thread, between awaits.
+    await asyncio.gather(fetcher.fetch_all_reddit(), fetcher.fetch_all_twitter())
     
     # Print summary
     fetcher.print_summary()
+    fetcher.close()
     
     print(f"\nCompleted at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
@@ -8,7 +8,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 from teams.models import create_team_tables, InternalTeamModel
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-import json
+import orjson
 from datetime import datetime
 
 # Path to your teams.db
@@ -20,7 +20,8 @@ def main():
     create_team_tables(DB_URL)
 
     # Connect to DB
-    engine = create_engine(DB_URL, echo=True)
+    # Set SQL_ECHO=1 to log every statement
+    engine = create_engine(DB_URL, echo=os.getenv("SQL_ECHO") == "1")
     Session = sessionmaker(bind=engine)
     session = Session()
 
@@ -31,8 +32,8 @@ def main():
             team_key="regulator",
             team_name="Regulatory Team",
             description="Handles regulatory and compliance updates.",
-            keyword_config=json.dumps({"threshold": 0.3}),
-            sentiment_config=json.dumps({"enabled": True}),
+            keyword_config=orjson.dumps({"threshold": 0.3}).decode(),
+            sentiment_config=orjson.dumps({"enabled": True}).decode(),
             color="#007bff",
             icon="gavel",
             is_active=True,
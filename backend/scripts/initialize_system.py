@@ -7,7 +7,8 @@ Initialize the entire system from scratch:
 """
 
 import sys
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -34,25 +35,27 @@ def create_all_databases():
     print("CREATING DATABASE TABLES")
     print("="*80 + "\n")
     
-    # Teams database
-    teams_url = get_db_url("teams.db")
-    teams_engine = create_engine(teams_url, echo=False)
-    TeamBase.metadata.create_all(teams_engine)
-    print("✓ Created teams.db tables")
+    # Each Base targets its own SQLite file, so the DDL runs concurrently
+    databases = [
+        ("teams.db", TeamBase),
+        ("sourcer_pipeline.db", StorageBase),
+        ("keywords.db", KeywordBase),
+    ]
+    engines = {
+        db_name: create_engine(get_db_url(db_name), echo=False)
+        for db_name, _ in databases
+    }
     
-    # Sourcer pipeline database
-    sourcer_url = get_db_url("sourcer_pipeline.db")
-    sourcer_engine = create_engine(sourcer_url, echo=False)
-    StorageBase.metadata.create_all(sourcer_engine)
-    print("✓ Created sourcer_pipeline.db tables")
+    with ThreadPoolExecutor(max_workers=len(databases)) as pool:
+        futures = {
+            db_name: pool.submit(base.metadata.create_all, engines[db_name])
+            for db_name, base in databases
+        }
+        for db_name, future in futures.items():
+            future.result()
+            print(f"✓ Created {db_name} tables")
     
-    # Keywords database
-    keywords_url = get_db_url("keywords.db")
-    keywords_engine = create_engine(keywords_url, echo=False)
-    KeywordBase.metadata.create_all(keywords_engine)
-    print("✓ Created keywords.db tables")
-    
-    return teams_engine
+    return engines["teams.db"]
 
 
 def load_teams_from_config(engine):
@@ -63,73 +66,75 @@ def load_teams_from_config(engine):
     
     # Read config
     config_path = Path(__file__).parent.parent / "config.json"
-    with open(config_path) as f:
-        config = json.load(f)
-    
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    config = orjson.loads(config_path.read_bytes())
     
     teams_data = config.get('teams', [])
     print(f"Loading {len(teams_data)} teams...\n")
     
     total_sources = 0
     enabled_sources = 0
+    now = datetime.now()
     
-    for team_data in teams_data:
-        now = datetime.now()
-        
-        # Create team
-        team = InternalTeamModel(
+    # Create all teams first, then all sources, as two bulk inserts in
+    # a single transaction
+    teams = [
+        InternalTeamModel(
             team_key=team_data['team_key'],
             team_name=team_data['team_name'],
             description=team_data.get('description', ''),
             color=team_data.get('color', '#808080'),
             icon=team_data.get('icon', 'group'),
             is_active=team_data.get('is_active', True),
-            keyword_config=json.dumps(team_data.get('keyword_config', {})),
-            sentiment_config=json.dumps(team_data.get('sentiment_config', {})),
+            keyword_config=orjson.dumps(team_data.get('keyword_config', {})).decode(),
+            sentiment_config=orjson.dumps(team_data.get('sentiment_config', {})).decode(),
             created_at=now,
             updated_at=now
         )
-        session.add(team)
-        session.flush()
-        
-        print(f"📁 {team.team_name} ({team.team_key})")
-        print(f"   {team.description}")
+        for team_data in teams_data
+    ]
+    
+    Session = sessionmaker(bind=engine)
+    with Session.begin() as session:
+        # return_defaults populates team.id for the source rows below
+        session.bulk_save_objects(teams, return_defaults=True)
         
-        # Add sources
-        for source_data in team_data.get('sources', []):
-            is_enabled = source_data.get('is_enabled', True)
-            
-            source = TeamSourceModel(
-                team_id=team.id,
-                source_type=source_data['source_type'],
-                source_name=source_data['source_name'],
-                source_url=source_data['source_url'],
-                fetch_interval_minutes=source_data.get('fetch_interval_minutes', 60),
-                is_enabled=is_enabled,
-                source_config=json.dumps(source_data.get('config', {})),
-                total_items_fetched=0,
-                last_fetch_count=0,
-                created_at=now,
-                updated_at=now
-            )
-            session.add(source)
+        sources = []
+        for team, team_data in zip(teams, teams_data):
+            print(f"📁 {team.team_name} ({team.team_key})")
+            print(f"   {team.description}")
             
-            status = "✓" if is_enabled else "✗"
-            print(f"   {status} {source.source_name:30s} ({source.source_url[:50]}...)")
+            # Add sources
+            for source_data in team_data.get('sources', []):
+                is_enabled = source_data.get('is_enabled', True)
+                
+                source = TeamSourceModel(
+                    team_id=team.id,
+                    source_type=source_data['source_type'],
+                    source_name=source_data['source_name'],
+                    source_url=source_data['source_url'],
+                    fetch_interval_minutes=source_data.get('fetch_interval_minutes', 60),
+                    is_enabled=is_enabled,
+                    source_config=orjson.dumps(source_data.get('config', {})).decode(),
+                    total_items_fetched=0,
+                    last_fetch_count=0,
+                    created_at=now,
+                    updated_at=now
+                )
+                sources.append(source)
+                
+                status = "✓" if is_enabled else "✗"
+                print(f"   {status} {source.source_name:30s} ({source.source_url[:50]}...)")
+                
+                if 'notes' in source_data:
+                    print(f"      📝 {source_data['notes']}")
+                
+                total_sources += 1
+                if is_enabled:
+                    enabled_sources += 1
             
-            if 'notes' in source_data:
-                print(f"      📝 {source_data['notes']}")
-            
-            total_sources += 1
-            if is_enabled:
-                enabled_sources += 1
+            print()
         
-        print()
-    
-    session.commit()
-    session.close()
+        session.bulk_save_objects(sources)
     
     print("="*80)
     print(f"✓ Loaded {len(teams_data)} teams with {total_sources} sources ({enabled_sources} enabled)")
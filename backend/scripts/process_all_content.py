@@ -11,7 +11,12 @@ This script:
 Run this daily or continuously to keep keywords up to date.
 """
 
+import atexit
 import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+from itertools import chain
 from pathlib import Path
 from datetime import date, timedelta
 import logging
@@ -31,22 +36,150 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rows streamed from the data lake per batch
+STREAM_BATCH_SIZE = 1000
 
-def process_all_content():
+# Teams run inline by default: the keyword and importance databases are
+# SQLite files without WAL, so concurrent writers fail with "database is locked"
+DEFAULT_WORKERS = 1
+
+# Keyword processor for this process, shared by every team it handles
+_processor = None
+
+
+def group_by_source(contents):
+    """Group content rows or item dicts by source_name in a single pass."""
+    by_source = defaultdict(list)
+    for content in contents:
+        source_name = content['source_name'] if isinstance(content, dict) else content.source_name
+        by_source[source_name].append(content)
+    return by_source
+
+
+def select_team_content(by_source, team_sources):
+    """Collect the grouped content for a team's sources."""
+    return list(chain.from_iterable(by_source.get(source, ()) for source in team_sources))
+
+
+def get_processor():
     """
-    Process ALL content in the data lake for ALL teams.
+    Get this process's keyword processor, building it on first use.
     
-    No limits - processes everything to ensure complete keyword coverage.
+    Constructing a processor loads the NLP models, so one processor serves
+    every team (callers pass team_key on each call). close_processor()
+    releases it: at exit in the main process, and through the pool
+    initializer in worker processes (which exit without running atexit).
+    """
+    global _processor
+    if _processor is None:
+        _processor = EnhancedKeywordProcessor()
+    return _processor
+
+
+def close_processor():
+    """Close this process's keyword processor, if one was built."""
+    global _processor
+    if _processor is not None:
+        _processor.close()
+        _processor = None
+
+
+def init_worker():
+    """Pool initializer: close the worker's processor when it shuts down."""
+    Finalize(None, close_processor, exitpriority=10)
+
+
+atexit.register(close_processor)
+
+
+def build_team_source_map(teams):
+    """Map each team_key to the names of its enabled sources."""
+    return {
+        team.team_key: frozenset(s.source_name for s in team.sources if s.is_enabled)
+        for team in teams
+    }
+
+
+def process_team(team_key, content_items):
     """
+    Extract keywords, importance and time-series for one team.
     
-    print("=" * 80)
-    print("PROCESSING ALL CONTENT FOR ALL TEAMS")
-    print("=" * 80)
+    Runs in a worker process, so it only takes and returns plain
+    (picklable) data and uses the worker's shared processor.
     
-    # Initialize repositories
-    content_repo = ContentRepository()
-    team_repo = TeamRepository()
+    Returns:
+        Tuple of (process_batch result, generate_timeseries result,
+        Counter of totals to add to the run summary)
+    """
+    processor = get_processor()
+    processor.reset_cache()
+    
+    # Process batch (ALL content, no limit)
+    result = processor.process_batch(
+        content_items=content_items,
+        team_key=team_key,
+        calculate_importance=True,
+    )
     
+    # Generate time-series for last 30 days
+    ts_result = processor.generate_timeseries(
+        team_key=team_key,
+        days=30,
+    )
+    
+    counts = Counter({
+        'extracted': result['keywords_extracted'],
+        'stored': result['keywords_stored'],
+        'importance': result.get('importance_calculation', {}).get('keywords_saved', 0),
+        'timeseries': ts_result['timeseries_created'],
+    })
+    
+    return result, ts_result, counts
+
+
+def _run_team_jobs(jobs, max_workers):
+    """Yield (team_key, results) for each job as it finishes."""
+    if max_workers <= 1:
+        for team_key, (_, content_items) in jobs.items():
+            yield team_key, process_team(team_key, content_items)
+        return
+    
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker) as pool:
+        futures = {
+            pool.submit(process_team, team_key, content_items): team_key
+            for team_key, (_, content_items) in jobs.items()
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def print_team_result(team_name, result, ts_result):
+    """Print one team's processing results."""
+    print(f"\n  ✓ {team_name}:")
+    print(f"    - Successful: {result['successful']}/{result['total']}")
+    if result['skipped']:
+        print(f"    - Skipped (too short): {result['skipped']}")
+    print(f"    - Keywords extracted: {result['keywords_extracted']}")
+    print(f"    - Keywords stored: {result['keywords_stored']}")
+    print(f"    - Processing time: {result['processing_time_ms']/1000:.1f}s")
+    
+    if 'importance_calculation' in result:
+        imp = result['importance_calculation']
+        print(f"    - Importance calculated: {imp.get('keywords_processed', 0)}")
+        print(f"    - Keywords saved: {imp.get('keywords_saved', 0)}")
+    
+    print(f"    - Time-series: {ts_result['timeseries_created']} data points created")
+
+
+def collect_team_jobs(content_repo, team_repo):
+    """
+    Load ALL unprocessed content and split it into per-team jobs.
+    
+    Returns:
+        Tuple of (jobs, processed_ids, document_count, team_count), where
+        jobs maps team_key -> (team_name, content_items), or None if there
+        is nothing to process
+    """
     # Get data lake statistics
     stats = content_repo.get_statistics()
     print(f"\nData Lake Statistics:")
@@ -55,121 +188,139 @@ def process_all_content():
     print(f"  Unprocessed: {stats['unprocessed']}")
     print(f"  By source type: {dict(stats.get('by_source_type', {}))}")
     
-    # Get ALL unprocessed content (no limit!)
-    print(f"\n[1] Fetching ALL unprocessed content...")
-    print("-" * 80)
-    unprocessed_content = content_repo.get_unprocessed_content()
-    
-    if not unprocessed_content:
-        print("✓ No unprocessed content found. Everything is up to date!")
-        return
-    
-    print(f"✓ Found {len(unprocessed_content)} unprocessed items")
-    
     # Get all active teams
-    print(f"\n[2] Getting teams...")
+    print(f"\n[1] Getting teams...")
     print("-" * 80)
     teams = [t for t in team_repo.get_all_teams() if t.is_active]
     print(f"✓ Found {len(teams)} active teams:")
     for team in teams:
         print(f"  - {team.team_name} ({team.team_key})")
     
-    # Process for each team
-    total_keywords_extracted = 0
-    total_keywords_stored = 0
-    total_importance_calculated = 0
+    team_source_map = build_team_source_map(teams)
+    monitored_sources = frozenset().union(*team_source_map.values())
     
-    for team in teams:
-        print(f"\n[3] Processing content for team: {team.team_name}")
-        print("-" * 80)
-        
-        # Get team sources
-        team_sources = [s.source_name for s in team.sources if s.is_enabled]
-        print(f"Team monitors {len(team_sources)} sources")
-        
-        # Filter content for this team's sources
-        team_content = [
-            c for c in unprocessed_content 
-            if c.source_name in team_sources
-        ]
-        
-        if not team_content:
-            print(f"  No content from team's sources")
-            continue
-        
-        print(f"  Found {len(team_content)} items from team's sources")
-        
-        # Initialize processor for this team
-        processor = EnhancedKeywordProcessor(team_key=team.team_key)
-        
-        # Prepare content items
-        content_items = [
-            {
+    # Stream ALL unprocessed content from monitored sources (no limit!).
+    # Each batch is copied straight into the per-source groups as plain
+    # dicts, so only the grouped rows are kept, never the ORM objects.
+    print(f"\n[2] Fetching ALL unprocessed content...")
+    print("-" * 80)
+    today = date.today()
+    by_source = defaultdict(list)
+    document_count = 0
+    for batch in content_repo.iter_content_batches(
+        batch_size=STREAM_BATCH_SIZE,
+        unprocessed_only=True,
+        for_processing=True,
+        source_names=monitored_sources,
+    ):
+        for content in batch:
+            by_source[content.source_name].append({
                 'id': content.id,
                 'title': content.title,
                 'content': content.content,
                 'source_type': content.source_type,
                 'source_name': content.source_name,
                 'published_date': content.published_date,
-                'extraction_date': date.today(),
-            }
-            for content in team_content
-        ]
-        
-        # Process batch (ALL content, no limit)
-        print(f"  Processing {len(content_items)} items...")
-        result = processor.process_batch(
-            content_items=content_items,
-            team_key=team.team_key,
-            calculate_importance=True,
-        )
-        
-        print(f"  ✓ Batch complete:")
-        print(f"    - Successful: {result['successful']}/{result['total']}")
-        print(f"    - Keywords extracted: {result['keywords_extracted']}")
-        print(f"    - Keywords stored: {result['keywords_stored']}")
-        print(f"    - Processing time: {result['processing_time_ms']/1000:.1f}s")
-        
-        if 'importance_calculation' in result:
-            imp = result['importance_calculation']
-            print(f"    - Importance calculated: {imp.get('keywords_processed', 0)}")
-            print(f"    - Keywords saved: {imp.get('keywords_saved', 0)}")
-            total_importance_calculated += imp.get('keywords_saved', 0)
-        
-        total_keywords_extracted += result['keywords_extracted']
-        total_keywords_stored += result['keywords_stored']
+                'extraction_date': today,
+            })
+        document_count += len(batch)
+    
+    if not document_count:
+        print("✓ No unprocessed content found. Everything is up to date!")
+        return None
+    
+    print(f"✓ Found {document_count} unprocessed items")
+    
+    # Collect each team's work
+    print(f"\n[3] Selecting content per team...")
+    print("-" * 80)
+    jobs = {}
+    processed_ids = set()
+    
+    for team in teams:
+        team_sources = team_source_map[team.team_key]
         
-        # Generate time-series for last 30 days
-        print(f"  Generating time-series data...")
-        ts_result = processor.generate_timeseries(
-            team_key=team.team_key,
-            days=30,
-        )
-        print(f"  ✓ Time-series: {ts_result['timeseries_created']} data points created")
+        # Content from this team's sources
+        team_content = select_team_content(by_source, team_sources)
         
-        # Mark content as processed
-        for content in team_content:
-            content_repo.mark_as_processed(content.id, status='completed')
+        if not team_content:
+            print(f"  {team.team_name}: no content from {len(team_sources)} sources")
+            continue
         
-        processor.close()
+        print(f"  {team.team_name}: {len(team_content)} items from {len(team_sources)} sources")
+        jobs[team.team_key] = (team.team_name, team_content)
+        processed_ids.update(content['id'] for content in team_content)
+    
+    return jobs, processed_ids, document_count, len(teams)
+
+
+def finish_processing(content_repo, processed_ids, failed_ids, totals, document_count, team_count):
+    """Mark the processed content and print the run summary."""
+    # Mark content as processed once, after every team has seen it. Content
+    # that failed for any team stays unprocessed, so the next run retries it.
+    content_repo.mark_many_as_processed(processed_ids - failed_ids, status='completed')
     
     # Summary
     print("\n" + "=" * 80)
     print("PROCESSING COMPLETE")
     print("=" * 80)
     print(f"\nTotal Results:")
-    print(f"  Documents processed: {len(unprocessed_content)}")
-    print(f"  Teams processed: {len(teams)}")
-    print(f"  Keywords extracted: {total_keywords_extracted}")
-    print(f"  Keywords stored: {total_keywords_stored}")
-    print(f"  Importance calculated: {total_importance_calculated}")
-    
-    content_repo.close()
-    team_repo.close()
+    print(f"  Documents processed: {document_count}")
+    print(f"  Teams processed: {team_count}")
+    print(f"  Keywords extracted: {totals['extracted']}")
+    print(f"  Keywords stored: {totals['stored']}")
+    print(f"  Importance calculated: {totals['importance']}")
+    print(f"  Time-series points: {totals['timeseries']}")
+    if failed_ids:
+        print(f"  Failed (left for retry): {len(failed_ids)}")
     
     print("\n✓ All content processed and ready for frontend!")
 
 
+def process_all_content(max_workers: int = DEFAULT_WORKERS):
+    """
+    Process ALL content in the data lake for ALL teams.
+    
+    No limits - processes everything to ensure complete keyword coverage.
+    
+    Args:
+        max_workers: Worker processes for per-team keyword processing
+            (default: 1, which runs inline; more only pays off on a
+            database that handles concurrent writers)
+    """
+    
+    print("=" * 80)
+    print("PROCESSING ALL CONTENT FOR ALL TEAMS")
+    print("=" * 80)
+    
+    # Initialize repositories
+    content_repo = ContentRepository()
+    team_repo = TeamRepository()
+    
+    try:
+        collected = collect_team_jobs(content_repo, team_repo)
+        if collected is None:
+            return
+        jobs, processed_ids, document_count, team_count = collected
+        
+        print(f"\n[4] Processing {len(jobs)} teams ({max_workers} workers)...")
+        print("-" * 80)
+        
+        totals = Counter()
+        failed_ids = set()
+        for team_key, (result, ts_result, counts) in _run_team_jobs(jobs, max_workers):
+            print_team_result(jobs[team_key][0], result, ts_result)
+            totals += counts
+            failed_ids.update(result['failed_ids'])
+        
+        finish_processing(
+            content_repo, processed_ids, failed_ids, totals, document_count, team_count
+        )
+    finally:
+        content_repo.close()
+        team_repo.close()
+
+
 def process_specific_date(target_date: date):
     """
     Reprocess content for a specific date.
@@ -189,7 +340,7 @@ def process_specific_date(target_date: date):
     
     # Get content for specific date
     next_day = target_date + timedelta(days=1)
-    content_items = content_repo.get_content_by_date_range(
+    content_items = content_repo.get_content_rows_by_date_range(
         start_date=target_date,
         end_date=next_day
     )
@@ -202,22 +353,22 @@ def process_specific_date(target_date: date):
     
     # Process for each team
     teams = [t for t in team_repo.get_all_teams() if t.is_active]
+    by_source = group_by_source(content_items)
+    team_source_map = build_team_source_map(teams)
     
     for team in teams:
         print(f"\nProcessing for team: {team.team_name}")
         
-        team_sources = [s.source_name for s in team.sources if s.is_enabled]
-        team_content = [
-            c for c in content_items 
-            if c.source_name in team_sources
-        ]
+        team_sources = team_source_map[team.team_key]
+        team_content = select_team_content(by_source, team_sources)
         
         if not team_content:
             continue
         
         print(f"  {len(team_content)} items from team's sources")
         
-        processor = EnhancedKeywordProcessor(team_key=team.team_key)
+        processor = get_processor()
+        processor.reset_cache()
         
         items = [
             {
@@ -239,8 +390,6 @@ def process_specific_date(target_date: date):
         )
         
         print(f"  ✓ {result['keywords_stored']} keywords stored")
-        
-        processor.close()
     
     content_repo.close()
     team_repo.close()
@@ -320,11 +469,17 @@ if __name__ == "__main__":
         default=20,
         help='Number of keywords to show (for show command)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help='Worker processes for per-team processing (for process command)'
+    )
     
     args = parser.parse_args()
     
     if args.command == 'process':
-        process_all_content()
+        process_all_content(max_workers=args.workers)
     
     elif args.command == 'reprocess':
         if not args.date:
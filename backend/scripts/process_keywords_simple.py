@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from storage.repository import ContentRepository
 from storage.models import get_session
 from keywords.enhanced_processor import EnhancedKeywordProcessor
+from teams.source_matching import TeamSourceMatcher
 
 # Setup logging
 logging.basicConfig(
@@ -51,11 +52,25 @@ def main():
     start_date = end_date - timedelta(days=7)
     
     logger.info(f"Getting documents from {start_date.date()} to {end_date.date()}")
-    all_docs = repo.get_content_by_date_range(start_date, end_date)
+    all_docs = repo.get_content_rows_by_date_range(start_date, end_date)
     logger.info(f"Found {len(all_docs)} total documents")
     
+    # Match document sources to teams (memoized per distinct source name)
+    matcher = TeamSourceMatcher({
+        team_key: [s["source_name"] for s in team_info["sources"]]
+        for team_key, team_info in teams.items()
+    })
+    
+    # Bucket documents by team and published date in a single pass
+    today = datetime.now().date()
+    docs_by_team = defaultdict(lambda: defaultdict(list))
+    for doc in all_docs:
+        date_key = doc.published_date.date() if doc.published_date else today
+        for team_key in matcher.teams_for(doc.source_name):
+            docs_by_team[team_key][date_key].append(doc)
+    
     # Process each team
-    processor = EnhancedKeywordProcessor()
+    processor = EnhancedKeywordProcessor(content_repo=repo)
     
     for team_key, team_info in teams.items():
         logger.info(f"\n{'='*80}")
@@ -66,27 +81,16 @@ def main():
         team_source_names = [s["source_name"].lower() for s in team_info["sources"]]
         logger.info(f"Team sources: {', '.join(team_source_names[:3])}... ({len(team_source_names)} total)")
         
-        # Filter by team sources
-        team_docs = []
-        for doc in all_docs:
-            doc_source_name = (doc.source_name or '').lower()
-            if any(team_src in doc_source_name for team_src in team_source_names):
-                team_docs.append(doc)
+        # This team's documents, already grouped by published date
+        docs_by_date = docs_by_team.get(team_key, {})
+        team_doc_count = sum(len(docs) for docs in docs_by_date.values())
         
-        logger.info(f"Found {len(team_docs)} documents for {team_info['team_name']}")
+        logger.info(f"Found {team_doc_count} documents for {team_info['team_name']}")
         
-        if not team_docs:
+        if not team_doc_count:
             logger.warning(f"No documents to process for {team_info['team_name']}")
             continue
         
-        # Group documents by published date
-        docs_by_date = {}
-        for doc in team_docs:
-            date_key = doc.published_date.date() if doc.published_date else datetime.now().date()
-            if date_key not in docs_by_date:
-                docs_by_date[date_key] = []
-            docs_by_date[date_key].append(doc)
-        
         logger.info(f"Documents span {len(docs_by_date)} dates: {sorted(docs_by_date.keys())}")
         
         # Process each date separately to maintain date association
@@ -98,33 +102,30 @@ def main():
             logger.info(f"\n📅 Processing {process_date}: {len(docs_for_date)} documents")
             
             # Clear cache for this date
-            processor.keyword_cache = defaultdict(lambda: {
-                'frequency': 0,
-                'documents': [],
-                'snippets': [],
-                'content_ids': [],
-            })
+            processor.reset_cache()
+            
+            # Process documents for this specific date in one batch
+            content_items = [
+                {
+                    'id': doc.id,
+                    'title': doc.title or "",
+                    'content': doc.content or "",
+                    'source_type': doc.source_type,
+                    'source_name': doc.source_name,
+                    'published_date': doc.published_date,
+                    'extraction_date': process_date,  # Use the date we're processing
+                }
+                for doc in docs_for_date
+            ]
+            result = processor.process_batch(
+                content_items,
+                team_key=team_key,
+                calculate_importance=False,
+            )
             
-            # Process documents for this specific date
-            successful = 0
-            for i, doc in enumerate(docs_for_date):
-                try:
-                    result = processor.process_content(
-                        content_id=doc.id,
-                        title=doc.title or "",
-                        content=doc.content or "",
-                        source_type=doc.source_type,
-                        source_name=doc.source_name,
-                        published_date=doc.published_date,
-                        extraction_date=process_date,  # Use the date we're processing
-                        team_key=team_key,
-                    )
-                    
-                    if result.get('keywords_extracted', 0) > 0:
-                        successful += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error processing document {doc.id}: {str(e)}")
+            successful = result['successful']
+            if result['failed']:
+                logger.error(f"  ✗ {result['failed']} documents failed for {process_date}")
             
             logger.info(f"  ✓ Extracted from {successful}/{len(docs_for_date)} documents")
             total_processed += successful
@@ -148,7 +149,7 @@ def main():
         
         logger.info(f"\n{'─'*80}")
         logger.info(f"✅ {team_info['team_name']} Complete:")
-        logger.info(f"   Documents: {total_processed}/{len(team_docs)}")
+        logger.info(f"   Documents: {total_processed}/{team_doc_count}")
         logger.info(f"   Keywords:  {total_keywords_saved} across {len(docs_by_date)} dates")
         logger.info(f"{'─'*80}")
     
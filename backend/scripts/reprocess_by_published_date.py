@@ -18,8 +18,10 @@ from pathlib import Path
 sys.path.insert(0, '/Users/samanb/dev/perceptron/backend')
 
 from keywords.enhanced_processor import EnhancedKeywordProcessor
+from storage.models import get_session
 from storage.repository import ContentRepository
 from teams.repository import TeamRepository
+from teams.source_matching import TeamSourceMatcher
 
 logging.basicConfig(
     level=logging.INFO,
@@ -61,10 +63,15 @@ def reprocess_all_with_published_dates():
     for team_key, sources in team_sources.items():
         logger.info(f"  {team_key}: {len(sources)} configured sources")
     
-    # Initialize repositories
-    content_repo = ContentRepository()
+    # Initialize repositories (one data lake session for the whole run)
+    session = get_session()
+    content_repo = ContentRepository(session)
     team_repo = TeamRepository()
     
+    # One processor for all teams: team_key is passed on every call, and
+    # the NLP models and repositories are only set up once
+    processor = EnhancedKeywordProcessor(content_repo=content_repo)
+    
     # Get all teams
     teams = team_repo.get_all_teams()
     logger.info(f"Processing for {len(teams)} teams: {[t.team_key for t in teams]}")
@@ -79,9 +86,12 @@ def reprocess_all_with_published_dates():
     start_dt = datetime.combine(start_date, datetime.min.time())
     end_dt = datetime.combine(today, datetime.max.time())
     
-    all_documents = content_repo.get_content_by_date_range(start_dt, end_dt)
+    all_documents = content_repo.get_content_rows_by_date_range(start_dt, end_dt)
     logger.info(f"Found {len(all_documents)} total documents")
     
+    # Match document sources to teams (memoized per distinct source name)
+    matcher = TeamSourceMatcher(team_sources)
+    
     # Group documents by published date
     docs_by_date = defaultdict(list)
     for doc in all_documents:
@@ -109,19 +119,15 @@ def reprocess_all_with_published_dates():
         
         logger.info(f"  Filtering for {len(team_source_names)} team sources")
         
-        processor = EnhancedKeywordProcessor(team_key=team.team_key)
-        
         # Process each date separately
         for pub_date in sorted(docs_by_date.keys()):
             all_docs_for_date = docs_by_date[pub_date]
             
             # Filter documents by team-specific sources
-            team_documents = []
-            for doc in all_docs_for_date:
-                doc_source_name = (doc.source_name or '').lower()
-                # Check if this document's source matches any of the team's configured sources
-                if any(team_src in doc_source_name for team_src in team_source_names):
-                    team_documents.append(doc)
+            team_documents = [
+                doc for doc in all_docs_for_date
+                if team.team_key in matcher.teams_for(doc.source_name)
+            ]
             
             if not team_documents:
                 logger.info(f"\nProcessing {pub_date}: 0 documents for {team.team_key} (filtered from {len(all_docs_for_date)})")
@@ -143,6 +149,7 @@ def reprocess_all_with_published_dates():
                 })
             
             # Process batch
+            processor.reset_cache()
             result = processor.process_batch(
                 content_items=content_items,
                 team_key=team.team_key,
@@ -168,6 +175,9 @@ def reprocess_all_with_published_dates():
                 f"{keywords_saved} saved"
             )
     
+    processor.close()
+    team_repo.close()
+    
     logger.info(f"\n{'='*80}")
     logger.info(f"REPROCESSING COMPLETE")
     logger.info(f"Total keywords saved across all teams/dates: {total_keywords_saved}")
@@ -30,7 +30,7 @@ def reprocess_dates_for_team(team_key: str, dates):
         logger.error(f"Team {team_key} not found")
         return
 
-    processor = EnhancedKeywordProcessor(team_key=team_key)
+    processor = EnhancedKeywordProcessor(team_key=team_key, content_repo=content_repo)
 
     total_saved = 0
 
@@ -46,7 +46,7 @@ def reprocess_dates_for_team(team_key: str, dates):
         # Fetch documents published on this date
         start_dt = datetime.combine(pub_date, datetime.min.time())
         end_dt = datetime.combine(pub_date, datetime.max.time())
-        docs = content_repo.get_content_by_date_range(start_dt, end_dt)
+        docs = content_repo.get_content_rows_by_date_range(start_dt, end_dt)
         logger.info(f"Found {len(docs)} documents for {pub_date}")
 
         if not docs:
@@ -9,6 +9,7 @@ Continuously fetches data from all configured RSS feeds.
 
 import asyncio
 import sys
+import aiohttp
 from pathlib import Path
 from datetime import datetime, timedelta
 import logging
@@ -43,6 +44,8 @@ class DataSourcingService:
         self.team_repo = TeamRepository()
         self.fetch_interval_seconds = 3600  # 1 hour
         self.days_to_keep = 7
+        self.max_connections = 16
+        self.http_session: Optional[aiohttp.ClientSession] = None  # Open during fetch_all_sources
         
     def get_all_sources(self) -> List[Dict]:
         """Get all unique sources across all teams."""
@@ -79,7 +82,8 @@ class DataSourcingService:
             return RSSSourcer(
                 feed_url=source['url'],
                 name=source['name'],
-                max_entries=config.get('max_entries', 200)
+                max_entries=config.get('max_entries', 200),
+                session=self.http_session,
             )
         
         elif source_type == 'reddit':
@@ -187,9 +191,17 @@ class DataSourcingService:
         logger.info(f"Fetching from {len(sources)} sources...")
         logger.info(f"{'='*80}")
         
-        # Fetch concurrently
-        tasks = [self.fetch_from_source(source) for source in sources]
-        results = await asyncio.gather(*tasks)
+        # Fetch concurrently; RSS feeds share one pooled HTTP session
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=15),
+            connector=aiohttp.TCPConnector(limit=self.max_connections),
+        ) as session:
+            self.http_session = session
+            try:
+                tasks = [self.fetch_from_source(source) for source in sources]
+                results = await asyncio.gather(*tasks)
+            finally:
+                self.http_session = None
         
         # Summary
         successful = sum(1 for r in results if r['success'])
@@ -208,15 +220,15 @@ class DataSourcingService:
         
         from storage.models import SourcedContentModel
         
-        old_items = self.content_repo.session.query(SourcedContentModel).filter(
+        # Single DELETE ... WHERE instead of loading every old row first
+        deleted = self.content_repo.session.query(SourcedContentModel).filter(
             SourcedContentModel.published_date < cutoff
-        ).all()
+        ).delete(synchronize_session=False)
+        self.content_repo.session.commit()
+        self.content_repo.invalidate_statistics()
         
-        if old_items:
-            for item in old_items:
-                self.content_repo.session.delete(item)
-            self.content_repo.session.commit()
-            logger.info(f"Cleaned up {len(old_items)} documents older than {self.days_to_keep} days")
+        if deleted:
+            logger.info(f"Cleaned up {deleted} documents older than {self.days_to_keep} days")
     
     async def run_once(self):
         """Run one fetch cycle."""
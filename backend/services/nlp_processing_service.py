@@ -75,8 +75,10 @@ class NLPProcessingService:
         processor.generate_timeseries(team_key=team.team_key, days=7)
         
         # Mark as processed
-        for content in team_content:
-            self.content_repo.mark_as_processed(content.id, status='completed')
+        self.content_repo.mark_many_as_processed(
+            (content.id for content in team_content),
+            status='completed'
+        )
         
         processor.close()
         
@@ -90,7 +92,7 @@ class NLPProcessingService:
     def run_once(self):
         """Run one processing cycle."""
         # Get all unprocessed content
-        unprocessed = self.content_repo.get_unprocessed_content()
+        unprocessed = self.content_repo.get_unprocessed_content(for_processing=True)
         
         if not unprocessed:
             logger.info("No unprocessed content")
@@ -2,6 +2,7 @@
 
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from types import MappingProxyType
 import re
 
 try:
@@ -14,6 +15,17 @@ except ImportError:
 from .base import BaseSourcer, SourcedContent
 
 
+# Shared browser-like request headers (read-only, built once at import time)
+BROWSER_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                 "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+})
+
+
 class LinkedInSourcer(BaseSourcer):
     """
     LinkedIn public post sourcer using web scraping.
@@ -94,17 +106,8 @@ class LinkedInSourcer(BaseSourcer):
             "Consider using LinkedIn Official API or services like Proxycurl."
         )
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-        }
-        
         try:
-            async with aiohttp.ClientSession(headers=headers) as session:
+            async with aiohttp.ClientSession(headers=BROWSER_HEADERS) as session:
                 # For now, return empty list with informational message
                 # Real implementation would need sophisticated anti-detection
                 
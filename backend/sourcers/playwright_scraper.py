@@ -10,9 +10,11 @@ This scraper uses a headless browser to:
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
@@ -27,13 +29,16 @@ class PlaywrightScraper:
     - Handles JavaScript-rendered content
     - Implements delays and scrolling for natural behavior
     - Supports custom selectors for flexible parsing
+    - Pools browser contexts so several pages can be scraped in parallel
+      from a single browser launch
     """
     
     def __init__(
         self,
         headless: bool = True,
         user_agent: Optional[str] = None,
-        timeout: int = 30000
+        timeout: int = 30000,
+        pool_size: int = 4
     ):
         """
         Initialize Playwright scraper.
@@ -42,6 +47,7 @@ class PlaywrightScraper:
             headless: Run browser in headless mode
             user_agent: Custom user agent string
             timeout: Page load timeout in milliseconds
+            pool_size: Maximum number of browser contexts used concurrently
         """
         self.headless = headless
         self.user_agent = user_agent or (
@@ -49,8 +55,17 @@ class PlaywrightScraper:
             "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
         self.timeout = timeout
+        self.pool_size = max(1, pool_size)
         self.browser: Optional[Browser] = None
         
+        # Context pool: idle contexts wait in the queue, and each borrower
+        # holds one of pool_size slots, so the pool never exceeds pool_size.
+        # A slot is freed when its context is returned or discarded.
+        self._idle_contexts: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._last_used: Dict[BrowserContext, float] = {}
+        self._start_lock: Optional[asyncio.Lock] = None
+        
     async def __aenter__(self):
         """Async context manager entry."""
         await self.start()
@@ -61,25 +76,123 @@ class PlaywrightScraper:
         await self.close()
     
     async def start(self):
-        """Start the browser."""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-            ]
-        )
-        logger.info("Playwright browser started")
+        """Start the browser and pre-create the context pool."""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        
+        async with self._start_lock:
+            if self.browser:
+                return
+            
+            self.playwright = await async_playwright().start()
+            try:
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless,
+                    args=[
+                        '--disable-blink-features=AutomationControlled',
+                        '--disable-dev-shm-usage',
+                        '--no-sandbox',
+                    ]
+                )
+                self._idle_contexts = asyncio.Queue()
+                self._slots = asyncio.Semaphore(self.pool_size)
+                for _ in range(self.pool_size):
+                    self._release_context(await self._new_context())
+            except BaseException:
+                # Don't leave the driver (or a half-started browser) running
+                if self.browser:
+                    await self.browser.close()
+                    self.browser = None
+                self._last_used.clear()
+                await self.playwright.stop()
+                raise
+            logger.info(f"Playwright browser started ({self.pool_size} contexts)")
     
     async def close(self):
-        """Close the browser."""
+        """Close pooled contexts and the browser."""
         if self.browser:
+            while self._idle_contexts and not self._idle_contexts.empty():
+                await self._idle_contexts.get_nowait().close()
+            self._last_used.clear()
             await self.browser.close()
             await self.playwright.stop()
+            self.browser = None
             logger.info("Playwright browser closed")
     
+    async def _new_context(self) -> BrowserContext:
+        """Create a browser context with a realistic fingerprint."""
+        return await self.browser.new_context(
+            user_agent=self.user_agent,
+            viewport={'width': 1920, 'height': 1080},
+            locale='en-US',
+        )
+    
+    def _release_context(self, context: BrowserContext):
+        """Return a context to the idle pool."""
+        self._last_used[context] = time.monotonic()
+        self._idle_contexts.put_nowait(context)
+    
+    @asynccontextmanager
+    async def acquire_context(self) -> AsyncIterator[BrowserContext]:
+        """
+        Borrow a browser context from the pool.
+        
+        Waits for a free slot when all pool_size contexts are in use, and
+        opens a new context when no idle one is left (e.g. after reaping or
+        after a broken context was discarded).
+        """
+        if not self.browser:
+            await self.start()
+        
+        async with self._slots:
+            if self._idle_contexts.empty():
+                context = await self._new_context()
+            else:
+                context = self._idle_contexts.get_nowait()
+            
+            try:
+                yield context
+            except BaseException:
+                # Don't hand a possibly broken context to the next caller;
+                # leaving the slot lets a waiter open a fresh one
+                self._last_used.pop(context, None)
+                await context.close()
+                raise
+            else:
+                self._release_context(context)
+    
+    async def reap_idle_contexts(self, max_idle_seconds: float = 300.0) -> int:
+        """
+        Close contexts that have been idle longer than max_idle_seconds.
+        
+        Frees browser memory between infrequent scraping bursts; the pool
+        is refilled on demand by acquire_context.
+        
+        Returns:
+            Number of contexts closed
+        """
+        if not self.browser or not self._idle_contexts:
+            return 0
+        
+        now = time.monotonic()
+        keep = []
+        reaped = 0
+        while not self._idle_contexts.empty():
+            context = self._idle_contexts.get_nowait()
+            if now - self._last_used.get(context, now) > max_idle_seconds:
+                self._last_used.pop(context, None)
+                await context.close()
+                reaped += 1
+            else:
+                keep.append(context)
+        
+        for context in keep:
+            self._idle_contexts.put_nowait(context)
+        
+        if reaped:
+            logger.info(f"Closed {reaped} idle Playwright contexts")
+        return reaped
+    
     async def scrape_blog(
         self,
         url: str,
@@ -99,17 +212,24 @@ class PlaywrightScraper:
         Returns:
             List of scraped articles with title, url, content, published_date
         """
-        if not self.browser:
-            await self.start()
-        
-        context = await self.browser.new_context(
-            user_agent=self.user_agent,
-            viewport={'width': 1920, 'height': 1080},
-            locale='en-US',
-        )
-        
-        page = await context.new_page()
-        
+        async with self.acquire_context() as context:
+            page = await context.new_page()
+            try:
+                return await self._scrape_blog_page(
+                    page, url, selectors, max_items, wait_for_selector
+                )
+            finally:
+                await page.close()
+    
+    async def _scrape_blog_page(
+        self,
+        page: Page,
+        url: str,
+        selectors: Dict[str, str],
+        max_items: int,
+        wait_for_selector: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Load a blog listing in an open page and parse its articles."""
         try:
             logger.info(f"Navigating to {url}")
             # Try to load page with more lenient timeout
@@ -149,9 +269,6 @@ class PlaywrightScraper:
         except Exception as e:
             logger.error(f"Error scraping {url}: {e}")
             return []
-        finally:
-            await page.close()
-            await context.close()
     
     async def _scroll_page(self, page: Page, scrolls: int = 3):
         """Scroll page to trigger lazy loading."""
@@ -249,16 +366,26 @@ class PlaywrightScraper:
         Returns:
             All articles from all pages
         """
-        if not self.browser:
-            await self.start()
-        
         all_articles = []
-        context = await self.browser.new_context(
-            user_agent=self.user_agent,
-            viewport={'width': 1920, 'height': 1080}
-        )
-        page = await context.new_page()
-        
+        async with self.acquire_context() as context:
+            page = await context.new_page()
+            try:
+                return await self._scrape_pages(
+                    page, url, selectors, max_pages, next_button_selector, all_articles
+                )
+            finally:
+                await page.close()
+    
+    async def _scrape_pages(
+        self,
+        page: Page,
+        url: str,
+        selectors: Dict[str, str],
+        max_pages: int,
+        next_button_selector: str,
+        all_articles: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Walk paginated listings in an open page, collecting articles."""
         try:
             await page.goto(url, wait_until='networkidle', timeout=self.timeout)
             
@@ -292,9 +419,51 @@ class PlaywrightScraper:
         except Exception as e:
             logger.error(f"Error in pagination scraping: {e}")
             return all_articles
-        finally:
-            await page.close()
-            await context.close()
+
+
+# Process-wide scraper so the browser launch is paid once, not per scheduler start
+_shared_scraper: Optional[PlaywrightScraper] = None
+_shared_lock: Optional[asyncio.Lock] = None
+
+
+async def get_shared_scraper(timeout: int = 60000, pool_size: int = 4) -> PlaywrightScraper:
+    """
+    Get the process-wide PlaywrightScraper, launching the browser on first use.
+    
+    Args:
+        timeout: Page load timeout in milliseconds (used on first launch only)
+        pool_size: Browser contexts to keep warm (used on first launch only)
+    
+    Returns:
+        Started PlaywrightScraper instance
+    """
+    global _shared_scraper, _shared_lock
+    if _shared_lock is None:
+        _shared_lock = asyncio.Lock()
+    
+    async with _shared_lock:
+        if _shared_scraper is None:
+            scraper = PlaywrightScraper(timeout=timeout, pool_size=pool_size)
+            await scraper.start()
+            _shared_scraper = scraper
+    return _shared_scraper
+
+
+def peek_shared_scraper() -> Optional[PlaywrightScraper]:
+    """Return the shared scraper if it has been started, without launching it."""
+    return _shared_scraper
+
+
+async def close_shared_scraper(timeout: float = 5.0):
+    """Close the process-wide scraper (call on application shutdown)."""
+    global _shared_scraper
+    scraper, _shared_scraper = _shared_scraper, None
+    if scraper is None:
+        return
+    try:
+        await asyncio.wait_for(scraper.close(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Playwright did not close within {timeout}s")
 
 
 async def test_playwright_scraper():
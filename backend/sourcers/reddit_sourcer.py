@@ -107,10 +107,13 @@ class RedditSourcer(BaseSourcer):
         
         return True
 
-    async def fetch(self, **kwargs) -> List[SourcedContent]:
+    def fetch_sync(self, **kwargs) -> List[SourcedContent]:
         """
         Fetch posts from Reddit.
 
+        PRAW makes blocking HTTP calls, so this runs synchronously;
+        callers on an event loop can run it in a thread.
+
         Args:
             **kwargs: Optional override parameters
 
@@ -186,5 +189,17 @@ class RedditSourcer(BaseSourcer):
         
         return contents
 
+    async def fetch(self, **kwargs) -> List[SourcedContent]:
+        """
+        Fetch posts from Reddit (see fetch_sync).
+
+        Args:
+            **kwargs: Optional override parameters
+
+        Returns:
+            List of SourcedContent objects
+        """
+        return self.fetch_sync(**kwargs)
+
     def __repr__(self) -> str:
         return f"<RedditSourcer: {self.name} (r/{self.subreddit})>"
@@ -1,17 +1,39 @@
 """RSS feed sourcer implementation."""
 
+import asyncio
+import aiohttp
 import feedparser
-from typing import List, Optional
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from urllib.parse import urljoin
 import time
 
 from .base import BaseSourcer, SourcedContent
 
+# Minutes per syndication module (sy:updatePeriod) period
+UPDATE_PERIOD_MINUTES = {
+    "hourly": 60,
+    "daily": 1440,
+    "weekly": 10080,
+    "monthly": 43200,
+    "yearly": 525600,
+}
+
 
 class RSSSourcer(BaseSourcer):
     """Sourcer for RSS/Atom feeds."""
 
-    def __init__(self, feed_url: str, name: Optional[str] = None, max_entries: int = 50):
+    def __init__(
+        self,
+        feed_url: str,
+        name: Optional[str] = None,
+        max_entries: int = 50,
+        session: Optional[aiohttp.ClientSession] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ):
         """
         Initialize RSS sourcer.
 
@@ -19,10 +41,24 @@ class RSSSourcer(BaseSourcer):
             feed_url: URL of the RSS/Atom feed
             name: Optional name for this sourcer
             max_entries: Maximum number of entries to fetch (default: 50)
+            session: Optional shared aiohttp session used to download the feed
+                (reuses pooled keep-alive connections; not closed by the sourcer)
+            etag: ETag from a previous fetch (sent as If-None-Match)
+            last_modified: Last-Modified from a previous fetch (sent as If-Modified-Since)
+            user_agent: User-Agent header sent with the request (default: feedparser's)
         """
         super().__init__(name)
         self.feed_url = feed_url
         self.max_entries = max_entries
+        self.session = session
+        self.etag = etag
+        self.last_modified = last_modified
+        self.user_agent = user_agent or feedparser.USER_AGENT
+        
+        # Set by fetch(): whether the server answered 304, and the publisher's
+        # requested minimum polling interval (<ttl> or sy:updatePeriod), if any
+        self.not_modified = False
+        self.ttl_minutes: Optional[int] = None
         self.validate_config(feed_url=feed_url)
 
     def validate_config(self, **kwargs) -> bool:
@@ -67,13 +103,25 @@ class RSSSourcer(BaseSourcer):
         feed_url = kwargs.get("feed_url", self.feed_url)
         max_entries = kwargs.get("max_entries", self.max_entries)
 
-        # Parse the feed
-        feed = feedparser.parse(feed_url)
+        # Download asynchronously, then parse in a worker thread so neither
+        # the network wait nor the XML parsing blocks the event loop
+        downloaded = await self._download(feed_url)
+        if downloaded is None:
+            return []  # 304 Not Modified
+        body, response_headers = downloaded
+        loop = asyncio.get_running_loop()
+        # Pass the HTTP headers along so feedparser still sees the charset
+        # and can resolve relative links against the feed URL
+        feed = await loop.run_in_executor(
+            None, partial(feedparser.parse, body, response_headers=response_headers)
+        )
         
         if feed.bozo and not feed.entries:
             # bozo flag indicates malformed XML, but sometimes feeds work anyway
             raise Exception(f"Failed to parse feed: {feed.get('bozo_exception', 'Unknown error')}")
         
+        self.ttl_minutes = self._feed_ttl_minutes(feed.feed)
+        
         contents = []
         
         for entry in feed.entries[:max_entries]:
@@ -121,5 +169,61 @@ class RSSSourcer(BaseSourcer):
         
         return contents
 
+    async def _download(self, feed_url: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """
+        Download the raw feed, using the shared session when provided.
+        
+        Sends the stored validators as a conditional request and returns None
+        when the server replies 304 Not Modified. Otherwise returns the body
+        and the response headers (lowercased, as feedparser expects them).
+        """
+        headers = {"User-Agent": self.user_agent}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        
+        if self.session is not None:
+            return await self._get(self.session, feed_url, headers)
+        
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+            return await self._get(session, feed_url, headers)
+
+    async def _get(
+        self, session: aiohttp.ClientSession, feed_url: str, headers: dict
+    ) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        async with session.get(feed_url, headers=headers) as response:
+            self.not_modified = response.status == 304
+            if self.not_modified:
+                return None
+            response.raise_for_status()
+            self.etag = response.headers.get("ETag")
+            self.last_modified = response.headers.get("Last-Modified")
+            response_headers = {key.lower(): value for key, value in response.headers.items()}
+            # Base URI for relative links: the final URL after redirects
+            response_headers["content-location"] = urljoin(
+                str(response.url), response_headers.get("content-location", "")
+            )
+            return await response.read(), response_headers
+
+    @staticmethod
+    def _feed_ttl_minutes(feed_info) -> Optional[int]:
+        """Polling interval requested by the feed via <ttl> or sy:updatePeriod/updateFrequency."""
+        intervals = []
+        
+        ttl = feed_info.get("ttl")
+        if ttl and str(ttl).strip().isdigit():
+            intervals.append(int(ttl))
+        
+        period = UPDATE_PERIOD_MINUTES.get(str(feed_info.get("sy_updateperiod", "")).strip().lower())
+        if period:
+            try:
+                frequency = max(1, int(feed_info.get("sy_updatefrequency", 1)))
+            except (TypeError, ValueError):
+                frequency = 1
+            intervals.append(period // frequency)
+        
+        return max(intervals) if intervals else None
+
     def __repr__(self) -> str:
         return f"<RSSSourcer: {self.name} ({self.feed_url})>"
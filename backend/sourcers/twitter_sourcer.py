@@ -86,10 +86,13 @@ class TwitterSourcer(BaseSourcer):
         
         return True
 
-    async def fetch(self, **kwargs) -> List[SourcedContent]:
+    def fetch_sync(self, **kwargs) -> List[SourcedContent]:
         """
         Fetch tweets from Twitter/X.
 
+        ntscraper makes blocking HTTP calls, so this runs synchronously;
+        callers on an event loop can run it in a thread.
+
         Args:
             **kwargs: Optional override parameters
 
@@ -179,6 +182,18 @@ class TwitterSourcer(BaseSourcer):
         
         return contents
 
+    async def fetch(self, **kwargs) -> List[SourcedContent]:
+        """
+        Fetch tweets from Twitter/X (see fetch_sync).
+
+        Args:
+            **kwargs: Optional override parameters
+
+        Returns:
+            List of SourcedContent objects
+        """
+        return self.fetch_sync(**kwargs)
+
     def __repr__(self) -> str:
         if self.mode == "user":
             return f"<TwitterSourcer: {self.name} (@{self.username})>"
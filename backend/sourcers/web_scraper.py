@@ -8,34 +8,41 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
+from types import MappingProxyType
 import re
 
 from storage.models import SourcedContentModel
 
 
+# Request headers shared by every scraper session (read-only)
+DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+
+
 class WebScraper(ABC):
     """Base class for web scrapers"""
     
-    def __init__(self, base_url: str, name: str, max_pages: int = 10):
+    def __init__(self, base_url: str, name: str, max_pages: int = 10,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.base_url = base_url
         self.name = name
         self.max_pages = max_pages
-        self.session = None
+        self.session = session
+        # A session passed in is shared with other scrapers and must outlive us
+        self._owns_session = session is None
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
         if self.session is None:
-            self.session = aiohttp.ClientSession(
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-            )
+            self.session = aiohttp.ClientSession(headers=DEFAULT_HEADERS)
         return self.session
     
     async def close(self):
         """Close the session"""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
     
     async def fetch_page(self, url: str) -> Optional[str]:
         """Fetch HTML content from URL"""
@@ -244,7 +251,8 @@ class NewsScraper(WebScraper):
 class GenericWebScraper(WebScraper):
     """Generic web scraper with configurable selectors"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any],
+                 session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize with configuration
         
@@ -253,11 +261,14 @@ class GenericWebScraper(WebScraper):
         - name: str
         - max_pages: int
         - selectors: dict with title, content, link, date selectors
+        
+        session: optional shared aiohttp session (left open after scraping)
         """
         super().__init__(
             config['base_url'],
             config['name'],
-            config.get('max_pages', 10)
+            config.get('max_pages', 10),
+            session=session
         )
         self.selectors = config.get('selectors', {})
     
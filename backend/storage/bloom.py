@@ -0,0 +1,64 @@
+"""
+In-memory Bloom filter over content hashes.
+
+Lets the repository skip the database existence check for content that has
+definitely never been stored. A "maybe seen" answer is still confirmed
+against the UNIQUE content_hash index, so false positives only cost the
+query that would have run anyway.
+"""
+
+import math
+from typing import Iterable
+
+
+class ContentHashBloom:
+    """
+    Bloom filter keyed by SHA-256 hex digests from compute_content_hash().
+
+    The digests are already uniformly distributed, so the k bit positions are
+    taken directly from slices of the digest instead of re-hashing.
+    """
+
+    # 64 hex chars -> 8 independent 32-bit slices
+    _SLICE = 8
+    _MAX_HASHES = 64 // _SLICE
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-4):
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Expected number of stored hashes
+            error_rate: Target false-positive rate at capacity
+        """
+        # Optimal size and hash count for the given capacity / error rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = min(
+            self._MAX_HASHES,
+            max(1, round(self.num_bits / capacity * math.log(2)))
+        )
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, content_hash: str):
+        for i in range(self.num_hashes):
+            start = i * self._SLICE
+            yield int(content_hash[start:start + self._SLICE], 16) % self.num_bits
+
+    def add(self, content_hash: str):
+        """Record a stored content hash."""
+        for pos in self._positions(content_hash):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def update(self, content_hashes: Iterable[str]):
+        """Record several content hashes."""
+        for content_hash in content_hashes:
+            self.add(content_hash)
+
+    def __contains__(self, content_hash: str) -> bool:
+        """False means definitely never added; True means possibly added."""
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7))
+            for pos in self._positions(content_hash)
+        )
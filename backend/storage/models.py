@@ -20,6 +20,8 @@ from sqlalchemy import (
     Boolean,
     Index,
     UniqueConstraint,
+    inspect,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -27,6 +29,14 @@ import hashlib
 
 Base = declarative_base()
 
+# Rows per multi-row INSERT when the ORM batches inserts (SQLAlchemy still
+# caps each statement at the dialect's bound-parameter limit)
+INSERT_PAGE_SIZE = 10_000
+
+# Session factories keyed by database URL, so every session shares one engine
+# (and its connection pool) instead of creating a new engine per call
+_session_factories: Dict[str, sessionmaker] = {}
+
 
 class SourcedContentModel(Base):
     """
@@ -111,6 +121,7 @@ class SourceConfigModel(Base):
     total_items_fetched = Column(Integer, default=0, nullable=False)
     last_fetch_count = Column(Integer, default=0, nullable=False)
     last_error = Column(Text, nullable=True)
+    fail_count = Column(Integer, default=0, server_default='0', nullable=False)  # Consecutive failed fetches
     
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -180,9 +191,20 @@ def create_database(db_url: str = None):
     
     engine = create_engine(db_url, echo=False)
     Base.metadata.create_all(engine)
+    _add_missing_columns(engine)
     return engine
 
 
+def _add_missing_columns(engine):
+    """Add columns introduced after a database was created (create_all skips existing tables)."""
+    existing = {col['name'] for col in inspect(engine).get_columns(SourceConfigModel.__tablename__)}
+    if 'fail_count' not in existing:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE source_configs ADD COLUMN fail_count INTEGER NOT NULL DEFAULT 0"
+            ))
+
+
 def get_session(db_url: str = None):
     """
     Get a database session.
@@ -196,8 +218,15 @@ def get_session(db_url: str = None):
     if db_url is None:
         db_url = get_database_url()
     
-    engine = create_engine(db_url, echo=False)
-    Session = sessionmaker(bind=engine)
+    Session = _session_factories.get(db_url)
+    if Session is None:
+        engine = create_engine(
+            db_url,
+            echo=False,
+            pool_pre_ping=True,
+            insertmanyvalues_page_size=INSERT_PAGE_SIZE,
+        )
+        Session = _session_factories[db_url] = sessionmaker(bind=engine)
     return Session()
 
 
@@ -217,9 +246,10 @@ def compute_content_hash(content: str, url: str = None) -> str:
     # Normalize content (remove extra whitespace)
     normalized_content = " ".join(content.split())
     
-    # Create hash from content + URL
-    hash_input = normalized_content
+    # Hash content + URL incrementally (no concatenated copy of the content)
+    digest = hashlib.sha256()
+    digest.update(normalized_content.encode('utf-8'))
     if url:
-        hash_input += f"|{url}"
+        digest.update(f"|{url}".encode('utf-8'))
     
-    return hashlib.sha256(hash_input.encode('utf-8')).hexdigest()
+    return digest.hexdigest()
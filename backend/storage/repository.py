@@ -7,10 +7,13 @@ Provides high-level interface for storing and retrieving content with:
 - Batch operations
 """
 
-from typing import List, Optional, Dict, Any
+import time
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Dict, Any
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import and_, or_, desc, func
+from sqlalchemy.exc import IntegrityError
 
 from .models import (
     SourcedContentModel,
@@ -18,8 +21,36 @@ from .models import (
     compute_content_hash,
     get_session,
 )
+from .bloom import ContentHashBloom
 from sourcers.base import SourcedContent
 
+# Keeps IN (...) lookups below SQLite's bound-parameter limit
+HASH_QUERY_CHUNK_SIZE = 500
+
+# Columns the keyword pipeline reads from sourced content
+PROCESSING_COLUMNS = (
+    SourcedContentModel.id,
+    SourcedContentModel.title,
+    SourcedContentModel.content,
+    SourcedContentModel.source_type,
+    SourcedContentModel.source_name,
+    SourcedContentModel.published_date,
+)
+
+# Longest delay between retries of a failing source
+MAX_BACKOFF = timedelta(hours=24)
+
+# Bloom filters of stored content hashes, one per database URL (shared by all
+# repositories in the process and warm-loaded from the table on first use)
+_hash_blooms: Dict[str, ContentHashBloom] = {}
+
+# Seconds get_statistics() results are reused for (writes through the
+# repository drop the cached entry immediately)
+STATS_CACHE_TTL = 30
+
+# Cached get_statistics() results: database URL -> (computed_at, stats)
+_stats_cache: Dict[str, tuple] = {}
+
 
 class ContentRepository:
     """Repository for managing sourced content in the database."""
@@ -33,6 +64,22 @@ class ContentRepository:
         """
         self.session = session or get_session()
 
+    def _get_hash_bloom(self) -> ContentHashBloom:
+        """Get the process-wide Bloom filter for this database, loading it on first use."""
+        db_url = str(self.session.get_bind().url)
+        bloom = _hash_blooms.get(db_url)
+        if bloom is None:
+            bloom = ContentHashBloom()
+            bloom.update(
+                row[0] for row in self.session.query(SourcedContentModel.content_hash).yield_per(10_000)
+            )
+            _hash_blooms[db_url] = bloom
+        return bloom
+
+    def invalidate_statistics(self):
+        """Drop cached get_statistics() results after the content table changed."""
+        _stats_cache.pop(str(self.session.get_bind().url), None)
+
     def save_content(
         self,
         content: SourcedContent,
@@ -83,6 +130,11 @@ class ContentRepository:
         
         self.session.add(db_content)
         self.session.commit()
+        self.invalidate_statistics()
+        
+        bloom = _hash_blooms.get(str(self.session.get_bind().url))
+        if bloom is not None:
+            bloom.add(content_hash)
         
         return db_content, True
 
@@ -92,39 +144,107 @@ class ContentRepository:
         source_type: str,
         source_name: str,
         source_url: str,
+        content_hashes: Optional[List[str]] = None,
     ) -> Dict[str, int]:
         """
         Save multiple contents efficiently.
         
+        Existing hashes are looked up with one query and all new rows are
+        written in a single transaction.
+        
         Args:
             contents: List of SourcedContent objects
             source_type: Type of source
             source_name: Name of the source
             source_url: Original source URL
+            content_hashes: Precomputed compute_content_hash() values, in the
+                same order as contents (computed here if not given)
         
         Returns:
             Dict with statistics: {'saved': int, 'duplicates': int, 'total': int}
         """
-        saved = 0
-        duplicates = 0
+        if content_hashes is None:
+            content_hashes = [compute_content_hash(content.content, content.url) for content in contents]
+        hashed = list(zip(content_hashes, contents))
+        
+        bloom = self._get_hash_bloom()
+        
+        # Only hashes the Bloom filter may have seen need a database lookup;
+        # the rest are definitely new
+        existing_hashes = set()
+        all_hashes = list({content_hash for content_hash, _ in hashed if content_hash in bloom})
+        for i in range(0, len(all_hashes), HASH_QUERY_CHUNK_SIZE):
+            chunk = all_hashes[i:i + HASH_QUERY_CHUNK_SIZE]
+            existing_hashes.update(
+                row[0] for row in self.session.query(SourcedContentModel.content_hash).filter(
+                    SourcedContentModel.content_hash.in_(chunk)
+                )
+            )
         
-        for content in contents:
-            _, is_new = self.save_content(content, source_type, source_name, source_url)
-            if is_new:
-                saved += 1
-            else:
-                duplicates += 1
+        new_records = []
+        for content_hash, content in hashed:
+            if content_hash in existing_hashes:
+                continue
+            existing_hashes.add(content_hash)  # Also dedupes within the batch
+            new_records.append(SourcedContentModel(
+                content_hash=content_hash,
+                title=content.title,
+                content=content.content,
+                url=content.url,
+                source_type=source_type,
+                source_name=source_name,
+                source_url=source_url,
+                author=content.author,
+                published_date=content.published_date,
+                retrieved_at=content.retrieved_at,
+                extra_metadata=content.metadata,
+                processed=False,
+                processing_status='pending',
+            ))
+        
+        if new_records:
+            try:
+                self.session.add_all(new_records)
+                self.session.commit()
+                self.invalidate_statistics()
+                bloom.update(record.content_hash for record in new_records)
+            except IntegrityError:
+                # Another writer inserted some of these meanwhile; fall back to per-item saves
+                self.session.rollback()
+                saved = 0
+                for content in contents:
+                    _, is_new = self.save_content(content, source_type, source_name, source_url)
+                    saved += int(is_new)
+                return {
+                    'saved': saved,
+                    'duplicates': len(contents) - saved,
+                    'total': len(contents),
+                }
         
         return {
-            'saved': saved,
-            'duplicates': duplicates,
+            'saved': len(new_records),
+            'duplicates': len(contents) - len(new_records),
             'total': len(contents),
         }
 
+    def _content_query(self, for_processing: bool = False):
+        """
+        Base content query.
+        
+        With for_processing, only the columns the keyword pipeline reads are
+        loaded (metadata JSON, URLs and bookkeeping columns are skipped).
+        Other attributes still load on access, one query per row.
+        """
+        query = self.session.query(SourcedContentModel)
+        if for_processing:
+            query = query.options(load_only(*PROCESSING_COLUMNS))
+        return query
+
     def get_unprocessed_content(
         self,
         limit: int = 100,
         source_type: str = None,
+        for_processing: bool = False,
     ) -> List[SourcedContentModel]:
         """
         Get content that hasn't been processed yet.
@@ -132,11 +252,12 @@ class ContentRepository:
         Args:
             limit: Maximum number of items to return
             source_type: Filter by source type (optional)
+            for_processing: Only load the columns keyword processing uses
         
         Returns:
             List of unprocessed content
         """
-        query = self.session.query(SourcedContentModel).filter(
+        query = self._content_query(for_processing).filter(
             SourcedContentModel.processed == False
         )
         
@@ -145,11 +266,58 @@ class ContentRepository:
         
         return query.order_by(SourcedContentModel.published_date.desc()).limit(limit).all()
 
+    def iter_content_batches(
+        self,
+        batch_size: int = 256,
+        unprocessed_only: bool = False,
+        source_type: str = None,
+        for_processing: bool = False,
+        source_names: Optional[Iterable[str]] = None,
+    ) -> Iterator[List[SourcedContentModel]]:
+        """
+        Stream content in fixed-size batches instead of loading the whole table.
+        
+        Rows are fetched with yield_per, and each batch is expunged from the
+        session once the caller moves on to the next one, so memory stays
+        bounded by batch_size however large the table grows. Deferred
+        attributes can't be loaded on a batch after that point.
+        
+        Args:
+            batch_size: Rows per batch
+            unprocessed_only: Only yield content that hasn't been processed
+            source_type: Filter by source type (optional)
+            for_processing: Only load the columns keyword processing uses
+            source_names: Only yield content from these sources (optional)
+        
+        Yields:
+            Lists of up to batch_size content rows, in id order
+        """
+        query = self._content_query(for_processing)
+        
+        if unprocessed_only:
+            query = query.filter(SourcedContentModel.processed == False)
+        
+        if source_type:
+            query = query.filter(SourcedContentModel.source_type == source_type)
+        
+        if source_names is not None:
+            query = query.filter(SourcedContentModel.source_name.in_(list(source_names)))
+        
+        rows = iter(query.order_by(SourcedContentModel.id).yield_per(batch_size))
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            yield batch
+            for row in batch:
+                self.session.expunge(row)
+
     def get_content_by_date_range(
         self,
         start_date: datetime,
         end_date: datetime = None,
         source_type: str = None,
+        for_processing: bool = False,
     ) -> List[SourcedContentModel]:
         """
         Get content within a date range.
@@ -158,6 +326,7 @@ class ContentRepository:
             start_date: Start date (inclusive)
             end_date: End date (inclusive), defaults to now
             source_type: Filter by source type (optional)
+            for_processing: Only load the columns keyword processing uses
         
         Returns:
             List of content within date range
@@ -165,7 +334,44 @@ class ContentRepository:
         if end_date is None:
             end_date = datetime.now()
         
-        query = self.session.query(SourcedContentModel).filter(
+        query = self._content_query(for_processing).filter(
+            and_(
+                SourcedContentModel.published_date >= start_date,
+                SourcedContentModel.published_date <= end_date,
+            )
+        )
+        
+        if source_type:
+            query = query.filter(SourcedContentModel.source_type == source_type)
+        
+        return query.order_by(desc(SourcedContentModel.published_date)).all()
+
+    def get_content_rows_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime = None,
+        source_type: str = None,
+    ) -> List[Any]:
+        """
+        Get the processing columns of content within a date range.
+        
+        Like get_content_by_date_range(for_processing=True), but selects the
+        columns directly and returns lightweight Row tuples instead of ORM
+        instances, so nothing is hydrated or tracked by the session.
+        
+        Args:
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive), defaults to now
+            source_type: Filter by source type (optional)
+        
+        Returns:
+            Rows with id, title, content, source_type, source_name and
+            published_date attributes, newest first
+        """
+        if end_date is None:
+            end_date = datetime.now()
+        
+        query = self.session.query(*PROCESSING_COLUMNS).filter(
             and_(
                 SourcedContentModel.published_date >= start_date,
                 SourcedContentModel.published_date <= end_date,
@@ -177,6 +383,48 @@ class ContentRepository:
         
         return query.order_by(desc(SourcedContentModel.published_date)).all()
 
+    def get_content_by_sources(
+        self,
+        source_names: List[str],
+        start_date: datetime,
+        end_date: datetime = None,
+        for_processing: bool = False,
+    ) -> List[SourcedContentModel]:
+        """
+        Get content in a date range whose source name contains any of the given names.
+        
+        Matching is case-insensitive substring matching (so "techcrunch" matches
+        "TechCrunch AI"), done in SQL rather than over every row in Python.
+        
+        Args:
+            source_names: Source names (or name fragments) to match
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive), defaults to now
+            for_processing: Only load the columns keyword processing uses
+        
+        Returns:
+            Matching content, newest first
+        """
+        if not source_names:
+            return []
+        
+        if end_date is None:
+            end_date = datetime.now()
+        
+        source_name = func.lower(SourcedContentModel.source_name)
+        query = self._content_query(for_processing).filter(
+            and_(
+                SourcedContentModel.published_date >= start_date,
+                SourcedContentModel.published_date <= end_date,
+                or_(*[
+                    source_name.contains(name.lower(), autoescape=True)
+                    for name in set(source_names)
+                ]),
+            )
+        )
+        
+        return query.order_by(desc(SourcedContentModel.published_date)).all()
+
     def mark_as_processed(self, content_id: int, status: str = 'completed'):
         """
         Mark content as processed.
@@ -190,6 +438,69 @@ class ContentRepository:
             content.processed = True
             content.processing_status = status
             self.session.commit()
+            self.invalidate_statistics()
+
+    def mark_many_as_processed(self, content_ids: Iterable[int], status: str = 'completed') -> int:
+        """
+        Mark several contents as processed in one transaction.
+        
+        Uses bulk UPDATE ... WHERE id IN (...) statements, chunked to stay
+        under SQLite's bound-parameter limit.
+        
+        Args:
+            content_ids: IDs of content to mark (duplicates are ignored)
+            status: Processing status ('completed', 'failed', etc.)
+        
+        Returns:
+            Number of rows updated
+        """
+        ids = list(set(content_ids))
+        if not ids:
+            return 0
+        
+        updated = 0
+        for i in range(0, len(ids), HASH_QUERY_CHUNK_SIZE):
+            chunk = ids[i:i + HASH_QUERY_CHUNK_SIZE]
+            updated += self.session.query(SourcedContentModel).filter(
+                SourcedContentModel.id.in_(chunk)
+            ).update(
+                {'processed': True, 'processing_status': status},
+                synchronize_session=False
+            )
+        
+        self.session.commit()
+        self.invalidate_statistics()
+        return updated
+
+    def get_urls(
+        self,
+        source_types: Optional[Iterable[str]] = None,
+        published_since: Optional[datetime] = None,
+    ) -> set:
+        """
+        Get the URLs of stored content.
+        
+        Only the url column is read, streamed with yield_per.
+        
+        Args:
+            source_types: Only include these source types (optional)
+            published_since: Only include content published at or after this
+                time (optional; bounds the set for long-lived tables)
+        
+        Returns:
+            Set of content URLs
+        """
+        query = self.session.query(SourcedContentModel.url).filter(
+            SourcedContentModel.url.isnot(None)
+        )
+        
+        if source_types is not None:
+            query = query.filter(SourcedContentModel.source_type.in_(list(source_types)))
+        
+        if published_since is not None:
+            query = query.filter(SourcedContentModel.published_date >= published_since)
+        
+        return {row[0] for row in query.yield_per(10_000)}
 
     def get_content_by_id(self, content_id: int) -> Optional[SourcedContentModel]:
         """
@@ -203,37 +514,41 @@ class ContentRepository:
         """
         return self.session.query(SourcedContentModel).get(content_id)
 
-    def get_statistics(self) -> Dict[str, Any]:
+    def get_statistics(self, max_age: float = STATS_CACHE_TTL) -> Dict[str, Any]:
         """
         Get database statistics.
         
+        Results are cached per database for up to max_age seconds, and
+        dropped as soon as content is saved or marked processed.
+        
+        Args:
+            max_age: Oldest cached result to accept, in seconds (0 to always query)
+        
         Returns:
             Dictionary with statistics about stored content
         """
-        from sqlalchemy import func
-        
-        total_content = self.session.query(SourcedContentModel).count()
-        
-        # Count processed/unprocessed
-        processed = self.session.query(SourcedContentModel).filter(
-            SourcedContentModel.processing_status == 'completed'
-        ).count()
-        
-        # Count unique sources
-        unique_sources = self.session.query(
-            func.count(func.distinct(SourcedContentModel.source_name))
-        ).scalar()
+        from sqlalchemy import case
+        
+        db_url = str(self.session.get_bind().url)
+        cached = _stats_cache.get(db_url)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return dict(cached[1])
+        
+        # Totals, processed count, unique sources and date range in one scan
+        total_content, processed, unique_sources, oldest, newest = self.session.query(
+            func.count(SourcedContentModel.id),
+            func.coalesce(func.sum(case(
+                (SourcedContentModel.processing_status == 'completed', 1),
+                else_=0
+            )), 0),
+            func.count(func.distinct(SourcedContentModel.source_name)),
+            func.min(SourcedContentModel.published_date),
+            func.max(SourcedContentModel.published_date),
+        ).one()
         
         # Get date range
         date_range = None
         if total_content > 0:
-            oldest = self.session.query(
-                func.min(SourcedContentModel.published_date)
-            ).scalar()
-            newest = self.session.query(
-                func.max(SourcedContentModel.published_date)
-            ).scalar()
-            
             if oldest and newest:
                 days_span = (newest - oldest).days + 1
                 date_range = {
@@ -252,7 +567,7 @@ class ContentRepository:
         for source_type, count in results:
             by_source_type[source_type] = count
         
-        return {
+        stats = {
             'total_documents': total_content,
             'unique_sources': unique_sources,
             'processed': processed,
@@ -260,6 +575,8 @@ class ContentRepository:
             'date_range': date_range,
             'by_source_type': by_source_type,
         }
+        _stats_cache[db_url] = (time.monotonic(), stats)
+        return dict(stats)
 
     def close(self):
         """Close database session."""
@@ -276,7 +593,13 @@ class SourceConfigRepository:
         Args:
             session: SQLAlchemy session (will create one if not provided)
         """
-        self.session = session or get_session()
+        if session is None:
+            session = get_session()
+            # Keep loaded sources usable after each update_fetch_status commit;
+            # otherwise every attribute access re-SELECTs its row (N+1 per cycle).
+            # Callers that need fresh rows call session.expire_all() explicitly.
+            session.expire_on_commit = False
+        self.session = session
 
     def add_source(
         self,
@@ -352,26 +675,39 @@ class SourceConfigRepository:
         source_id: int,
         items_fetched: int,
         error: str = None,
+        min_interval_minutes: Optional[int] = None,
     ):
         """
         Update source fetch status.
         
+        Failed fetches back off exponentially: the next attempt is scheduled
+        fetch_interval * 2^fail_count later (capped at MAX_BACKOFF), and a
+        successful fetch resets the schedule to the normal interval.
+        
         Args:
             source_id: Source configuration ID
             items_fetched: Number of items fetched
             error: Error message if fetch failed
+            min_interval_minutes: Polling interval requested by the source itself
+                (e.g. RSS <ttl>); used when longer than fetch_interval_minutes
         """
         source = self.session.query(SourceConfigModel).get(source_id)
         if source:
             source.last_fetched_at = datetime.now()
             source.last_fetch_count = items_fetched
             source.total_items_fetched += items_fetched
-            source.next_fetch_at = datetime.now() + timedelta(minutes=source.fetch_interval_minutes)
+            interval = timedelta(minutes=max(source.fetch_interval_minutes, min_interval_minutes or 0))
             
             if error:
                 source.last_error = error
+                source.fail_count = (source.fail_count or 0) + 1
+                backoff = interval * (2 ** min(source.fail_count, 10))
+                interval = max(interval, min(backoff, MAX_BACKOFF))
             else:
                 source.last_error = None
+                source.fail_count = 0
+            
+            source.next_fetch_at = datetime.now() + interval
             
             self.session.commit()
 
@@ -12,6 +12,7 @@ from .repository import (
     TeamRepository,
     get_team_config,
 )
+from .source_matching import TeamSourceMatcher
 
 __all__ = [
     'InternalTeamModel',
@@ -20,4 +21,5 @@ __all__ = [
     'get_team_session',
     'TeamRepository',
     'get_team_config',
+    'TeamSourceMatcher',
 ]
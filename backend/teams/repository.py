@@ -7,8 +7,8 @@ after they've been loaded from config.json.
 
 from typing import List, Optional
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, case, func
+from sqlalchemy.orm import sessionmaker, Session, joinedload
 from pathlib import Path
 
 from teams.models import InternalTeamModel, TeamSourceModel
@@ -45,17 +45,15 @@ class TeamRepository:
         """
         session = self._get_session()
         try:
-            query = session.query(InternalTeamModel)
+            # Eagerly load sources in the same query (one JOIN instead of a
+            # query per team) so they're available once the session closes
+            query = session.query(InternalTeamModel).options(
+                joinedload(InternalTeamModel.sources)
+            )
             if active_only:
                 query = query.filter_by(is_active=True)
             
-            # Eagerly load sources to avoid detached instance errors
-            teams = query.all()
-            for team in teams:
-                # Force load sources while session is active
-                _ = team.sources
-            
-            return teams
+            return query.all()
         finally:
             session.close()
     
@@ -251,14 +249,16 @@ class TeamRepository:
         """
         session = self._get_session()
         try:
-            total_teams = session.query(InternalTeamModel).count()
-            active_teams = session.query(InternalTeamModel).filter_by(
-                is_active=True
-            ).count()
-            total_sources = session.query(TeamSourceModel).count()
-            enabled_sources = session.query(TeamSourceModel).filter_by(
-                is_enabled=True
-            ).count()
+            # One COUNT over the primary key per table (Query.count() wraps
+            # the whole row query in a subquery)
+            total_teams, active_teams = session.query(
+                func.count(InternalTeamModel.id),
+                func.coalesce(func.sum(case((InternalTeamModel.is_active == True, 1), else_=0)), 0),
+            ).one()
+            total_sources, enabled_sources = session.query(
+                func.count(TeamSourceModel.id),
+                func.coalesce(func.sum(case((TeamSourceModel.is_enabled == True, 1), else_=0)), 0),
+            ).one()
             
             return {
                 "total_teams": total_teams,
@@ -0,0 +1,48 @@
+"""
+Matching of content source names to the teams that monitor them.
+"""
+
+from typing import Dict, FrozenSet, Iterable, Optional
+
+
+class TeamSourceMatcher:
+    """
+    Classify content by the teams whose configured sources it came from.
+    
+    A team matches a document when one of the team's source names is a
+    case-insensitive substring of the document's source_name. Results are
+    memoized per distinct source name, so classifying N documents costs N
+    dict lookups plus one scan of the configured names per distinct source
+    (a data lake has a few dozen sources, not thousands).
+    """
+
+    def __init__(self, team_sources: Dict[str, Iterable[str]]):
+        """
+        Initialize matcher.
+        
+        Args:
+            team_sources: Mapping of team_key -> configured source names
+        """
+        self._patterns = [
+            (source_name.lower(), team_key)
+            for team_key, source_names in team_sources.items()
+            for source_name in source_names
+        ]
+        self._cache: Dict[str, FrozenSet[str]] = {}
+
+    def teams_for(self, source_name: Optional[str]) -> FrozenSet[str]:
+        """
+        Get the keys of every team monitoring a source.
+        
+        Args:
+            source_name: Source name stored on the content
+        
+        Returns:
+            Frozen set of matching team keys (empty if none)
+        """
+        key = (source_name or '').lower()
+        teams = self._cache.get(key)
+        if teams is None:
+            teams = frozenset(team_key for pattern, team_key in self._patterns if pattern in key)
+            self._cache[key] = teams
+        return teams